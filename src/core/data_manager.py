@@ -2,15 +2,74 @@
 Data Manager - Charge et gère toutes les données JSON du jeu
 """
 
+import hashlib
 import json
+import marshal
+import os
+import pickle
+import sys
+import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from src.utils.profiler import profiler
+
+# Tables chargées au démarrage: attribut -> fichier
+TABLE_FILES = {
+    "stats": "stats.json",
+    "tiers": "tiers.json",
+    "rarities": "rarities.json",
+    "qualities": "qualities.json",
+    "resources": "resources.json",
+    "nodes": "nodes.json",
+    "items_base": "items_base.json",
+    "affixes": "affixes.json",
+    "sets": "sets.json",
+    "stations": "stations.json",
+    "recipes": "recipes.json",
+    "enemies": "enemies.json",
+    "zones": "zones.json",
+    "skills": "skills.json",
+    "station_upgrades": "station_upgrades.json",
+}
+
+# Tables rarement utilisées: chargées au premier accès
+LAZY_TABLE_FILES = {
+    "collectibles": "collectibles.json",
+    "lore": "lore.json",
+    "schemas": "schemas.json",
+}
+
+# Dictionnaires construits au chargement, conservés dans le cache
+LOOKUP_ATTRS = (
+    "_stats_by_id", "_tiers_by_id", "_rarities_by_id", "_qualities_by_id",
+    "_resources_by_id", "_items_base_by_id", "_affixes_by_id", "_enemies_by_id",
+    "_zones_by_id", "_stations_by_id", "_recipes_by_id",
+    "_affixes_by_tag_tier", "_affix_position", "_tier_numbers",
+    "_items_base_by_tier", "_items_base_by_slot", "_items_base_by_slot_tier",
+    "_recipe_indices_by_station", "_recipes_by_output",
+    "_nodes_by_resource", "_nodes_by_zone", "_zone_nodes",
+    "_enemies_by_zone", "_enemies_by_tier", "_zone_positions",
+    "_skills_by_id", "_station_upgrades_by_station",
+)
+
+# Méthodes qui construisent LOOKUP_ATTRS: leur bytecode fait partie de la clé du
+# cache, modifier un index invalide donc le cache sans intervention
+BUILDER_METHODS = ("_build_lookup_dicts", "_build_secondary_indexes", "_build_affix_index",
+                   "_group_by", "_parse_tier")
+
+# À incrémenter si le contenu du cache change sans passer par BUILDER_METHODS
+# (nouvelle table, objets stockés d'un autre type...)
+CACHE_FORMAT = 1
 
 class DataManager:
     """Gère le chargement et l'accès à toutes les données de configuration du jeu"""
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.data_path = Path("info")
+        self.cache_file = Path(".cache") / "data_tables.pickle"
+        self.use_cache = use_cache
+        self.load_ms: float = 0.0
+        self.loaded_from_cache: bool = False
         self.stats: List[Dict] = []
         self.tiers: List[Dict] = []
         self.rarities: List[Dict] = []
@@ -24,8 +83,7 @@ class DataManager:
         self.recipes: List[Dict] = []
         self.enemies: List[Dict] = []
         self.zones: List[Dict] = []
-        self.collectibles: Dict = {}
-        self.lore: Dict = {}
+        self._lazy_tables: Dict[str, Any] = {}
         self.skills: List[Dict] = []
         self.station_upgrades: List[Dict] = []
 
@@ -42,45 +100,144 @@ class DataManager:
         self._stations_by_id: Dict[str, Dict] = {}
         self._recipes_by_id: Dict[str, Dict] = {}
 
+        # Index des affixes: tag -> numéro de tier -> affixes autorisés (ordre du fichier)
+        self._affixes_by_tag_tier: Dict[str, Dict[int, Tuple[Dict, ...]]] = {}
+        self._affix_position: Dict[str, int] = {}
+        self._affix_query_cache: Dict[Tuple[Tuple[str, ...], int], Tuple[Dict, ...]] = {}
+        self._tier_numbers: Dict[str, int] = {}
+
+        # Index secondaires (tuples dans l'ordre des fichiers)
+        self._items_base_by_tier: Dict[str, Tuple[Dict, ...]] = {}
+        self._items_base_by_slot: Dict[str, Tuple[Dict, ...]] = {}
+        self._items_base_by_slot_tier: Dict[Tuple[str, str], Tuple[Dict, ...]] = {}
+        self._recipe_indices_by_station: Dict[str, Tuple[int, ...]] = {}  # Positions dans self.recipes
+        self._recipes_by_output: Dict[str, Tuple[Dict, ...]] = {}
+        self._nodes_by_resource: Dict[str, Tuple[Dict, ...]] = {}
+        self._nodes_by_zone: Dict[str, Tuple[Dict, ...]] = {}
+        self._zone_nodes: Dict[str, Tuple[Dict, ...]] = {}  # Nodes récoltables dans une zone
+        self._enemies_by_zone: Dict[str, Tuple[Dict, ...]] = {}
+        self._enemies_by_tier: Dict[str, Tuple[Dict, ...]] = {}
+        self._zone_positions: Dict[str, int] = {}
+        self._skills_by_id: Dict[str, Dict] = {}
+        self._station_upgrades_by_station: Dict[str, Dict] = {}
+
     def load_all(self):
-        """Charge tous les fichiers JSON"""
+        """Charge tous les fichiers JSON (ou le cache s'il correspond encore aux fichiers)"""
         print("Chargement des données du jeu...")
+        start = time.perf_counter()
 
-        self.stats = self._load_json("stats.json")
-        self.tiers = self._load_json("tiers.json")
-        self.rarities = self._load_json("rarities.json")
-        self.qualities = self._load_json("qualities.json")
-        self.resources = self._load_json("resources.json")
-        self.nodes = self._load_json("nodes.json")
-        self.items_base = self._load_json("items_base.json")
-        self.affixes = self._load_json("affixes.json")
-        self.sets = self._load_json("sets.json")
-        self.stations = self._load_json("stations.json")
-        self.recipes = self._load_json("recipes.json")
-        self.enemies = self._load_json("enemies.json")
-        self.zones = self._load_json("zones.json")
-        self.collectibles = self._load_json("collectibles.json")
-        self.lore = self._load_json("lore.json")
-        self.skills = self._load_json("skills.json")
-        self.station_upgrades = self._load_json("station_upgrades.json")
-
-        # Construction des dictionnaires d'accès rapide
-        self._build_lookup_dicts()
-
-        print("Données chargées avec succès!")
+        cache_key = self._cache_key()
+        with profiler.span("load.cache"):
+            self.loaded_from_cache = self.use_cache and self._load_cache(cache_key)
+        if not self.loaded_from_cache:
+            for attr, filename in TABLE_FILES.items():
+                with profiler.span(f"load.{filename}"):
+                    setattr(self, attr, self._load_json(filename))
+
+            # Construction des dictionnaires d'accès rapide
+            with profiler.span("load.indexes"):
+                self._build_lookup_dicts()
+
+            if self.use_cache:
+                with profiler.span("load.write_cache"):
+                    self._write_cache(cache_key)
+
+        self._affix_query_cache = {}
+        self._lazy_tables = {}
+        self.load_ms = (time.perf_counter() - start) * 1000.0
+        profiler.record("load.all", self.load_ms)
+
+        source = "cache" if self.loaded_from_cache else "JSON"
+        print(f"Données chargées avec succès! ({source}, {self.load_ms:.1f} ms)")
 
     def _load_json(self, filename: str) -> Any:
         """Charge un fichier JSON depuis le dossier info/"""
         file_path = self.data_path / filename
+        empty = {} if filename in LAZY_TABLE_FILES.values() else []
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
             print(f"ATTENTION: Fichier {filename} non trouvé!")
-            return [] if filename != "lore.json" and filename != "collectibles.json" else {}
+            return empty
         except json.JSONDecodeError as e:
             print(f"ERREUR: Impossible de parser {filename}: {e}")
-            return [] if filename != "lore.json" and filename != "collectibles.json" else {}
+            return empty
+
+    # Tables chargées à la demande
+    @property
+    def collectibles(self) -> Dict:
+        return self._get_lazy_table("collectibles")
+
+    @property
+    def lore(self) -> Dict:
+        return self._get_lazy_table("lore")
+
+    @property
+    def schemas(self) -> Dict:
+        return self._get_lazy_table("schemas")
+
+    def _get_lazy_table(self, name: str) -> Any:
+        """Charge une table rarement utilisée au premier accès"""
+        table = self._lazy_tables.get(name)
+        if table is None:
+            with profiler.span(f"load.{LAZY_TABLE_FILES[name]}"):
+                table = self._load_json(LAZY_TABLE_FILES[name])
+            self._lazy_tables[name] = table
+        return table
+
+    # Cache binaire des tables construites
+    def _cache_key(self) -> Optional[Tuple]:
+        """Signature des fichiers sources (taille et mtime), de la structure du cache et du code des index"""
+        files = []
+        for filename in TABLE_FILES.values():
+            try:
+                stat = (self.data_path / filename).stat()
+            except OSError:
+                return None  # Fichier manquant: pas de cache, le chargement JSON le signale
+            files.append((filename, stat.st_size, stat.st_mtime_ns))
+        return (CACHE_FORMAT, sys.version_info[:2], tuple(TABLE_FILES), LOOKUP_ATTRS,
+                self._builder_hash(), tuple(files))
+
+    @staticmethod
+    def _builder_hash() -> str:
+        """Empreinte du bytecode des méthodes de construction des index (lambdas comprises)"""
+        digest = hashlib.sha1()
+        for name in BUILDER_METHODS:
+            func = getattr(DataManager, name)
+            digest.update(marshal.dumps(func.__code__))
+        return digest.hexdigest()
+
+    def _load_cache(self, cache_key: Optional[Tuple]) -> bool:
+        """Restaure tables et index depuis le cache; False s'il est absent ou périmé"""
+        if cache_key is None or not self.cache_file.exists():
+            return False
+        try:
+            with open(self.cache_file, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("key") != cache_key:
+                return False
+            for attr, value in cached["tables"].items():
+                setattr(self, attr, value)
+            return True
+        except Exception as e:
+            print(f"Cache de données ignoré: {e}")
+            return False
+
+    def _write_cache(self, cache_key: Optional[Tuple]):
+        """Écrit le cache (un seul pickle: les index gardent les mêmes objets que les tables)"""
+        if cache_key is None:
+            return
+        attrs = tuple(TABLE_FILES) + LOOKUP_ATTRS
+        try:
+            self.cache_file.parent.mkdir(exist_ok=True)
+            tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump({"key": cache_key, "tables": {attr: getattr(self, attr) for attr in attrs}},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            print(f"Impossible d'écrire le cache de données: {e}")
 
     def _build_lookup_dicts(self):
         """Construit les dictionnaires pour accès rapide par ID"""
@@ -96,6 +253,90 @@ class DataManager:
         self._stations_by_id = {station["id"]: station for station in self.stations}
         self._recipes_by_id = {recipe["id"]: recipe for recipe in self.recipes}
 
+        self._skills_by_id = {skill["id"]: skill for skill in self.skills}
+        self._station_upgrades_by_station = {sc["station_id"]: sc for sc in self.station_upgrades}
+        self._zone_positions = {zone["id"]: i for i, zone in enumerate(self.zones)}
+
+        self._tier_numbers = {tier["id"]: self._parse_tier(tier["id"]) for tier in self.tiers}
+        self._build_affix_index()
+        self._build_secondary_indexes()
+
+    @staticmethod
+    def _group_by(rows, key_func) -> Dict[Any, Tuple[Dict, ...]]:
+        """Regroupe des lignes par clé (ordre du fichier conservé, None ignoré)"""
+        groups: Dict[Any, List[Dict]] = {}
+        for row in rows:
+            key = key_func(row)
+            if key is not None:
+                groups.setdefault(key, []).append(row)
+        return {key: tuple(group) for key, group in groups.items()}
+
+    def _build_secondary_indexes(self):
+        """Index par tier/slot/station/ressource/zone utilisés par les systèmes"""
+        self._items_base_by_tier = self._group_by(self.items_base, lambda item: item.get("tier"))
+        self._items_base_by_slot = self._group_by(self.items_base, lambda item: item.get("slot"))
+        self._items_base_by_slot_tier = self._group_by(
+            self.items_base, lambda item: (item.get("slot"), item.get("tier")))
+
+        # Recettes sans station: clé "" (toujours visibles)
+        indices_by_station: Dict[str, List[int]] = {}
+        for i, recipe in enumerate(self.recipes):
+            indices_by_station.setdefault(recipe.get("station") or "", []).append(i)
+        self._recipe_indices_by_station = {station: tuple(indices)
+                                           for station, indices in indices_by_station.items()}
+
+        by_output: Dict[str, List[Dict]] = {}
+        for recipe in self.recipes:
+            for output in recipe.get("outputs", []):
+                output_id = output.get("item_base") or output.get("resource")
+                if output_id:
+                    by_output.setdefault(output_id, []).append(recipe)
+        self._recipes_by_output = {output_id: tuple(recipes) for output_id, recipes in by_output.items()}
+
+        self._nodes_by_resource = self._group_by(self.nodes, lambda node: node.get("resource"))
+        self._nodes_by_zone = self._group_by(self.nodes, lambda node: node.get("zone"))
+        self._enemies_by_tier = self._group_by(self.enemies, lambda enemy: enemy.get("tier"))
+
+        self._zone_nodes = {}
+        self._enemies_by_zone = {}
+        for zone in self.zones:
+            # Nodes dont la ressource est listée par la zone, au tier de la zone
+            zone_resources = set(zone.get("resources", []))
+            self._zone_nodes[zone["id"]] = tuple(
+                node for node in self.nodes
+                if node.get("resource") in zone_resources and node.get("tier") == zone["tier"]
+            )
+            self._enemies_by_zone[zone["id"]] = tuple(
+                self._enemies_by_id[enemy_id] for enemy_id in zone.get("enemies", [])
+                if enemy_id in self._enemies_by_id
+            )
+
+    def _build_affix_index(self):
+        """Indexe les affixes par tag et par tier (bornes tier_min/tier_max incluses)"""
+        max_tier = max(self._tier_numbers.values(), default=10)
+        by_tag_tier: Dict[str, Dict[int, List[Dict]]] = {}
+
+        for affix in self.affixes:
+            tier_min = self._parse_tier(affix.get("tier_min", 1))
+            tier_max = self._parse_tier(affix.get("tier_max", max_tier))
+            for tag in affix.get("tags", []):
+                tiers = by_tag_tier.setdefault(tag, {})
+                for tier_num in range(tier_min, tier_max + 1):
+                    tiers.setdefault(tier_num, []).append(affix)
+
+        self._affixes_by_tag_tier = {
+            tag: {tier_num: tuple(affixes) for tier_num, affixes in tiers.items()}
+            for tag, tiers in by_tag_tier.items()
+        }
+        self._affix_position = {affix["id"]: i for i, affix in enumerate(self.affixes)}
+
+    @staticmethod
+    def _parse_tier(tier) -> int:
+        """Convertit un tier ("t3" ou 3) en numéro"""
+        if isinstance(tier, str):
+            return int(tier.replace("t", ""))
+        return int(tier)
+
     # Méthodes d'accès rapide
     def get_stat(self, stat_id: str) -> Dict:
         """Récupère une stat par son ID"""
@@ -141,20 +382,87 @@ class DataManager:
         """Récupère une recette par son ID"""
         return self._recipes_by_id.get(recipe_id, {})
 
+    def get_skill(self, skill_id: str) -> Dict:
+        """Récupère un skill par son ID"""
+        return self._skills_by_id.get(skill_id, {})
+
+    def get_station_upgrade(self, station_id: str) -> Dict:
+        """Récupère la configuration d'amélioration d'une station"""
+        return self._station_upgrades_by_station.get(station_id, {})
+
+    def get_zone_index(self, zone_id: str) -> int:
+        """Position d'une zone dans zones.json (0 si inconnue)"""
+        return self._zone_positions.get(zone_id, 0)
+
+    # Index secondaires (tuples partagés: ne pas modifier)
+    def get_items_base_by_tier(self, tier: str) -> Tuple[Dict, ...]:
+        """Items de base d'un tier"""
+        return self._items_base_by_tier.get(tier, ())
+
+    def get_items_base_by_slot(self, slot: str) -> Tuple[Dict, ...]:
+        """Items de base d'un slot"""
+        return self._items_base_by_slot.get(slot, ())
+
+    def get_items_base(self, slot: str, tier: str) -> Tuple[Dict, ...]:
+        """Items de base d'un slot et d'un tier"""
+        return self._items_base_by_slot_tier.get((slot, tier), ())
+
+    def get_recipes_by_station(self, station_id: str) -> Tuple[Dict, ...]:
+        """Recettes d'une station"""
+        return tuple(self.recipes[i] for i in self._recipe_indices_by_station.get(station_id, ()))
+
+    def get_recipes_for_stations(self, station_ids: List[str]) -> List[Dict]:
+        """Recettes des stations données (et sans station), dans l'ordre du fichier"""
+        indices = list(self._recipe_indices_by_station.get("", ()))
+        for station_id in set(station_ids):
+            indices.extend(self._recipe_indices_by_station.get(station_id, ()))
+        indices.sort()
+        return [self.recipes[i] for i in indices]
+
+    def get_recipes_by_output(self, output_id: str) -> Tuple[Dict, ...]:
+        """Recettes produisant un item de base ou une ressource"""
+        return self._recipes_by_output.get(output_id, ())
+
+    def get_nodes_by_resource(self, resource_id: str) -> Tuple[Dict, ...]:
+        """Nodes de récolte d'une ressource"""
+        return self._nodes_by_resource.get(resource_id, ())
+
+    def get_nodes_by_zone(self, zone_id: str) -> Tuple[Dict, ...]:
+        """Nodes déclarés pour une zone (champ "zone" des nodes)"""
+        return self._nodes_by_zone.get(zone_id, ())
+
+    def get_zone_nodes(self, zone_id: str) -> Tuple[Dict, ...]:
+        """Nodes récoltables dans une zone: ressources de la zone, au tier de la zone"""
+        return self._zone_nodes.get(zone_id, ())
+
+    def get_enemies_by_zone(self, zone_id: str) -> Tuple[Dict, ...]:
+        """Ennemis normaux d'une zone (hors boss)"""
+        return self._enemies_by_zone.get(zone_id, ())
+
+    def get_enemies_by_tier(self, tier: str) -> Tuple[Dict, ...]:
+        """Ennemis d'un tier"""
+        return self._enemies_by_tier.get(tier, ())
+
     def get_affixes_by_tags(self, tags: List[str], tier: str) -> List[Dict]:
         """Récupère tous les affixes correspondant aux tags et tier donnés"""
-        tier_num = int(tier.replace("t", ""))
-        result = []
+        tier_num = self.get_tier_number(tier)
+        key = (tuple(tags), tier_num)
 
-        for affix in self.affixes:
-            # Vérifie que l'affixe a au moins un tag en commun
-            if any(tag in affix.get("tags", []) for tag in tags):
-                # Vérifie que le tier min est respecté
-                if tier_num >= affix.get("tier_min", 1):
-                    result.append(affix)
+        cached = self._affix_query_cache.get(key)
+        if cached is None:
+            # Union des affixes de chaque tag, sans doublon et dans l'ordre du fichier
+            union = {}
+            for tag in tags:
+                for affix in self._affixes_by_tag_tier.get(tag, {}).get(tier_num, ()):
+                    union[affix["id"]] = affix
+            cached = tuple(sorted(union.values(), key=lambda affix: self._affix_position[affix["id"]]))
+            self._affix_query_cache[key] = cached
 
-        return result
+        return list(cached)
 
     def get_tier_number(self, tier_id: str) -> int:
         """Retourne le numéro du tier (t1 -> 1, t10 -> 10)"""
-        return int(tier_id.replace("t", ""))
+        tier_num = self._tier_numbers.get(tier_id)
+        if tier_num is None:
+            tier_num = self._parse_tier(tier_id)
+        return tier_num
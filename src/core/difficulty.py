@@ -6,8 +6,11 @@ de renforcer la sensation « hardcore mais juste » en contrôlant la montée
 coûts, la robustesse des ennemis et la cadence des ressources.
 """
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+# Coût d'une recette: (or, ((resource_id, quantité), ...))
+RecipeCost = Tuple[int, Tuple[Tuple[str, int], ...]]
 
 
 @dataclass
@@ -32,6 +35,20 @@ class DifficultySettings:
     crafting_gold_mult: float = 1.15
     crafting_resource_mult: float = 1.1
 
+    # Table des coûts de recettes, dépend des deux multiplicateurs de craft
+    _recipe_costs: Dict[str, RecipeCost] = field(default_factory=dict, init=False, repr=False, compare=False)
+    cost_version: int = field(default=0, init=False, compare=False)  # Incrémenté à chaque changement de multiplicateur
+
+    def set_crafting_multipliers(self, gold_mult: Optional[float] = None,
+                                 resource_mult: Optional[float] = None):
+        """Change les multiplicateurs de craft et vide la table des coûts"""
+        if gold_mult is not None:
+            self.crafting_gold_mult = gold_mult
+        if resource_mult is not None:
+            self.crafting_resource_mult = resource_mult
+        self._recipe_costs.clear()
+        self.cost_version += 1
+
     def level_scaling_factor(self, player_level: int, recommended_level: int) -> float:
         """Augmente la difficulté quand le joueur dépasse la zone."""
         level_gap = max(0, player_level - recommended_level)
@@ -77,16 +94,32 @@ class DifficultySettings:
         """Réduit légèrement la quantité moyenne de ressources par node."""
         return max(1, int(round(base_yield * self.gather_yield_mult)))
 
+    def recipe_cost(self, recipe: Dict) -> RecipeCost:
+        """Coûts ajustés d'une recette (calculés une fois par recette et par réglage)"""
+        cost = self._recipe_costs.get(recipe["id"])
+        if cost is None:
+            cost = self._compute_recipe_cost(recipe)
+            self._recipe_costs[recipe["id"]] = cost
+        return cost
+
+    def precompute_recipe_costs(self, recipes: Iterable[Dict]):
+        """Remplit la table des coûts pour toutes les recettes"""
+        for recipe in recipes:
+            if recipe["id"] not in self._recipe_costs:
+                self._recipe_costs[recipe["id"]] = self._compute_recipe_cost(recipe)
+
+    def _compute_recipe_cost(self, recipe: Dict) -> RecipeCost:
+        """Applique les multiplicateurs de craft aux coûts bruts d'une recette"""
+        inputs = tuple(
+            (res["resource"], int(round(res.get("qty", 0) * self.crafting_resource_mult)))
+            for res in recipe.get("inputs", [])
+        )
+        return int(round(recipe.get("gold_cost", 0) * self.crafting_gold_mult)), inputs
+
     def scaled_recipe_costs(self, recipe: Dict) -> Dict:
         """Retourne une copie des coûts de recette augmentés pour le mode hard."""
-        scaled_inputs = []
-        for res in recipe.get("inputs", []):
-            scaled_inputs.append({
-                "resource": res["resource"],
-                "qty": int(round(res.get("qty", 0) * self.crafting_resource_mult))
-            })
-
+        gold_cost, inputs = self.recipe_cost(recipe)
         return {
-            "gold_cost": int(round(recipe.get("gold_cost", 0) * self.crafting_gold_mult)),
-            "inputs": scaled_inputs
+            "gold_cost": gold_cost,
+            "inputs": [{"resource": res_id, "qty": qty} for res_id, qty in inputs]
         }
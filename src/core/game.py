@@ -2,7 +2,9 @@
 Game Core - Orchestre tous les systèmes du jeu
 """
 
+import time
 import arcade
+from pathlib import Path
 from src.core.data_manager import DataManager
 from src.entities.player import Player
 from src.systems.item_system import ItemGenerator
@@ -10,19 +12,39 @@ from src.systems.combat_system import CombatSystem
 from src.systems.gathering_system import GatheringSystem
 from src.systems.crafting_system import CraftingSystem
 from src.systems.skill_system import SkillSystem, StationUpgradeSystem
+from src.systems.offline_system import OfflineProgressSystem
 from src.utils.save_system import SaveSystem
+from src.utils.profiler import profiler
 from src.ui.game_view import GameView
 from src.core.difficulty import DifficultySettings
 
+# Fréquences de la fenêtre (secondes entre deux appels)
+UPDATE_RATE = 1 / 60
+DRAW_RATE = 1 / 60
+BACKGROUND_UPDATE_RATE = 1.0  # Fenêtre inactive ou réduite: logique regroupée une fois par seconde
+BACKGROUND_DRAW_RATE = 1 / 4  # Fenêtre inactive mais visible
+HIDDEN_DRAW_RATE = 1.0  # Fenêtre réduite (GameView ne dessine rien)
+
 class Game(arcade.Window):
     """Classe principale du jeu"""
 
     def __init__(self, width, height, title):
-        super().__init__(width, height, title)
+        start = time.perf_counter()
+
+        # Mode basse consommation (voir _apply_power_mode), avant la fenêtre qui
+        # peut déjà émettre on_show/on_activate
+        self._focused: bool = True
+        self._minimized: bool = False
+        self.low_power: bool = False
+
+        super().__init__(width, height, title, update_rate=UPDATE_RATE, draw_rate=DRAW_RATE)
+        window_ms = (time.perf_counter() - start) * 1000.0
+        profiler.record("startup.window", window_ms)
 
         # Initialisation des systèmes
         self.data_manager = DataManager()
         self.data_manager.load_all()
+        systems_start = time.perf_counter()
 
         self.difficulty = DifficultySettings()
         self.item_generator = ItemGenerator(self.data_manager)
@@ -32,30 +54,90 @@ class Game(arcade.Window):
         self.skill_system = SkillSystem(self.data_manager)
         self.station_upgrade_system = StationUpgradeSystem(self.data_manager)
         self.save_system = SaveSystem()
+        self.offline_system = OfflineProgressSystem(self.data_manager, self.item_generator, self.difficulty)
+
+        systems_ms = (time.perf_counter() - systems_start) * 1000.0
+        profiler.record("startup.systems", systems_ms)
 
         # Player
         self.player = None
 
         # Afficher le menu principal
         self.menu_view = None
-        self._show_menu()
+        with profiler.span("startup.menu"):
+            self._show_menu()
 
         arcade.set_background_color(arcade.color.BLACK)
 
+        total_ms = (time.perf_counter() - start) * 1000.0
+        profiler.record("startup.total", total_ms)
+        print(f"Démarrage: {total_ms:.0f} ms jusqu'au menu (fenêtre {window_ms:.0f} ms, "
+              f"données {self.data_manager.load_ms:.0f} ms, systèmes {systems_ms:.0f} ms)")
+
+    def on_close(self):
+        """Compacte le journal dans une sauvegarde complète avant de fermer la fenêtre"""
+        self.save_system.flush(timeout=5.0)
+        if self.player:
+            self.save_system.save_game(self.player, self.skill_system, self.station_upgrade_system)
+        if profiler.enabled:
+            profiler.dump()
+        super().on_close()
+
+    def on_activate(self):
+        self._focused = True
+        self._apply_power_mode()
+
+    def on_deactivate(self):
+        self._focused = False
+        self._apply_power_mode()
+
+    def on_hide(self):
+        self._minimized = True
+        self._apply_power_mode()
+
+    def on_show(self):
+        self._minimized = False
+        self._apply_power_mode()
+
+    def _apply_power_mode(self):
+        """Réduit update/draw quand la fenêtre est inactive ou réduite, les rétablit au retour"""
+        low_power = self._minimized or not self._focused
+        if low_power != self.low_power:
+            self.low_power = low_power
+            if low_power:
+                self.set_update_rate(BACKGROUND_UPDATE_RATE)
+            else:
+                self.set_update_rate(UPDATE_RATE)
+                self.set_draw_rate(DRAW_RATE)
+            print(f"Mode basse consommation {'activé' if low_power else 'désactivé'}")
+        if low_power:
+            self.set_draw_rate(HIDDEN_DRAW_RATE if self._minimized else BACKGROUND_DRAW_RATE)
+
+        if isinstance(self.current_view, GameView):
+            self.current_view.set_low_power(low_power, hidden=self._minimized)
+
     def _show_menu(self, message: str = ""):
         """Affiche la vue de menu principal"""
         from src.ui.menu_view import MenuView
         self.menu_view = MenuView(self, self.save_system, message)
         self.show_view(self.menu_view)
 
-    def start_new_game(self):
-        """Démarre une nouvelle partie et écrase l'ancienne sauvegarde"""
-        self.save_system.delete_save()
-        self._init_player(force_new=True)
+    def start_new_game(self, name: str = ""):
+        """Démarre une nouvelle partie dans un nouvel emplacement de sauvegarde"""
+        name = name.strip() or "Aventurier"
+        self.save_system.set_slot(self.save_system.new_slot_id(name))
+        self._init_player(force_new=True, name=name)
         self._show_game_view()
 
-    def continue_game(self):
-        """Charge la partie existante si disponible"""
+    def continue_game(self, slot: str = None):
+        """Charge une partie (la plus récente si aucun emplacement n'est donné)"""
+        if slot is None:
+            slots = self.save_system.list_slots()
+            if slots:
+                slot = slots[0]["slot"]
+        if slot is not None:
+            self.save_system.set_slot(slot)
+
         if not self.save_system.has_save():
             self._show_menu("Aucune sauvegarde trouvée")
             return
@@ -64,10 +146,12 @@ class Game(arcade.Window):
         if not self.player:
             self._show_menu("Chargement impossible, sauvegarde corrompue?")
             return
+        self._apply_offline_progress()
         self._show_game_view()
 
     def import_and_start(self, source_path: str):
-        """Importe une sauvegarde externe puis lance la partie"""
+        """Importe une sauvegarde externe dans un nouvel emplacement puis lance la partie"""
+        self.save_system.set_slot(self.save_system.new_slot_id(Path(source_path).expanduser().stem))
         success, msg = self.save_system.import_save(source_path)
         if not success:
             self._show_menu(msg)
@@ -78,7 +162,7 @@ class Game(arcade.Window):
             return
         self._show_game_view()
 
-    def _init_player(self, force_new: bool = False):
+    def _init_player(self, force_new: bool = False, name: str = "Aventurier"):
         """Initialise le joueur (charge ou crée nouveau)"""
         if not force_new:
             # Essayer de charger
@@ -94,6 +178,7 @@ class Game(arcade.Window):
             # Créer un nouveau joueur
             print("Création d'un nouveau personnage...")
             self.player = Player(self.data_manager)
+            self.player.name = name
 
             # Équipement de départ
             starter_items = self.item_generator.generate_starter_equipment()
@@ -114,6 +199,20 @@ class Game(arcade.Window):
             # Sauvegarder
             self.save_system.save_game(self.player, self.skill_system, self.station_upgrade_system)
 
+    def _apply_offline_progress(self):
+        """Rattrape le combat automatique écoulé depuis la dernière sauvegarde"""
+        elapsed = self.save_system.get_offline_seconds()
+        report = self.offline_system.apply(self.player, elapsed)
+        if report["simulated"] <= 0:
+            return
+
+        for line in OfflineProgressSystem.format_report(report):
+            print(line)
+            self.combat_system.add_log(line)
+        print(f"Progression hors-ligne calculée en {report['compute_ms']:.1f} ms")
+
+        self.save_system.save_game(self.player, self.skill_system, self.station_upgrade_system)
+
     def _show_game_view(self):
         """Instancie et affiche la vue de jeu principale"""
         game_view = GameView(
@@ -125,6 +224,8 @@ class Game(arcade.Window):
             self.crafting_system,
             self.skill_system,
             self.station_upgrade_system,
-            self.save_system
+            self.save_system,
+            offline_system=self.offline_system
         )
         self.show_view(game_view)
+        game_view.set_low_power(self.low_power, hidden=self._minimized)
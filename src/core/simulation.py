@@ -0,0 +1,201 @@
+"""
+Simulation headless - Fait tourner la boucle de jeu sans fenêtre arcade
+
+Construit les mêmes systèmes que Game.__init__ et les fait avancer à pas de
+temps fixe aussi vite que le CPU le permet. Sert de base aux benchmarks et à
+l'équilibrage (kills/s de temps simulé, or/heure) sur des machines sans écran.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, Optional
+
+from src.core.data_manager import DataManager
+from src.core.difficulty import DifficultySettings
+from src.entities.player import Player
+from src.systems.item_system import ItemGenerator
+from src.systems.combat_system import CombatSystem
+from src.systems.gathering_system import GatheringSystem
+from src.systems.crafting_system import CraftingSystem
+
+
+class Simulation:
+    """Pilote combat, récolte et buffs sans rendu, à pas de temps fixe"""
+
+    def __init__(self, player: Optional[Player] = None, data_manager: Optional[DataManager] = None,
+                 difficulty: Optional[DifficultySettings] = None, seed: Optional[int] = None,
+                 timestep: float = 1.0 / 60.0, harvest_clicks_per_sec: float = 0.0):
+        """
+        Args:
+            player: Joueur existant (sinon un nouveau personnage est créé)
+            data_manager: DataManager déjà chargé (sinon chargé ici)
+            difficulty: Réglages de difficulté (sinon valeurs par défaut)
+            seed: Graine aléatoire pour des runs reproductibles
+            timestep: Pas de temps fixe d'une itération (secondes simulées)
+            harvest_clicks_per_sec: Clics de récolte automatiques par seconde (0 = aucun)
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        # Mêmes systèmes que Game.__init__
+        if data_manager is None:
+            data_manager = DataManager()
+            data_manager.load_all()
+        self.data_manager = data_manager
+
+        self.difficulty = difficulty or DifficultySettings()
+        self.item_generator = ItemGenerator(self.data_manager)
+        self.combat_system = CombatSystem(self.data_manager, self.item_generator, self.difficulty)
+        self.gathering_system = GatheringSystem(self.data_manager, self.difficulty)
+        self.crafting_system = CraftingSystem(self.data_manager, self.item_generator, self.difficulty)
+
+        self.player = player or self._create_player()
+
+        self.timestep = timestep
+        self.harvest_clicks_per_sec = harvest_clicks_per_sec
+        self._harvest_timer: float = 0.0
+
+        # Compteurs de la simulation
+        self.sim_time: float = 0.0
+        self.wall_time: float = 0.0
+        self.kills: int = 0
+        self.deaths: int = 0
+        self.gold_earned: int = 0
+        self.xp_earned: int = 0
+        self.items_dropped: int = 0
+        self.resources_gained: Dict[str, int] = {}
+        self.start_level: int = self.player.level
+
+        self.gathering_system.spawn_nodes_for_zone(self.player.current_zone_id, 5)
+        self.combat_system.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
+
+    def _create_player(self) -> Player:
+        """Crée un nouveau personnage (même départ que Game._init_player)"""
+        player = Player(self.data_manager)
+
+        for item in self.item_generator.generate_starter_equipment():
+            equipped = player.equip_item(item)
+            if equipped:
+                player.add_item_to_inventory(equipped)
+
+        player.add_resource("bois_tendre", 3)
+        player.add_resource("pierre_brute", 3)
+        player.add_resource("fibres_sauvages", 2)
+        player.gold = 10
+        player.unlock_station("atelier")
+
+        return player
+
+    def step(self, delta_time: float):
+        """Avance la simulation d'un pas (équivalent headless de GameView.on_update)"""
+        self.gathering_system.update(delta_time)
+
+        if self.harvest_clicks_per_sec > 0:
+            self._auto_harvest(delta_time)
+
+        if not self.combat_system.combat_active:
+            self.combat_system.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
+
+        # Le combat avance aussi les buffs et respawn les ennemis vaincus
+        result = self.combat_system.update(delta_time, self.player)
+
+        if result.get("enemy_dead"):
+            self._record_rewards(result["kills"], result.get("rewards", {}))
+
+        if result.get("player_dead"):
+            self._handle_player_death()
+
+        self.sim_time += delta_time
+
+    def run(self, duration: float) -> Dict:
+        """
+        Simule `duration` secondes de jeu aussi vite que possible
+
+        Returns:
+            Le rapport de la simulation (voir get_report)
+        """
+        steps = int(duration / self.timestep)
+        start = time.perf_counter()
+
+        for _ in range(steps):
+            self.step(self.timestep)
+
+        self.wall_time += time.perf_counter() - start
+        return self.get_report()
+
+    def _auto_harvest(self, delta_time: float):
+        """Simule des clics de récolte sur le premier node disponible"""
+        self._harvest_timer += delta_time
+        click_interval = 1.0 / self.harvest_clicks_per_sec
+
+        while self._harvest_timer >= click_interval:
+            self._harvest_timer -= click_interval
+            for index, node in enumerate(self.gathering_system.active_nodes):
+                if node.depleted:
+                    continue
+                reward = self.gathering_system.harvest_node(index, self.player)
+                if reward:
+                    self.xp_earned += reward["xp"]
+                    res_id = reward["resource_id"]
+                    self.resources_gained[res_id] = self.resources_gained.get(res_id, 0) + reward["quantity"]
+                break
+
+    def _handle_player_death(self):
+        """Même pénalité que GameView._handle_player_death, puis reprise du combat"""
+        self.deaths += 1
+        self.player.base_stats.hp_current = self.player.base_stats.hp_max * 0.5
+        self.player.gold = int(self.player.gold * 0.9)
+        self.combat_system.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
+
+    def _record_rewards(self, kills: int, rewards: Dict):
+        """Cumule les récompenses des ennemis vaincus pendant un pas"""
+        self.kills += kills
+        self.xp_earned += rewards.get("xp", 0)
+        self.gold_earned += rewards.get("gold", 0)
+        self.items_dropped += len(rewards.get("items", []))
+        for res in rewards.get("resources", []):
+            self.resources_gained[res["id"]] = self.resources_gained.get(res["id"], 0) + res["quantity"]
+
+    def get_report(self) -> Dict:
+        """Retourne les métriques de débit de la simulation"""
+        sim_hours = self.sim_time / 3600.0
+        return {
+            "sim_time": self.sim_time,
+            "wall_time": self.wall_time,
+            "speedup": self.sim_time / self.wall_time if self.wall_time > 0 else 0.0,
+            "kills": self.kills,
+            "deaths": self.deaths,
+            "kills_per_sec": self.kills / self.sim_time if self.sim_time > 0 else 0.0,
+            "gold_earned": self.gold_earned,
+            "gold_per_hour": self.gold_earned / sim_hours if sim_hours > 0 else 0.0,
+            "xp_earned": self.xp_earned,
+            "xp_per_hour": self.xp_earned / sim_hours if sim_hours > 0 else 0.0,
+            "items_dropped": self.items_dropped,
+            "resources_gained": dict(self.resources_gained),
+            "levels_gained": self.player.level - self.start_level,
+            "level": self.player.level,
+        }
+
+
+def main():
+    """Point d'entrée CLI: python -m src.core.simulation --hours 1"""
+    parser = argparse.ArgumentParser(description="Simulation headless de PyClick")
+    parser.add_argument("--hours", type=float, default=1.0, help="Durée simulée en heures")
+    parser.add_argument("--seed", type=int, default=None, help="Graine aléatoire")
+    parser.add_argument("--hz", type=float, default=60.0, help="Fréquence de simulation")
+    parser.add_argument("--clicks", type=float, default=0.0, help="Clics de récolte par seconde")
+    args = parser.parse_args()
+
+    sim = Simulation(seed=args.seed, timestep=1.0 / args.hz, harvest_clicks_per_sec=args.clicks)
+    report = sim.run(args.hours * 3600.0)
+
+    print(f"Temps simulé: {report['sim_time']:.0f}s en {report['wall_time']:.2f}s (x{report['speedup']:.0f})")
+    print(f"Kills: {report['kills']} ({report['kills_per_sec']:.3f}/s) | Morts: {report['deaths']}")
+    print(f"Or: {report['gold_earned']} ({report['gold_per_hour']:.0f}/h) | "
+          f"XP: {report['xp_earned']} ({report['xp_per_hour']:.0f}/h)")
+    print(f"Niveau: {report['level']} (+{report['levels_gained']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Pas de temps fixe - Découpe le temps écoulé en pas de simulation de durée identique
+
+Utilisé par GameView: la logique du jeu tourne ainsi indépendamment de la
+fréquence d'affichage.
+"""
+
+
+class FixedTimestep:
+    """
+    Accumulateur à pas fixe
+
+    Convertit des durées écoulées variables (frames) en un nombre entier de pas
+    de durée identique: la logique donne les mêmes résultats quel que soit le
+    framerate. alpha (fraction du pas suivant déjà écoulée) sert à interpoler
+    l'affichage entre les deux derniers états.
+    """
+
+    def __init__(self, hz: float = 20.0, max_steps: int = 5):
+        """
+        Args:
+            hz: Fréquence de la simulation (pas par seconde)
+            max_steps: Pas maximum par appel; au-delà le retard est abandonné
+                       (évite l'emballement après un gel de la fenêtre)
+        """
+        self.timestep = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator: float = 0.0
+        self.total_steps: int = 0
+        self.dropped_time: float = 0.0
+
+    @property
+    def hz(self) -> float:
+        return 1.0 / self.timestep
+
+    @property
+    def alpha(self) -> float:
+        """Fraction du prochain pas déjà écoulée (0 <= alpha <= 1)"""
+        return min(1.0, self.accumulator / self.timestep)
+
+    @property
+    def backlog(self) -> float:
+        """Temps accumulé pas encore simulé (secondes)"""
+        return self.accumulator
+
+    def advance(self, delta_time: float) -> int:
+        """Ajoute delta_time et retourne le nombre de pas à exécuter maintenant"""
+        self.accumulator += delta_time
+        steps = int(self.accumulator / self.timestep)
+        self.accumulator = max(0.0, self.accumulator - steps * self.timestep)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.timestep
+            steps = self.max_steps
+        self.total_steps += steps
+        return steps
+
+    def add_time(self, delta_time: float):
+        """Ajoute du temps à simuler sans plafond (rattrapage: rien n'est abandonné)"""
+        self.accumulator += delta_time
+
+    def consume(self, max_steps: int) -> int:
+        """Retire jusqu'à max_steps pas de l'accumulateur, retourne le nombre à exécuter"""
+        steps = min(int(self.accumulator / self.timestep), max_steps)
+        self.accumulator = max(0.0, self.accumulator - steps * self.timestep)
+        self.total_steps += steps
+        return steps
+
+    def reset(self):
+        """Vide l'accumulateur (reprise après une pause)"""
+        self.accumulator = 0.0
@@ -6,6 +6,11 @@ from typing import Dict, List, Optional
 from src.systems.stats_system import StatsContainer
 from src.systems.item_system import Item
 
+# Durée restante en dessous de laquelle un buff est expiré: les soustractions
+# successives de pas flottants laissent des résidus (~1e-14) qui ne feraient
+# plus avancer l'horloge du combat
+BUFF_EXPIRY_EPSILON = 1e-9
+
 class Player:
     """Représente le joueur avec ses stats, équipement, inventaire et progression"""
 
@@ -14,6 +19,7 @@ class Player:
 
         # Informations de base
         self.name: str = "Aventurier"
+        self.playtime: float = 0.0  # Secondes de jeu (vue de jeu active)
         self.level: int = 1
         self.xp: int = 0
         self.xp_to_next_level: int = 100
@@ -48,14 +54,25 @@ class Player:
 
         # Ressources
         self.resources: Dict[str, int] = {}  # {resource_id: quantity}
-        self.gold: int = 0
+        self._gold: int = 0
+
+        # Versions des ressources: chaque changement (ressource, or, niveau, stations)
+        # incrémente resource_version et note la version courante pour la clé modifiée
+        self.resource_version: int = 0
+        self.resource_stamps: Dict[str, int] = {}
 
         # Statuts de combat
         self.buffs: List[Dict] = []
         self.debuffs: List[Dict] = []
 
+        # Cache des stats totales (invalidé explicitement, voir invalidate_stats)
+        self._stats_cache: Optional[StatsContainer] = None
+        self._stats_hp_bonus: float = 0.0  # hp_current apporté par équipement/zone/buffs
+        self.stats_version: int = 0
+        self.stats_calls: int = 0  # Appels à get_total_stats (overlay de debug)
+
         # Zone actuelle
-        self.current_zone_id: str = "prairie_des_jeunes_pousses"
+        self._current_zone_id: str = "prairie_des_jeunes_pousses"
 
         # Stations débloquées
         self.unlocked_stations: List[str] = []
@@ -82,15 +99,80 @@ class Player:
         self.base_stats.crit_chance = 2.0
         self.base_stats.crit_degats = 150.0
 
+    @property
+    def current_zone_id(self) -> str:
+        """Zone actuelle du joueur"""
+        return self._current_zone_id
+
+    @current_zone_id.setter
+    def current_zone_id(self, zone_id: str):
+        if zone_id != self._current_zone_id:
+            self._current_zone_id = zone_id
+            self.invalidate_stats()
+
+    @property
+    def gold(self) -> int:
+        """Or du joueur"""
+        return self._gold
+
+    @gold.setter
+    def gold(self, value: int):
+        if value != self._gold:
+            self._gold = value
+            self.touch_resource("gold")
+
+    def touch_resource(self, key: str):
+        """
+        Note un changement de ressource (ou de "gold", "level", "stations")
+
+        Permet aux caches (recettes disponibles...) de ne réévaluer que ce qui a changé.
+        """
+        self.resource_version += 1
+        self.resource_stamps[key] = self.resource_version
+
+    def invalidate_stats(self):
+        """
+        Marque les stats totales comme à recalculer
+
+        À appeler après toute modification de base_stats, de l'équipement
+        (ou des affixes d'un item équipé), de la zone ou des buffs.
+        """
+        self._stats_cache = None
+        self.stats_version += 1
+
     def get_total_stats(self) -> StatsContainer:
-        """Calcule les stats totales (base + équipement + zone effects + buffs)"""
+        """
+        Retourne les stats totales (base + équipement + zone effects + buffs)
+
+        L'agrégat est mis en cache jusqu'au prochain invalidate_stats(); seul
+        hp_current est resynchronisé à chaque appel. Le conteneur retourné est
+        partagé: ne modifier que hp_current.
+        """
+        self.stats_calls += 1
+        if self._stats_cache is None:
+            self._rebuild_stats_cache()
+
+        total = self._stats_cache
+        total.hp_current = min(self.base_stats.hp_current + self._stats_hp_bonus, total.hp_max)
+        return total
+
+    @property
+    def max_hp_bonus(self) -> float:
+        """HP apportés par équipement, zone et buffs (ajoutés aux HP de base à chaque lecture)"""
+        if self._stats_cache is None:
+            self._rebuild_stats_cache()
+        return self._stats_hp_bonus
+
+    def _rebuild_stats_cache(self):
+        """Recalcule l'agrégat des stats totales"""
         total = self.base_stats.copy()
+        # hp_current de base est ajouté à chaque lecture, on ne cumule ici que les bonus
+        total.hp_current = 0.0
 
         # Ajouter les stats de l'équipement
         for slot, item in self.equipment.items():
             if item:
-                item_stats = item.get_total_stats()
-                total.apply_stats_dict(item_stats.to_dict())
+                total.add(item.get_total_stats())
 
         # Ajouter les effets de zone
         zone = self.data.get_zone(self.current_zone_id)
@@ -108,10 +190,8 @@ class Player:
             if buff_type and buff_value != 0:
                 total.add_stat(buff_type, buff_value)
 
-        # S'assurer que HP current ne dépasse pas HP max
-        total.hp_current = min(total.hp_current, total.hp_max)
-
-        return total
+        self._stats_hp_bonus = total.hp_current
+        self._stats_cache = total
 
     def equip_item(self, item: Item) -> Optional[Item]:
         """
@@ -154,6 +234,7 @@ class Player:
 
         self.equipment[slot] = item
         item.is_equipped = True
+        self.invalidate_stats()
 
         # Recalculer HP actuel proportionnellement
         self._adjust_hp_on_equip()
@@ -172,6 +253,7 @@ class Player:
         if item:
             item.is_equipped = False
             self.equipment[slot] = None
+            self.invalidate_stats()
             self._adjust_hp_on_equip()
 
         return item
@@ -202,6 +284,7 @@ class Player:
         """Ajoute des ressources"""
         current = self.resources.get(resource_id, 0)
         self.resources[resource_id] = current + quantity
+        self.touch_resource(resource_id)
 
     def has_resource(self, resource_id: str, quantity: int) -> bool:
         """Vérifie si le joueur a assez d'une ressource"""
@@ -211,6 +294,7 @@ class Player:
         """Consomme une ressource si disponible"""
         if self.has_resource(resource_id, quantity):
             self.resources[resource_id] -= quantity
+            self.touch_resource(resource_id)
             return True
         return False
 
@@ -237,6 +321,8 @@ class Player:
         self.base_stats.atk += 0.8
         self.base_stats.def_stat += 0.3
         self.base_stats.hp_regen += 0.05
+        self.invalidate_stats()
+        self.touch_resource("level")
 
         # Nouvelle courbe XP (TRÈS exponentielle - hardcore)
         self.xp_to_next_level = int(150 * (1.35 ** self.level))
@@ -279,6 +365,7 @@ class Player:
         """Débloque une station de craft"""
         if station_id not in self.unlocked_stations:
             self.unlocked_stations.append(station_id)
+            self.touch_resource("stations")
 
     def add_potion(self, potion_id: str, quantity: int = 1):
         """Ajoute des potions à l'inventaire"""
@@ -330,6 +417,9 @@ class Player:
                 "remaining": duration
             })
 
+        if effect_type in ("buff_atk", "buff_def", "buff_speed"):
+            self.invalidate_stats()
+
         # Consommer la potion
         self.potions[potion_id] -= 1
         if self.potions[potion_id] <= 0:
@@ -343,17 +433,21 @@ class Player:
 
         for i, buff in enumerate(self.buffs):
             buff["remaining"] -= delta_time
-            if buff["remaining"] <= 0:
+            if buff["remaining"] <= BUFF_EXPIRY_EPSILON:
                 buffs_to_remove.append(i)
 
         # Retirer les buffs expirés (en ordre inverse pour ne pas casser les indices)
         for i in reversed(buffs_to_remove):
             self.buffs.pop(i)
 
+        if buffs_to_remove:
+            self.invalidate_stats()
+
     def to_dict(self) -> Dict:
         """Convertit le joueur en dictionnaire pour sauvegarde"""
         return {
             "name": self.name,
+            "playtime": self.playtime,
             "level": self.level,
             "xp": self.xp,
             "xp_to_next_level": self.xp_to_next_level,
@@ -363,13 +457,14 @@ class Player:
                 for slot, item in self.equipment.items()
             },
             "inventory": [item.to_dict() for item in self.inventory],
-            "potions": self.potions,
-            "resources": self.resources,
+            # Copies détachées: la sauvegarde peut être sérialisée sur un autre thread
+            "potions": dict(self.potions),
+            "resources": dict(self.resources),
             "gold": self.gold,
-            "buffs": self.buffs,
+            "buffs": [dict(buff) for buff in self.buffs],
             "current_zone_id": self.current_zone_id,
-            "unlocked_stations": self.unlocked_stations,
-            "combat_stats": self.combat_stats
+            "unlocked_stations": list(self.unlocked_stations),
+            "combat_stats": dict(self.combat_stats)
         }
 
     @classmethod
@@ -377,6 +472,7 @@ class Player:
         """Crée un joueur depuis un dictionnaire"""
         player = cls(data_manager)
         player.name = data["name"]
+        player.playtime = data.get("playtime", 0.0)
         player.level = data["level"]
         player.xp = data["xp"]
         player.xp_to_next_level = data["xp_to_next_level"]
@@ -408,4 +504,5 @@ class Player:
             "boss_kills": 0
         })
 
+        player.invalidate_stats()
         return player
@@ -2,8 +2,9 @@
 Système de Combat - Gère les combats automatiques contre les ennemis
 """
 
+import heapq
 import random
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from src.systems.stats_system import StatsContainer, CombatCalculator
 from src.systems.item_system import Item, ItemGenerator
 from src.core.difficulty import DifficultySettings
@@ -31,6 +32,7 @@ class Enemy:
 
         self.resource_drops: List[Dict] = loot_data.get("resource_drops", [])
         self.item_drop_chance: float = loot_data.get("item_drop_chance_pct", 10)
+        self.rarity_weights: Dict[str, float] = loot_data.get("rarity_weights", {})
 
         # XP basé sur le tier (TRÈS réduit - hardcore)
         tier_num = int(tier_data.get("base_power", 10))
@@ -86,8 +88,12 @@ class CombatSystem:
         self.current_enemy: Optional[Enemy] = None
         self.combat_active: bool = False
         self.combat_paused: bool = False
-        self.auto_attack_timer: float = 0.0
-        self.enemy_attack_timer: float = 0.0
+        self.auto_respawn: bool = True  # Un nouvel ennemi apparaît dès la mort du précédent
+        self.zone_id: Optional[str] = None
+
+        # Ordonnanceur: horloge du combat et file (instant, priorité, acteur) des prochaines attaques
+        self.combat_time: float = 0.0
+        self._events: List[Tuple[float, int, str]] = []
 
         # Combat log (derniers événements)
         self.combat_log: List[str] = []
@@ -127,10 +133,10 @@ class CombatSystem:
             player.level,
             recommended_level
         )
+        self.zone_id = zone_id
         self.combat_active = True
         self.combat_paused = False
-        self.auto_attack_timer = 0.0
-        self.enemy_attack_timer = 0.0
+        self._schedule_first_attacks(player)
 
         # Reset stats du combat
         self.current_fight_damage_dealt = 0.0
@@ -168,54 +174,109 @@ class CombatSystem:
 
     def update(self, delta_time: float, player) -> Dict:
         """
-        Met à jour le combat
+        Fait avancer le combat de delta_time secondes
+
+        Toutes les attaques tombant dans l'intervalle sont résolues dans l'ordre
+        chronologique (le joueur d'abord à instant égal), avec régénération et
+        expiration des buffs entre deux événements: le résultat ne dépend pas
+        du framerate. Les buffs du joueur avancent aussi quand le combat est
+        inactif ou en pause.
 
         Returns:
             Dict avec les résultats: {
                 "player_dead": bool,
                 "enemy_dead": bool,
-                "rewards": {...}
+                "kills": int,
+                "rewards": {...}  # cumul des ennemis vaincus
             }
         """
-        if not self.combat_active or not self.current_enemy:
-            return {"player_dead": False, "enemy_dead": False}
-
-        # Si combat en pause, ne rien faire
-        if self.combat_paused:
-            return {"player_dead": False, "enemy_dead": False}
-
-        self.current_fight_time += delta_time
-
-        player_stats = player.get_total_stats()
-
-        # Régénération
-        CombatCalculator.apply_regen(player_stats, delta_time)
-        player.base_stats.hp_current = player_stats.hp_current
-
-        # Attaques du joueur
-        self.auto_attack_timer += delta_time
-        attack_interval = 1.0 / player_stats.vitesse_attaque
-
-        if self.auto_attack_timer >= attack_interval:
-            self.auto_attack_timer = 0.0
-            self._player_attack(player_stats)
-
-        # Attaques de l'ennemi
-        self.enemy_attack_timer += delta_time
-        enemy_attack_interval = 1.0 / self.current_enemy.stats.vitesse_attaque
-
-        if self.enemy_attack_timer >= enemy_attack_interval:
-            self.enemy_attack_timer = 0.0
-            player_dead = self._enemy_attack(player, player_stats)
-
-            if player_dead:
-                return self._handle_player_death()
-
-        # Vérifier si l'ennemi est mort
-        if not self.current_enemy.is_alive():
-            return self._handle_enemy_death(player)
-
-        return {"player_dead": False, "enemy_dead": False}
+        result = {"player_dead": False, "enemy_dead": False, "kills": 0}
+
+        if not self.combat_active or not self.current_enemy or self.combat_paused:
+            player.update_buffs(delta_time)
+            return result
+
+        end_time = self.combat_time + delta_time
+
+        while self.combat_active and self._events:
+            # Prochaine échéance: attaque, expiration de buff ou fin de l'intervalle
+            next_time = min(self._events[0][0], end_time)
+            if player.buffs:
+                soonest = min(buff["remaining"] for buff in player.buffs)
+                if self.combat_time + soonest <= self.combat_time:
+                    # Résidu sous la précision de l'horloge: l'expirer sans avancer
+                    player.update_buffs(soonest)
+                    continue
+                next_time = min(next_time, self.combat_time + soonest)
+
+            self._advance_to(player, next_time)
+
+            if self._events[0][0] > end_time:
+                break
+            if self._events[0][0] > self.combat_time:
+                continue  # Un buff a expiré: les stats ont changé, on reprend
+
+            _, _, actor = heapq.heappop(self._events)
+            player_stats = player.get_total_stats()
+
+            if actor == "player":
+                self._player_attack(player_stats)
+                self._schedule(actor, player_stats.vitesse_attaque)
+            else:
+                self._schedule(actor, self.current_enemy.stats.vitesse_attaque)
+                if self._enemy_attack(player, player_stats):
+                    result["player_dead"] = self._handle_player_death(player)["player_dead"]
+                    break
+
+            if not self.current_enemy.is_alive():
+                self._merge_rewards(result, self._handle_enemy_death(player)["rewards"])
+                if not self.auto_respawn:
+                    break
+                self.start_combat(self.zone_id, player, spawn_boss=False)
+
+        # Temps restant après une mort ou un arrêt du combat: seuls les buffs avancent
+        if self.combat_time < end_time:
+            player.update_buffs(end_time - self.combat_time)
+        self.combat_time = end_time
+
+        return result
+
+    def _advance_to(self, player, target_time: float):
+        """Avance l'horloge du combat jusqu'à target_time: régénération et durée des buffs"""
+        delta_time = target_time - self.combat_time
+        if delta_time > 0:
+            self.combat_time = target_time
+            self.current_fight_time += delta_time
+
+            player_stats = player.get_total_stats()
+            CombatCalculator.apply_regen(player_stats, delta_time)
+            player.base_stats.hp_current = player_stats.hp_current
+
+        # Toujours appelé: retire aussi les buffs arrivés à expiration pile à cet instant
+        player.update_buffs(delta_time)
+
+    def _schedule(self, actor: str, attack_speed: float):
+        """Planifie la prochaine attaque d'un acteur (priorité au joueur à instant égal)"""
+        if attack_speed > 0:
+            priority = 0 if actor == "player" else 1
+            heapq.heappush(self._events, (self.combat_time + 1.0 / attack_speed, priority, actor))
+
+    def _schedule_first_attacks(self, player):
+        """Réinitialise la file d'événements pour un nouvel ennemi"""
+        self._events = []
+        self._schedule("player", player.get_total_stats().vitesse_attaque)
+        self._schedule("enemy", self.current_enemy.stats.vitesse_attaque)
+
+    @staticmethod
+    def _merge_rewards(result: Dict, rewards: Dict):
+        """Cumule les récompenses d'un ennemi vaincu dans le résultat de update()"""
+        result["enemy_dead"] = True
+        result["kills"] += 1
+        total = result.setdefault("rewards", {"xp": 0, "gold": 0, "items": [], "resources": []})
+        total["xp"] += rewards["xp"]
+        total["gold"] += rewards["gold"]
+        total["items"].extend(rewards["items"])
+        total["resources"].extend(rewards["resources"])
 
     def _player_attack(self, player_stats: StatsContainer):
         """Le joueur attaque l'ennemi"""
@@ -313,7 +374,8 @@ class CombatSystem:
         if random.random() * 100 < self.current_enemy.item_drop_chance:
             item = self.item_generator.generate_random_drop(
                 self.current_enemy.tier,
-                player.level
+                player.level,
+                self.current_enemy.rarity_weights
             )
             if item:
                 player.add_item_to_inventory(item)
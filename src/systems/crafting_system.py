@@ -15,6 +15,26 @@ class CraftingSystem:
         self.item_generator = item_generator
         self.difficulty = difficulty
 
+        # Index inverse: ressource (ou "gold") -> recettes qui la consomment
+        self._recipes_by_input: Dict[str, List[str]] = {}
+        for recipe in self.data.recipes:
+            for resource in recipe.get("inputs", []):
+                self._recipes_by_input.setdefault(resource["resource"], []).append(recipe["id"])
+            if recipe.get("gold_cost", 0) > 0:
+                self._recipes_by_input.setdefault("gold", []).append(recipe["id"])
+
+        # Coûts ajustés de toutes les recettes, calculés une fois
+        self.difficulty.precompute_recipe_costs(self.data.recipes)
+
+        # Cache de get_available_recipes, mis à jour selon player.resource_stamps
+        self._available_player = None
+        self._available_version: int = -1
+        self._available_cost_version: int = -1
+        self._available_list: List[Dict] = []
+        self._available_by_id: Dict[str, List[Dict]] = {}  # Certains IDs apparaissent en double
+        self._available_by_station: Dict[str, List[Dict]] = {}
+        self._available_revision: int = 0  # Incrémenté quand la liste est reconstruite
+
     def can_craft(self, recipe_id: str, player) -> tuple[bool, str]:
         """
         Vérifie si le joueur peut crafter une recette
@@ -39,19 +59,17 @@ class CraftingSystem:
             return False, f"Nécessite niveau {required_level}"
 
         # Coûts ajustés par la difficulté
-        scaled_costs = self.difficulty.scaled_recipe_costs(recipe)
+        gold_cost, inputs = self.difficulty.recipe_cost(recipe)
 
-        # Vérifier les ressources (format: inputs avec resource et qty)
-        for resource in scaled_costs.get("inputs", []):
-            res_id = resource["resource"]
-            quantity = resource["qty"]
-            if not player.has_resource(res_id, quantity):
+        # Vérifier les ressources
+        resources = player.resources
+        for res_id, quantity in inputs:
+            if resources.get(res_id, 0) < quantity:
                 res_data = self.data.get_resource(res_id)
                 res_name = res_data.get("name", res_id) if res_data else res_id
                 return False, f"Manque: {quantity}x {res_name}"
 
         # Vérifier l'or
-        gold_cost = scaled_costs.get("gold_cost", recipe.get("gold_cost", 0))
         if player.gold < gold_cost:
             return False, f"Manque {gold_cost - player.gold} or"
 
@@ -73,14 +91,14 @@ class CraftingSystem:
         recipe = self.data.get_recipe(recipe_id)
         if not recipe:
             return None
-        scaled_costs = self.difficulty.scaled_recipe_costs(recipe)
+        gold_cost, inputs = self.difficulty.recipe_cost(recipe)
 
-        # Consommer les ressources (format: inputs avec resource et qty)
-        for resource in scaled_costs.get("inputs", []):
-            player.consume_resource(resource["resource"], resource["qty"])
+        # Consommer les ressources
+        for res_id, quantity in inputs:
+            player.consume_resource(res_id, quantity)
 
         # Consommer l'or
-        player.gold -= scaled_costs.get("gold_cost", recipe.get("gold_cost", 0))
+        player.gold -= gold_cost
 
         # Déterminer ce qui est crafté (format: outputs array)
         outputs = recipe.get("outputs", [])
@@ -156,40 +174,10 @@ class CraftingSystem:
         player.gold -= final_cost
 
         # Reroll l'item (regénérer les affixes)
-        base = self.data.get_item_base(item.base_id)
-        rarity = self.data.get_rarity(item.rarity_id)
-        tier_data = self.data.get_tier(item.tier)
-        tier_num = self.data.get_tier_number(item.tier)
+        self.item_generator.reroll_affixes(item)
 
-        # Clear affixes
-        item.affixes.clear()
-
-        # Regénérer
-        num_affixes = rarity.get("max_affixes", 0)
-        if num_affixes > 0:
-            tags = base.get("tags", [])
-            available_affixes = self.data.get_affixes_by_tags(tags, item.tier)
-
-            if available_affixes:
-                selected = random.sample(
-                    available_affixes,
-                    min(num_affixes, len(available_affixes))
-                )
-
-                for affix_data in selected:
-                    min_val = affix_data.get("min", 1)
-                    max_val = affix_data.get("max", min_val)
-                    base_roll = random.uniform(min_val, max_val)
-                    tier_scaling = tier_num ** 0.35
-                    rarity_mult = rarity.get("affix_mult", 1.0)
-                    final_value = base_roll * tier_scaling * rarity_mult
-
-                    item.affixes.append({
-                        "affix_id": affix_data["id"],
-                        "name": affix_data["name"],
-                        "stat_id": affix_data["stat"],
-                        "rolled_value": round(final_value, 2)
-                    })
+        if item.is_equipped:
+            player.invalidate_stats()
 
         return True
 
@@ -238,21 +226,42 @@ class CraftingSystem:
         """
         Retourne toutes les recettes disponibles pour le joueur
 
+        Le résultat est mis en cache: seules les recettes dont une ressource
+        (ou le coût en or) a changé depuis le dernier appel sont réévaluées.
+        Un changement de niveau ou de stations reconstruit la liste.
+
         Args:
             station_id: Filtrer par station (optionnel)
         """
-        available = []
+        self._ensure_available(player)
 
-        for recipe in self.data.recipes:
-            # Filtrer par station si demandé
-            if station_id and recipe.get("station") != station_id:
-                continue
+        if station_id:
+            return list(self._available_by_station.get(station_id, ()))
+        return list(self._available_list)
 
-            # Vérifier si la station est débloquée
-            required_station = recipe.get("station")
-            if required_station and required_station not in player.unlocked_stations:
-                continue
+    def get_available_revision(self, player) -> int:
+        """
+        Révision de la liste des recettes disponibles
+
+        Change quand l'ensemble des recettes visibles est reconstruit. Une simple
+        mise à jour de can_craft/reason modifie les entrées en place sans la changer.
+        """
+        self._ensure_available(player)
+        return self._available_revision
+
+    def _ensure_available(self, player):
+        """Met le cache des recettes disponibles à jour pour ce joueur"""
+        if player is not self._available_player or self.difficulty.cost_version != self._available_cost_version:
+            self._rebuild_available(player)
+        elif player.resource_version != self._available_version:
+            self._refresh_available(player)
+
+    def _rebuild_available(self, player):
+        """Réévalue toutes les recettes visibles par le joueur"""
+        available = []
 
+        # Seulement les recettes des stations débloquées (index par station)
+        for recipe in self.data.get_recipes_for_stations(player.unlocked_stations):
             # Vérifier le niveau
             if player.level < recipe.get("level_required", 1):
                 continue
@@ -265,7 +274,38 @@ class CraftingSystem:
                 "reason": reason
             })
 
-        return available
+        self._available_player = player
+        self._available_version = player.resource_version
+        self._available_cost_version = self.difficulty.cost_version
+        self._available_list = available
+        self._available_revision += 1
+        self._available_by_id = {}
+        self._available_by_station = {}
+        for entry in available:
+            self._available_by_id.setdefault(entry["recipe"]["id"], []).append(entry)
+            self._available_by_station.setdefault(entry["recipe"].get("station"), []).append(entry)
+
+    def _refresh_available(self, player):
+        """Ne réévalue que les recettes touchées depuis la version en cache"""
+        changed = [key for key, stamp in player.resource_stamps.items() if stamp > self._available_version]
+
+        # Niveau ou stations: l'ensemble des recettes visibles change
+        if "level" in changed or "stations" in changed:
+            self._rebuild_available(player)
+            return
+
+        dirty = set()
+        for key in changed:
+            dirty.update(self._recipes_by_input.get(key, ()))
+
+        for recipe_id in dirty:
+            entries = self._available_by_id.get(recipe_id)
+            if entries:
+                result = self.can_craft(recipe_id, player)
+                for entry in entries:
+                    entry["can_craft"], entry["reason"] = result
+
+        self._available_version = player.resource_version
 
     def unlock_station_cost(self, station_id: str) -> Dict:
         """Retourne le coût pour débloquer une station"""
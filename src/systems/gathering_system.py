@@ -101,17 +101,8 @@ class GatheringSystem:
         tier_data = self.data.get_tier(tier)
         tier_number = self.data.get_tier_number(tier)
 
-        # Récupérer les nodes possibles pour cette zone
-        zone_resources = zone.get("resources", [])
-        if not zone_resources:
-            return
-
-        # Filtrer les nodes qui correspondent aux ressources de la zone
-        valid_nodes = [
-            node for node in self.data.nodes
-            if node.get("resource") in zone_resources and node.get("tier") == tier
-        ]
-
+        # Nodes dont la ressource est listée par la zone (index du DataManager)
+        valid_nodes = self.data.get_zone_nodes(zone_id)
         if not valid_nodes:
             return
 
@@ -0,0 +1,223 @@
+"""
+Génération d'items en colonnes NumPy - Loot simulé en masse pour l'équilibrage
+
+Mêmes règles que ItemGenerator.generate_items (mêmes plans de base, mêmes
+constantes de rareté et de qualité, mêmes tables de tirage), mais chaque jet est
+tiré pour tous les items d'une même base en un appel NumPy au lieu d'un
+random.uniform par stat. Aucun objet Item, dict d'affixe ni id n'est créé: les
+affixes sont résumés par stat (somme des valeurs tirées) et par nombre.
+
+Les tirages viennent d'un générateur NumPy initialisé depuis random: un
+random.seed() rend le lot reproductible. NumPy n'est requis que pour ce module.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # Dépendance optionnelle, le jeu tourne sans
+    np = None
+
+from src.systems.stats_system import STAT_ALIASES
+
+
+def generate_columns(generator, base_ids: Union[str, Sequence[str]], n: Optional[int],
+                     tier: Optional[str], rarity_id: Optional[str], quality_id: Optional[str],
+                     rarity_weights: Optional[Dict[str, float]]) -> Dict:
+    """
+    Génère un lot d'items sous forme de colonnes (voir ItemGenerator.generate_items)
+
+    Returns:
+        Dict avec count, et des tableaux de longueur count: base_id, tier,
+        rarity_id, quality_id, power_score, gold_value, level_requirement,
+        affix_count; base_stats et affix_stats sont des dicts {stat: tableau}
+        (0 pour les items qui n'ont pas la stat)
+    """
+    if np is None:
+        raise ImportError("La génération d'items en colonnes nécessite NumPy (pip install numpy)")
+    from src.systems.item_system import RARITY_ROLLS, QUALITY_ROLLS
+
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # Bases: une répétée, une par entrée, ou n tirées uniformément
+    if isinstance(base_ids, str):
+        base_list = [base_ids]
+        base_index = np.zeros(1 if n is None else n, dtype=np.intp)
+    elif n is None:
+        base_list = list(base_ids)
+        base_index = np.arange(len(base_list))
+    else:
+        base_list = list(base_ids)
+        base_index = rng.integers(len(base_list), size=n)
+    count = len(base_index)
+
+    # Raretés et qualités (mêmes tables que les tirages un par un)
+    if rarity_id:
+        rarity_list, rarity_index = [rarity_id], np.zeros(count, dtype=np.intp)
+    elif rarity_weights:
+        pairs = sorted(rarity_weights.items())
+        rarity_list = [key for key, _ in pairs]
+        weights = np.maximum(0.0, np.array([weight for _, weight in pairs], dtype=float))
+        rarity_index = rng.choice(len(pairs), size=count, p=weights / weights.sum())
+    else:
+        rarity_list, rarity_index = _roll_table(rng, RARITY_ROLLS, count)
+
+    if quality_id:
+        quality_list, quality_index = [quality_id], np.zeros(count, dtype=np.intp)
+    else:
+        quality_list, quality_index = _roll_table(rng, QUALITY_ROLLS, count)
+
+    # Constantes par item, indexées depuis les constantes par rareté/qualité
+    rarities = [generator._get_rarity_constants(key) for key in rarity_list]
+    qualities = [generator._get_quality_constants(key) for key in quality_list]
+    stat_mult = (np.array([r["stat_mult"] for r in rarities])[rarity_index]
+                 * np.array([q["stat_mult"] for q in qualities])[quality_index])
+    gold_mult = (np.array([r["gold_mult"] for r in rarities])[rarity_index]
+                 * np.array([q["gold_mult"] for q in qualities])[quality_index])
+    affix_mult = np.array([r["affix_mult"] for r in rarities])[rarity_index]
+    affix_min = np.array([r["affix_range"][0] for r in rarities])[rarity_index]
+    affix_max = np.array([r["affix_range"][1] for r in rarities])[rarity_index]
+
+    # Un groupe par base: même plan, même table d'affixes
+    order = np.argsort(base_index, kind="stable")
+    bounds = np.searchsorted(base_index[order], np.arange(len(base_list) + 1))
+    plans = [generator._get_base_plan(base_id, tier) if bounds[b + 1] > bounds[b] else None
+             for b, base_id in enumerate(base_list)]
+
+    # Stats en matrices (items x stats), une colonne par stat rencontrée
+    base_names = _stat_columns(plan["base_stat_names"] for plan in plans if plan)
+    affix_names = _stat_columns(_affix_arrays(plan)["stat_names"] for plan in plans
+                                if plan and _affix_arrays(plan))
+    base_matrix = np.zeros((count, len(base_names)))
+    affix_matrix = np.zeros((count, len(affix_names)))
+
+    power_score = np.zeros(count)
+    gold_value = np.zeros(count, dtype=np.int64)
+    level_requirement = np.zeros(count, dtype=np.int64)
+    affix_count = np.zeros(count, dtype=np.int64)
+    tiers: List[Optional[str]] = [None] * len(base_list)
+
+    for b, plan in enumerate(plans):
+        if plan is None:
+            continue
+        idx = order[bounds[b]:bounds[b + 1]]
+        k = len(idx)
+        tiers[b] = plan["tier"]
+        score = np.full(k, float(plan["default_score"] + plan["base_power"]))
+        gold_value[idx] = (plan["base_power"] * gold_mult[idx]).astype(np.int64)
+        level_requirement[idx] = plan["level_requirement"]
+
+        # Stats de base
+        if plan["base_stats"]:
+            ranges = np.array([(min_val, max_val) for _, min_val, max_val in plan["base_stats"]], dtype=float)
+            values = rng.uniform(ranges[:, 0], ranges[:, 1], (k, len(ranges))) * stat_mult[idx, None]
+            score += values @ np.array(plan["base_weights"], dtype=float)
+            base_matrix[idx[:, None], [base_names[name] for name in plan["base_stat_names"]]] = values
+
+        # Affixes
+        arrays = _affix_arrays(plan)
+        if arrays is not None:
+            counts = np.minimum(rng.integers(affix_min[idx], affix_max[idx] + 1), arrays["positive"])
+            selected = _sample_unique(rng, arrays["inverse_weights"], counts)
+
+            scaling = plan["tier_scaling"] * affix_mult[idx]
+            rolls = rng.uniform(arrays["min"], arrays["max"], (k, len(arrays["min"])))
+            values = np.round(rolls * scaling[:, None] / arrays["divisor"], 2) * selected[:, arrays["entry"]]
+            score += values @ arrays["weight"]
+            stat_values = values @ arrays["stat_matrix"]  # Somme des mods par stat
+            affix_matrix[idx[:, None], [affix_names[name] for name in arrays["stat_names"]]] = stat_values
+            affix_count[idx] = selected.sum(axis=1)
+
+        power_score[idx] = score
+
+    return {
+        "count": count,
+        "base_id": np.array(base_list, dtype=object)[base_index],
+        "tier": np.array(tiers, dtype=object)[base_index],
+        "rarity_id": np.array(rarity_list, dtype=object)[rarity_index],
+        "quality_id": np.array(quality_list, dtype=object)[quality_index],
+        "power_score": power_score,
+        "gold_value": gold_value,
+        "level_requirement": level_requirement,
+        "affix_count": affix_count,
+        "base_stats": {name: base_matrix[:, col] for name, col in base_names.items()},
+        "affix_stats": {name: affix_matrix[:, col] for name, col in affix_names.items()},
+    }
+
+
+def _roll_table(rng, rolls, count: int):
+    """Version vectorisée de ItemGenerator._roll_table: (ids, index par item)"""
+    thresholds = np.array([threshold for _, threshold in rolls[:-1]])
+    index = np.searchsorted(thresholds, rng.random(count) * 100, side="right")
+    return [roll_id for roll_id, _ in rolls], index
+
+
+def _stat_columns(name_lists) -> Dict[str, int]:
+    """Colonne de chaque stat rencontrée, dans l'ordre d'apparition"""
+    columns: Dict[str, int] = {}
+    for names in name_lists:
+        for name in names:
+            columns.setdefault(name, len(columns))
+    return columns
+
+
+def _stat_name(stat_id: str) -> str:
+    """Nom d'attribut de StatsContainer d'une stat des fichiers JSON ('def' -> 'def_stat')"""
+    return STAT_ALIASES.get(stat_id, stat_id)
+
+
+def _affix_arrays(plan: Dict) -> Optional[Dict]:
+    """Table d'affixes d'un plan à plat en tableaux (calculée une seule fois par plan)"""
+    if "affix_arrays" in plan:
+        return plan["affix_arrays"]
+
+    table = plan["affix_table"]
+    arrays = None
+    if table is not None and any(weight > 0 for weight in table.weights):
+        entry, min_vals, max_vals, divisors, weights, stats = [], [], [], [], [], {}
+        for e, (_, _, mods) in enumerate(table.items):
+            for stat_id, min_val, max_val, divisor, weight in mods:
+                stats.setdefault(_stat_name(stat_id), []).append(len(entry))
+                entry.append(e)
+                min_vals.append(min_val)
+                max_vals.append(max_val)
+                divisors.append(divisor)
+                weights.append(weight)
+
+        table_weights = np.array(table.weights, dtype=float)
+        with np.errstate(divide="ignore"):
+            inverse_weights = np.where(table_weights > 0, 1.0 / table_weights, np.inf)
+        arrays = {
+            "positive": int((table_weights > 0).sum()),
+            "inverse_weights": inverse_weights,
+            "entry": np.array(entry, dtype=np.intp),
+            "min": np.array(min_vals, dtype=float),
+            "max": np.array(max_vals, dtype=float),
+            "divisor": np.array(divisors, dtype=float),
+            "weight": np.array(weights, dtype=float),
+            # Mods -> stats: values @ stat_matrix somme les mods d'une même stat
+            "stat_names": list(stats),
+            "stat_matrix": np.zeros((len(entry), len(stats))),
+        }
+        for col, mod_columns in enumerate(stats.values()):
+            arrays["stat_matrix"][mod_columns, col] = 1.0
+
+    plan["affix_arrays"] = arrays
+    return arrays
+
+
+def _sample_unique(rng, inverse_weights, counts):
+    """
+    Tirage pondéré sans remise de counts[i] éléments pour chaque ligne
+
+    Clés u^(1/poids) (Efraimidis-Spirakis): garder les plus grandes revient à
+    tirer successivement sans remise proportionnellement aux poids, comme
+    AliasTable.sample_unique. Retourne un masque (lignes, éléments).
+    """
+    rows, size = len(counts), len(inverse_weights)
+    keys = rng.random((rows, size)) ** inverse_weights
+    ranks = np.argsort(-keys, axis=1)
+    position = np.empty_like(ranks)
+    np.put_along_axis(position, ranks, np.broadcast_to(np.arange(size), (rows, size)), axis=1)
+    return position < counts[:, None]
@@ -4,8 +4,40 @@ Système d'items - Génération procédurale d'items avec bases, qualités, rare
 
 import random
 import uuid
-from typing import Dict, List, Optional
-from src.systems.stats_system import StatsContainer
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from src.systems.stats_system import StatsContainer, STAT_ALIASES
+from src.systems.sampling import AliasTable
+from src.systems import item_columns
+
+# Stats exprimées en unités (et non en %): un mod "pct" y ajoute value% de la base 1.0
+PCT_AS_FRACTION_STATS = {"vitesse_attaque"}
+
+# Poids des stats dans le power score (somme pondérée des stats totales)
+POWER_SCORE_WEIGHTS = {
+    "hp_max": 0.1,
+    "atk": 2.0,
+    "def_stat": 1.5,
+    "armure": 1.2,
+    "crit_chance": 3.0,
+    "crit_degats": 0.5,
+}
+
+# Tirages par défaut: (id, seuil cumulé en %), un jet uniforme sur [0, 100[
+# Probabilités ULTRA hardcore (quasi impossible d'avoir du rare)
+RARITY_ROLLS = (
+    ("common", 85.0),      # 85%
+    ("uncommon", 96.0),    # 11%
+    ("rare", 99.0),        # 3%
+    ("epic", 99.8),        # 0.8%
+    ("legendary", 100.0),  # 0.2%
+)
+QUALITY_ROLLS = (
+    ("poor", 60.0),        # 60%
+    ("normal", 88.0),      # 28%
+    ("superior", 97.0),    # 9%
+    ("masterwork", 99.5),  # 2.5%
+    ("perfect", 100.0),    # 0.5%
+)
 
 class Item:
     """Représente un item généré avec ses stats, affixes et propriétés"""
@@ -60,7 +92,7 @@ class Item:
             "rarity_id": self.rarity_id,
             "quality_id": self.quality_id,
             "base_stats": self.base_stats.to_dict(),
-            "affixes": self.affixes,
+            "affixes": [dict(affix) for affix in self.affixes],
             "set_id": self.set_id,
             "gold_value": self.gold_value,
             "level_requirement": self.level_requirement,
@@ -99,9 +131,20 @@ class ItemGenerator:
     def __init__(self, data_manager):
         self.data = data_manager
 
+        # Tables d'alias construites à la demande
+        self._affix_tables: Dict[Tuple[Tuple[str, ...], str], AliasTable] = {}
+        self._rarity_tables: Dict[Tuple[Tuple[str, float], ...], AliasTable] = {}
+
+        # Données précalculées par (base, tier), par rareté, par qualité et par
+        # combinaison (base, tier, rareté, qualité)
+        self._base_plans: Dict[Tuple[str, str], Dict] = {}
+        self._rarity_constants: Dict[str, Dict] = {}
+        self._quality_constants: Dict[str, Dict] = {}
+        self._item_profiles: Dict[Tuple[str, Optional[str], str, str], Dict] = {}
+
     def generate_item(self, base_id: str, tier: str = None,
                      rarity_id: str = None, quality_id: str = None,
-                     force_set: str = None) -> Item:
+                     force_set: str = None, rarity_weights: Dict[str, float] = None) -> Item:
         """
         Génère un item complet
 
@@ -111,173 +154,291 @@ class ItemGenerator:
             rarity_id: Rareté forcée (sinon aléatoire)
             quality_id: Qualité forcée (sinon aléatoire)
             force_set: Set forcé (optionnel)
+            rarity_weights: Poids de rareté {rarity_id: poids} (ex: loot d'un ennemi)
         """
-        base = self.data.get_item_base(base_id)
-        if not base:
-            raise ValueError(f"Base d'item inconnue: {base_id}")
+        item = self.generate_items(base_id, 1, tier=tier, rarity_id=rarity_id, quality_id=quality_id,
+                                   rarity_weights=rarity_weights)[0]
+        item.set_id = force_set
+        return item
 
-        item = Item()
-        item.base_id = base_id
-        item.slot = base["slot"]
-        item.tier = tier or base["tier"]
+    def generate_items(self, base_ids: Union[str, Sequence[str]], n: Optional[int] = None,
+                       tier: str = None, rarity_id: str = None, quality_id: str = None,
+                       rarity_weights: Dict[str, float] = None,
+                       columnar: bool = False) -> Union[List[Item], Dict]:
+        """
+        Génère des items en lot (coffres de boss, loot simulé, rattrapage hors-ligne)
 
-        # Déterminer la rareté
-        if rarity_id:
-            item.rarity_id = rarity_id
-        else:
-            item.rarity_id = self._roll_rarity()
+        Seul chemin de génération (generate_item en est un lot de un): les données
+        de chaque base, rareté et qualité ne sont lues qu'une fois, les raretés sont
+        tirées en un seul appel à la table d'alias et les ids du lot se suivent
+        (un seul UUID aléatoire par lot).
 
-        # Déterminer la qualité
-        if quality_id:
-            item.quality_id = quality_id
+        Args:
+            base_ids: Une base (répétée n fois) ou une liste de bases (une par item,
+                ou n tirées uniformément si n est fourni)
+            n: Nombre d'items
+            columnar: Si True, retourne des colonnes NumPy sans créer d'objets Item
+                (voir item_columns, pour l'équilibrage et le loot simulé en masse)
+
+        Returns:
+            Liste d'Items, ou dict de colonnes si columnar
+        """
+        if columnar:
+            return item_columns.generate_columns(self, base_ids, n, tier, rarity_id, quality_id,
+                                                 rarity_weights)
+
+        if isinstance(base_ids, str):
+            bases = [base_ids] * (1 if n is None else n)
+        elif n is None:
+            bases = list(base_ids)
         else:
-            item.quality_id = self._roll_quality()
-
-        # Récupérer les données
-        rarity = self.data.get_rarity(item.rarity_id)
-        quality = self.data.get_quality(item.quality_id)
-        tier_data = self.data.get_tier(item.tier)
-
-        # Construire le nom
-        prefix = rarity.get("prefix", "")
-        item.name = f"{prefix} {base['name']}".strip()
-
-        # Set
-        item.set_id = force_set
-
-        # Calculer les stats de base
-        self._generate_base_stats(item, base, tier_data, quality, rarity)
+            bases = [random.choice(base_ids) for _ in range(n)]
+        count = len(bases)
 
-        # Générer les affixes
-        num_affixes = rarity.get("max_affixes", 0)
-        if num_affixes > 0:
-            self._generate_affixes(item, base, tier_data, rarity, num_affixes)
-
-        # Calculer le power score et la valeur
-        item.power_score = self._calculate_power_score(item, tier_data)
-        item.gold_value = int(tier_data.get("base_power", 10) *
-                              rarity.get("gold_mult", 1.0) *
-                              quality.get("gold_mult", 1.0))
-        item.level_requirement = tier_data.get("recommended_level", 1)
+        # Tirages en lot
+        if rarity_id:
+            rarities = [rarity_id] * count
+        elif rarity_weights:
+            rarities = self._get_rarity_table(rarity_weights).sample(count)
+        else:
+            rarities = [self._roll_rarity() for _ in range(count)]
+        qualities = [quality_id] * count if quality_id else [self._roll_quality() for _ in range(count)]
+
+        uniform = random.uniform
+        items: List[Item] = []
+        item_ids = self._batch_uuids(count)
+
+        for i, base_id in enumerate(bases):
+            profile = self._get_item_profile(base_id, tier, rarities[i], qualities[i])
+
+            # Stats de base
+            stat_mult = profile["stat_mult"]
+            base_stats = [(stat_id, uniform(min_val, max_val) * stat_mult)
+                          for stat_id, min_val, max_val in profile["base_stats"]]
+            score = profile["score"]
+            for (_, value), weight in zip(base_stats, profile["base_weights"]):
+                score += weight * value
+
+            # Affixes
+            affixes, affix_score = self._roll_affixes(profile)
+            score += affix_score
+
+            item = Item(item_ids[i])
+            item.base_id = base_id
+            item.slot = profile["slot"]
+            item.tier = profile["tier"]
+            item.rarity_id = rarities[i]
+            item.quality_id = qualities[i]
+            item.name = profile["name"]
+            add_stat = item.base_stats.add_stat
+            for stat_id, value in base_stats:
+                add_stat(stat_id, value)
+            item.affixes = affixes
+            item.power_score = score
+            item.gold_value = profile["gold_value"]
+            item.level_requirement = profile["level_requirement"]
+            items.append(item)
+
+        return items
+
+    def _get_base_plan(self, base_id: str, tier: str = None) -> Dict:
+        """Données d'une base pour un tier, calculées une seule fois"""
+        key = (base_id, tier)
+        plan = self._base_plans.get(key)
+        if plan is not None:
+            return plan
 
-        return item
+        base = self.data.get_item_base(base_id)
+        if not base:
+            raise ValueError(f"Base d'item inconnue: {base_id}")
 
-    def _roll_rarity(self) -> str:
-        """Tire aléatoirement une rareté"""
-        # Probabilités ULTRA hardcore (quasi impossible d'avoir du rare)
-        roll = random.random() * 100
-        if roll < 85:  # 85%
-            return "common"
-        elif roll < 96:  # 11%
-            return "uncommon"
-        elif roll < 99:  # 3%
-            return "rare"
-        elif roll < 99.8:  # 0.8%
-            return "epic"
-        else:  # 0.2%
-            return "legendary"
+        item_tier = tier or base["tier"]
+        tier_data = self.data.get_tier(item_tier)
+        defaults = StatsContainer()
+
+        # Affixes possibles, mods déjà aplatis: (stat, min, max, diviseur, poids du power score)
+        affix_table = self._get_affix_table(base.get("affix_tags", base.get("tags", [])), item_tier)
+        affix_entries = []
+        for affix_data in affix_table.items:
+            mods = []
+            for mod in affix_data.get("mods") or [affix_data]:
+                min_val = mod.get("min", 1)
+                divisor = 100.0 if mod.get("mode") == "pct" and mod["stat"] in PCT_AS_FRACTION_STATS else 1.0
+                mods.append((mod["stat"], min_val, mod.get("max", min_val), divisor,
+                             self._power_weight(mod["stat"])))
+            affix_entries.append((affix_data["id"], affix_data["name"], tuple(mods)))
+
+        plan = {
+            "name": base["name"],
+            "slot": base["slot"],
+            "tier": item_tier,
+            "base_stats": [(stat_id, stat_range.get("min", 0), stat_range.get("max", stat_range.get("min", 0)))
+                           for stat_id, stat_range in base.get("base_stats", {}).items()],
+            "base_weights": [self._power_weight(stat_id) for stat_id in base.get("base_stats", {})],
+            "base_stat_names": [STAT_ALIASES.get(stat_id, stat_id) for stat_id in base.get("base_stats", {})],
+            "affix_table": AliasTable(affix_entries, affix_table.weights) if affix_entries else None,
+            "tier_scaling": self.data.get_tier_number(item_tier) ** 0.35,
+            "base_power": tier_data.get("base_power", 10),
+            "level_requirement": tier_data.get("recommended_level", 1),
+            # Les valeurs par défaut du StatsContainer comptent aussi dans le score
+            "default_score": sum(weight * defaults.get_stat(stat) for stat, weight in POWER_SCORE_WEIGHTS.items()),
+        }
+        self._base_plans[key] = plan
+        return plan
+
+    def _get_item_profile(self, base_id: str, tier: Optional[str], rarity_id: str, quality_id: str) -> Dict:
+        """Constantes d'un item pour une combinaison base/rareté/qualité, calculées une seule fois"""
+        key = (base_id, tier, rarity_id, quality_id)
+        profile = self._item_profiles.get(key)
+        if profile is not None:
+            return profile
+
+        plan = self._get_base_plan(base_id, tier)
+        rarity = self._get_rarity_constants(rarity_id)
+        quality = self._get_quality_constants(quality_id)
+
+        profile = {
+            "name": f"{rarity['prefix']} {plan['name']}".strip(),
+            "slot": plan["slot"],
+            "tier": plan["tier"],
+            "base_stats": plan["base_stats"],
+            "base_weights": plan["base_weights"],
+            "stat_mult": quality["stat_mult"] * rarity["stat_mult"],
+            "affix_table": plan["affix_table"],
+            "affix_range": rarity["affix_range"],
+            "affix_scaling": plan["tier_scaling"] * rarity["affix_mult"],
+            "score": plan["default_score"] + plan["base_power"],
+            "gold_value": int(plan["base_power"] * rarity["gold_mult"] * quality["gold_mult"]),
+            "level_requirement": plan["level_requirement"],
+        }
+        self._item_profiles[key] = profile
+        return profile
+
+    def _get_rarity_constants(self, rarity_id: str) -> Dict:
+        """Multiplicateurs et nombre d'affixes d'une rareté"""
+        constants = self._rarity_constants.get(rarity_id)
+        if constants is None:
+            rarity = self.data.get_rarity(rarity_id)
+            if "max_affixes" in rarity:
+                affix_range = (rarity["max_affixes"], rarity["max_affixes"])
+            else:
+                affix_min = rarity.get("affix_min", 0)
+                affix_range = (affix_min, rarity.get("affix_max", affix_min))
+            constants = self._rarity_constants[rarity_id] = {
+                "prefix": rarity.get("prefix", ""),
+                "stat_mult": rarity.get("stat_mult", 1.0),
+                "affix_range": affix_range,
+                "affix_mult": rarity.get("affix_mult", rarity.get("mult", 1.0)),
+                "gold_mult": rarity.get("gold_mult", 1.0),
+            }
+        return constants
+
+    def _get_quality_constants(self, quality_id: str) -> Dict:
+        """Multiplicateurs d'une qualité"""
+        constants = self._quality_constants.get(quality_id)
+        if constants is None:
+            quality = self.data.get_quality(quality_id)
+            constants = self._quality_constants[quality_id] = {
+                "stat_mult": quality.get("stat_mult", 1.0),
+                "gold_mult": quality.get("gold_mult", 1.0),
+            }
+        return constants
+
+    @staticmethod
+    def _roll_affixes(profile: Dict) -> Tuple[List[Dict], float]:
+        """Tire les affixes d'un item (pondérés, sans remise), retourne (affixes, part du power score)"""
+        affix_min, affix_max = profile["affix_range"]
+        num_affixes = random.randint(affix_min, affix_max) if affix_max > affix_min else affix_min
+        affixes = []
+        score = 0.0
+        if num_affixes <= 0 or not profile["affix_table"]:
+            return affixes, score
+
+        uniform = random.uniform
+        scaling = profile["affix_scaling"]
+        for affix_id, name, mods in profile["affix_table"].sample_unique(num_affixes):
+            for stat_id, min_val, max_val, divisor, weight in mods:
+                value = round(uniform(min_val, max_val) * scaling / divisor, 2)
+                score += weight * value
+                affixes.append({
+                    "affix_id": affix_id,
+                    "name": name,
+                    "stat_id": stat_id,
+                    "rolled_value": value
+                })
+        return affixes, score
+
+    @staticmethod
+    def _power_weight(stat_id: str) -> float:
+        """Poids d'une stat dans le power score ('def' -> 'def_stat')"""
+        return POWER_SCORE_WEIGHTS.get(STAT_ALIASES.get(stat_id, stat_id), 0.0)
+
+    @staticmethod
+    def _batch_uuids(count: int) -> List[str]:
+        """
+        Ids de count items: un UUID v4 aléatoire par lot, dont les 48 derniers bits
+        sont incrémentés d'un item à l'autre (format UUID conservé)
+        """
+        first = uuid.uuid4()
+        prefix = str(first)[:24]
+        start = first.node
+        mask = (1 << 48) - 1
+        return [f"{prefix}{(start + i) & mask:012x}" for i in range(count)]
+
+    def _roll_rarity(self, rarity_weights: Dict[str, float] = None) -> str:
+        """Tire aléatoirement une rareté (selon rarity_weights si fournis)"""
+        if rarity_weights:
+            return self._get_rarity_table(rarity_weights).draw()
+        return self._roll_table(RARITY_ROLLS)
 
     def _roll_quality(self) -> str:
         """Tire aléatoirement une qualité"""
-        roll = random.random() * 100
-        if roll < 60:  # 60%
-            return "poor"
-        elif roll < 88:  # 28%
-            return "normal"
-        elif roll < 97:  # 9%
-            return "superior"
-        elif roll < 99.5:  # 2.5%
-            return "masterwork"
-        else:  # 0.5%
-            return "perfect"
-
-    def _generate_base_stats(self, item: Item, base: Dict, tier_data: Dict,
-                            quality: Dict, rarity: Dict):
-        """Génère les stats de base de l'item"""
-        base_power = tier_data.get("base_power", 10)
-        quality_mult = quality.get("stat_mult", 1.0)
-        rarity_mult = rarity.get("stat_mult", 1.0)
-
-        # Les stats de base viennent de la définition de l'item
-        for stat_id, stat_range in base.get("base_stats", {}).items():
-            # Roll entre min et max
-            min_val = stat_range.get("min", 0)
-            max_val = stat_range.get("max", min_val)
-
-            base_roll = random.uniform(min_val, max_val)
-            final_value = base_roll * quality_mult * rarity_mult
-
-            item.base_stats.add_stat(stat_id, final_value)
-
-    def _generate_affixes(self, item: Item, base: Dict, tier_data: Dict,
-                         rarity: Dict, num_affixes: int):
-        """Génère les affixes de l'item"""
-        tier_num = self.data.get_tier_number(item.tier)
-        tags = base.get("tags", [])
-
-        # Récupérer les affixes possibles
-        available_affixes = self.data.get_affixes_by_tags(tags, item.tier)
-
-        if not available_affixes:
-            return
-
-        # Tirer aléatoirement N affixes uniques
-        selected = random.sample(
-            available_affixes,
-            min(num_affixes, len(available_affixes))
-        )
-
-        for affix_data in selected:
-            # Roll la valeur de l'affixe
-            min_val = affix_data.get("min", 1)
-            max_val = affix_data.get("max", min_val)
-
-            base_roll = random.uniform(min_val, max_val)
-
-            # Scaling par tier (formule: tier^0.35)
-            tier_scaling = tier_num ** 0.35
-
-            # Multiplicateur de rareté
-            rarity_mult = rarity.get("affix_mult", 1.0)
-
-            final_value = base_roll * tier_scaling * rarity_mult
-
-            item.affixes.append({
-                "affix_id": affix_data["id"],
-                "name": affix_data["name"],
-                "stat_id": affix_data["stat"],
-                "rolled_value": round(final_value, 2)
-            })
-
-    def _calculate_power_score(self, item: Item, tier_data: Dict) -> float:
-        """Calcule un score de puissance pour l'item"""
-        total_stats = item.get_total_stats()
-        base_power = tier_data.get("base_power", 10)
-
-        # Somme pondérée des stats principales
-        score = 0.0
-        score += total_stats.hp_max * 0.1
-        score += total_stats.atk * 2.0
-        score += total_stats.def_stat * 1.5
-        score += total_stats.armure * 1.2
-        score += total_stats.crit_chance * 3.0
-        score += total_stats.crit_degats * 0.5
-
-        return score + base_power
+        return self._roll_table(QUALITY_ROLLS)
 
-    def generate_random_drop(self, zone_tier: str, player_level: int) -> Optional[Item]:
+    @staticmethod
+    def _roll_table(rolls: Tuple[Tuple[str, float], ...]) -> str:
+        """Premier id dont le seuil cumulé dépasse un jet sur [0, 100["""
+        roll = random.random() * 100
+        for roll_id, threshold in rolls:
+            if roll < threshold:
+                return roll_id
+        return rolls[-1][0]
+
+    def _get_rarity_table(self, rarity_weights: Dict[str, float]) -> AliasTable:
+        """Table d'alias des raretés, partagée entre ennemis ayant les mêmes poids"""
+        key = tuple(sorted(rarity_weights.items()))
+        table = self._rarity_tables.get(key)
+        if table is None:
+            table = AliasTable([rarity_id for rarity_id, _ in key], [weight for _, weight in key])
+            self._rarity_tables[key] = table
+        return table
+
+    def _get_affix_table(self, tags: List[str], tier: str) -> AliasTable:
+        """Table d'alias des affixes disponibles pour des tags et un tier, pondérés par 'weight'"""
+        key = (tuple(tags), tier)
+        table = self._affix_tables.get(key)
+        if table is None:
+            affixes = self.data.get_affixes_by_tags(tags, tier)
+            table = AliasTable(affixes, [affix.get("weight", 1) for affix in affixes])
+            self._affix_tables[key] = table
+        return table
+
+    def reroll_affixes(self, item: Item):
+        """Retire et retire au sort les affixes d'un item (reforge)"""
+        profile = self._get_item_profile(item.base_id, item.tier, item.rarity_id, item.quality_id)
+        item.affixes[:] = self._roll_affixes(profile)[0]
+
+    def generate_random_drop(self, zone_tier: str, player_level: int,
+                             rarity_weights: Dict[str, float] = None) -> Optional[Item]:
         """
         Génère un drop aléatoire approprié pour une zone
 
         Args:
             zone_tier: Tier de la zone actuelle
             player_level: Niveau du joueur
+            rarity_weights: Table de rareté de l'ennemi (loot.rarity_weights)
         """
-        # Filter items by tier
-        valid_bases = [
-            item for item in self.data.items_base
-            if item["tier"] == zone_tier
-        ]
+        valid_bases = self.data.get_items_base_by_tier(zone_tier)
 
         if not valid_bases:
             return None
@@ -285,7 +446,15 @@ class ItemGenerator:
         # Sélectionner une base aléatoire
         base = random.choice(valid_bases)
 
-        return self.generate_item(base["id"])
+        return self.generate_item(base["id"], rarity_weights=rarity_weights)
+
+    def generate_random_drops(self, zone_tier: str, player_level: int, n: int,
+                              rarity_weights: Dict[str, float] = None) -> List[Item]:
+        """Génère n drops aléatoires pour une zone en un seul lot (voir generate_items)"""
+        valid_bases = [item["id"] for item in self.data.get_items_base_by_tier(zone_tier)]
+        if not valid_bases or n <= 0:
+            return []
+        return self.generate_items(valid_bases, n, rarity_weights=rarity_weights)
 
     def generate_starter_equipment(self) -> List[Item]:
         """Génère l'équipement de départ du joueur (tier 1, common, poor quality)"""
@@ -293,8 +462,7 @@ class ItemGenerator:
         starter_items = []
 
         # Arme de départ SEULEMENT - pas d'armure!
-        weapon_bases = [item for item in self.data.items_base
-                       if item["slot"] == "arme" and item["tier"] == "t1"]
+        weapon_bases = self.data.get_items_base("arme", "t1")
         if weapon_bases:
             weapon = Item()
             weapon.base_id = weapon_bases[0]["id"]
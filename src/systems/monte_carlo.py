@@ -0,0 +1,217 @@
+"""
+Simulateur Monte Carlo vectorisé - Résout des milliers de combats en parallèle
+
+Reprend exactement les formules de CombatCalculator.calculate_damage et l'ordre
+des attaques de CombatSystem.update, mais sur des tableaux NumPy: chaque jet
+(esquive, critique, blocage, procs) est tiré pour N combats d'un coup au lieu
+d'un random.random() par coup. Sert à l'équilibrage et aux outils du type
+« puis-je battre ce boss ? ».
+
+NumPy n'est requis que pour ce module.
+"""
+
+from typing import Dict, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # Dépendance optionnelle, le jeu tourne sans
+    np = None
+
+from src.systems.stats_system import StatsContainer
+
+# Dégâts élémentaires pris en compte dans les dégâts de base
+ELEMENTAL_STATS = ("degats_feu", "degats_glace", "degats_foudre",
+                   "degats_poison", "degats_ombre", "degats_lumiere")
+
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+class MonteCarloCombat:
+    """Simule N coups ou N combats indépendants avec les formules de CombatCalculator"""
+
+    def __init__(self, seed: Optional[int] = None):
+        if np is None:
+            raise ImportError("Le simulateur Monte Carlo nécessite NumPy (pip install numpy)")
+        self.rng = np.random.default_rng(seed)
+
+    def simulate_hits(self, attacker: StatsContainer, defender: StatsContainer, n: int,
+                      is_boss: bool = False) -> Dict:
+        """
+        Résout N coups indépendants de attacker sur defender
+
+        Returns:
+            Dict de tableaux (longueur N): damage, is_crit, dodged, blocked,
+            lifesteal, thorns_damage, et un tableau booléen par proc
+            (bleed, poison, stun, double_hit)
+        """
+        defender_hp = np.full(n, defender.hp_current)
+        return self._resolve_hits(attacker, defender, defender_hp, is_boss)
+
+    def _resolve_hits(self, attacker: StatsContainer, defender: StatsContainer,
+                      defender_hp, is_boss: bool) -> Dict:
+        """Version vectorisée de CombatCalculator.calculate_damage"""
+        n = len(defender_hp)
+        rng = self.rng
+
+        # 1. Esquive
+        dodge_chance = defender.esquive - (attacker.precision * 0.5)
+        dodged = rng.random(n) * 100 < dodge_chance
+        hit = ~dodged
+
+        # 2. Dégâts de base (+ élémentaires)
+        elemental_damage = sum(getattr(attacker, stat) for stat in ELEMENTAL_STATS)
+        base_damage = attacker.atk + attacker.degats_physique + elemental_damage
+        damage = np.full(n, base_damage)
+
+        # 3. Coup critique
+        is_crit = (rng.random(n) * 100 < attacker.crit_chance) & hit
+        damage = np.where(is_crit, damage * (attacker.crit_degats / 100.0), damage)
+
+        # 4. Bonus spéciaux
+        if is_boss and attacker.flag_boss_slayer > 0:
+            damage *= (1.0 + attacker.flag_boss_slayer / 100.0)
+
+        if attacker.flag_execute > 0:
+            executed = defender_hp < (defender.hp_max * 0.3)
+            damage = np.where(executed, damage * (1.0 + attacker.flag_execute / 100.0), damage)
+
+        # 5. Blocage
+        blocked = (rng.random(n) * 100 < defender.blocage) & hit
+        damage = np.where(blocked, damage * 0.2, damage)
+
+        # 6. Réduction par défense, armure et résistance élémentaire
+        damage *= 100.0 / (100.0 + defender.def_stat + defender.armure)
+        if elemental_damage > 0:
+            damage *= (1.0 - (defender.resistance_elementaire / 100.0) * 0.5)
+
+        damage = np.where(hit, np.maximum(1.0, damage), 0.0)
+
+        # 7. Vol de vie, 8. Épines
+        lifesteal = damage * (attacker.vol_vie / 100.0) if attacker.vol_vie > 0 else np.zeros(n)
+        thorns = np.where(hit, defender.epines, 0.0) if defender.epines > 0 else np.zeros(n)
+
+        # 9. Procs
+        return {
+            "damage": damage,
+            "is_crit": is_crit,
+            "dodged": dodged,
+            "blocked": blocked,
+            "lifesteal": lifesteal,
+            "thorns_damage": thorns,
+            "bleed": (rng.random(n) * 100 < attacker.proc_saignement_chance) & hit,
+            "poison": (rng.random(n) * 100 < attacker.proc_poison_chance) & hit,
+            "stun": (rng.random(n) * 100 < attacker.proc_etourdissement_chance) & hit,
+            "double_hit": (rng.random(n) * 100 < attacker.proc_double_coup_chance) & hit,
+        }
+
+    def simulate_fights(self, player_stats: StatsContainer, enemy_stats: StatsContainer, n: int,
+                        is_boss: bool = False, max_time: float = 600.0,
+                        percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict:
+        """
+        Simule N combats complets joueur contre ennemi
+
+        Suit l'ordre de CombatSystem.update: régénération du joueur jusqu'à
+        l'événement, attaque du joueur (+ double coup) d'abord à instant égal,
+        mort de l'ennemi vérifiée aussitôt (il n'attaque alors pas), puis
+        attaque de l'ennemi (+ épines) avec mort du joueur prioritaire sur celle
+        de l'ennemi. Les attaques tombent exactement tous les 1/vitesse_attaque
+        secondes; le vol de vie est mesuré mais pas appliqué, comme dans
+        CombatSystem.
+
+        Returns:
+            Dict avec win_rate, loss_rate, timeout_rate, time_to_kill (tableau
+            des durées des victoires), ttk_mean, ttk_percentiles,
+            damage_dealt_percentiles, damage_taken_percentiles, lifesteal_mean
+        """
+        player_hp = np.full(n, player_stats.hp_current)
+        enemy_hp = np.full(n, enemy_stats.hp_current)
+        fight_ids = np.arange(n)
+
+        outcome = np.zeros(n, dtype=np.int8)  # 0 = timeout, 1 = victoire, -1 = défaite
+        end_time = np.full(n, max_time)
+        damage_dealt = np.zeros(n)
+        damage_taken = np.zeros(n)
+        lifesteal = np.zeros(n)
+
+        # Statistiques identiques pour les N combats: la chronologie est commune
+        player_interval = 1.0 / player_stats.vitesse_attaque if player_stats.vitesse_attaque > 0 else None
+        enemy_interval = 1.0 / enemy_stats.vitesse_attaque if enemy_stats.vitesse_attaque > 0 else None
+        next_player = player_interval if player_interval else float("inf")
+        next_enemy = enemy_interval if enemy_interval else float("inf")
+        current_time = 0.0
+
+        while len(fight_ids) > 0:
+            now = min(next_player, next_enemy)
+            if now > max_time:
+                break
+
+            # Régénération jusqu'à l'événement
+            if player_stats.hp_regen > 0:
+                player_hp = np.minimum(player_stats.hp_max,
+                                       player_hp + player_stats.hp_regen * (now - current_time))
+            current_time = now
+
+            # Attaque du joueur, l'ennemi tué n'attaque plus
+            if next_player <= now:
+                next_player += player_interval
+                hits = self._resolve_hits(player_stats, enemy_stats, enemy_hp, is_boss)
+                dealt = hits["damage"] + np.where(hits["double_hit"], hits["damage"] * 0.5, 0.0)
+                enemy_hp = enemy_hp - dealt
+                damage_dealt[fight_ids] += dealt
+                lifesteal[fight_ids] += hits["lifesteal"]
+
+                won = enemy_hp <= 0
+                if won.any():
+                    outcome[fight_ids[won]] = 1
+                    end_time[fight_ids[won]] = now
+                    alive = ~won
+                    fight_ids, player_hp, enemy_hp = fight_ids[alive], player_hp[alive], enemy_hp[alive]
+
+            # Attaque de l'ennemi (même instant: après le joueur)
+            if next_enemy <= now:
+                next_enemy += enemy_interval
+                if len(fight_ids) == 0:
+                    break
+                hits = self._resolve_hits(enemy_stats, player_stats, player_hp, False)
+                player_hp = player_hp - hits["damage"]
+                damage_taken[fight_ids] += hits["damage"]
+                enemy_hp = enemy_hp - hits["thorns_damage"]
+
+                # Mort du joueur prioritaire sur les épines
+                lost = player_hp <= 0
+                won = (enemy_hp <= 0) & ~lost
+                done = lost | won
+                if done.any():
+                    outcome[fight_ids[lost]] = -1
+                    outcome[fight_ids[won]] = 1
+                    end_time[fight_ids[done]] = now
+                    alive = ~done
+                    fight_ids, player_hp, enemy_hp = fight_ids[alive], player_hp[alive], enemy_hp[alive]
+
+        wins = outcome == 1
+        time_to_kill = end_time[wins]
+
+        return {
+            "fights": n,
+            "win_rate": float(wins.mean()),
+            "loss_rate": float((outcome == -1).mean()),
+            "timeout_rate": float((outcome == 0).mean()),
+            "time_to_kill": time_to_kill,
+            "ttk_mean": float(time_to_kill.mean()) if len(time_to_kill) else float("inf"),
+            "ttk_percentiles": self._percentiles(time_to_kill, percentiles),
+            "damage_dealt_percentiles": self._percentiles(damage_dealt, percentiles),
+            "damage_taken_percentiles": self._percentiles(damage_taken, percentiles),
+            "lifesteal_mean": float(lifesteal.mean()),
+        }
+
+    def simulate_against_enemy(self, player, enemy, n: int, max_time: float = 600.0) -> Dict:
+        """Raccourci: simule N combats entre un Player et un Enemy de combat_system"""
+        return self.simulate_fights(player.get_total_stats(), enemy.stats, n,
+                                    is_boss=enemy.is_boss, max_time=max_time)
+
+    @staticmethod
+    def _percentiles(values, percentiles: Sequence[float]) -> Dict[float, float]:
+        """Retourne {percentile: valeur}, vide si aucun échantillon"""
+        if len(values) == 0:
+            return {}
+        return dict(zip(percentiles, np.percentile(values, percentiles).tolist()))
@@ -0,0 +1,295 @@
+"""
+Système de Progression Hors-ligne - Rattrape le temps écoulé depuis la dernière sauvegarde
+
+Plutôt que de rejouer les ticks à 60 fps, on calcule en forme close les taux
+attendus du combat automatique (dégâts, durée d'un combat, récompenses par
+kill) et on les applique par tranches de temps. Les taux sont recalculés à
+chaque tranche et à chaque level up, puisque le niveau change le scaling des
+ennemis et le facteur de récompense.
+"""
+
+import random
+import time
+from typing import Dict, List, Optional
+from src.core.difficulty import DifficultySettings
+from src.systems.combat_system import Enemy
+from src.systems.item_system import ItemGenerator
+from src.systems.stats_system import CombatCalculator
+
+
+class OfflineProgressSystem:
+    """Calcule et applique les gains accumulés pendant que le jeu était fermé"""
+
+    def __init__(self, data_manager, item_generator: ItemGenerator, difficulty: DifficultySettings):
+        self.data = data_manager
+        self.item_generator = item_generator
+        self.difficulty = difficulty
+
+        self.min_offline_seconds: float = 60.0  # En dessous, rien à rattraper
+        self.max_offline_seconds: float = 7 * 24 * 3600.0  # Plafond de rattrapage
+        self.max_chunk_seconds: float = 3600.0  # Taux recalculés au moins toutes les heures
+        self.min_chunk_seconds: float = 30.0
+        self.time_budget: float = 0.2  # Secondes CPU maximum pour le rattrapage
+
+    def apply(self, player, elapsed_seconds: float) -> Dict:
+        """
+        Applique au joueur la progression hors-ligne du combat automatique
+
+        La récolte est manuelle (clics): hors-ligne elle ne produit rien, les
+        nodes sont simplement respawnés à l'ouverture de la vue de jeu.
+
+        Returns:
+            Rapport: {"elapsed", "simulated", "kills", "gold", "xp", "levels",
+            "resources", "items", "deaths", "compute_ms"}
+        """
+        start = time.perf_counter()
+        deadline = start + self.time_budget
+        elapsed = min(max(0.0, elapsed_seconds), self.max_offline_seconds)
+
+        report = {
+            "elapsed": elapsed,
+            "simulated": 0.0,
+            "kills": 0,
+            "gold": 0,
+            "xp": 0,
+            "levels": 0,
+            "resources": {},
+            "items": 0,
+            "deaths": 0,
+            "compute_ms": 0.0
+        }
+
+        if elapsed < self.min_offline_seconds:
+            return report
+
+        start_level = player.level
+        gold_before = player.gold
+        remaining = elapsed
+        kill_carry = 0.0
+
+        while remaining > 0:
+            rates = self._combat_rates(player)
+            if not rates:
+                break
+
+            chunk = min(remaining, self.max_chunk_seconds)
+
+            # Budget dépassé: on termine en une seule tranche aux taux actuels
+            if time.perf_counter() < deadline:
+                xp_per_sec = rates["xp_per_kill"] / rates["time_per_kill"]
+                xp_missing = player.xp_to_next_level - player.xp
+                if xp_per_sec > 0 and xp_missing > 0:
+                    chunk = min(chunk, max(self.min_chunk_seconds, xp_missing / xp_per_sec))
+            else:
+                chunk = remaining
+
+            kills_float = chunk / rates["time_per_kill"] + kill_carry
+
+            # Survie: le joueur meurt si la perte nette de HP épuise sa vie
+            stats = player.get_total_stats()
+            hp = stats.hp_current
+            died = False
+            survivable = float("inf")
+            if rates["hp_loss_per_kill"] > 0:
+                survivable = max(0.0, (hp - 1.0) / rates["hp_loss_per_kill"])
+            if rates["lethal_hits"] > 0:
+                survivable = min(survivable, 1.0 / rates["lethal_hits"])
+            if kills_float > survivable:
+                kills_float = survivable
+                chunk = min(chunk, survivable * rates["time_per_kill"])
+                died = True
+
+            kills = int(kills_float)
+            kill_carry = 0.0 if died else kills_float - kills
+
+            self._grant_rewards(player, rates, kills, report)
+            report["kills"] += kills
+            report["simulated"] += chunk
+            remaining -= chunk
+
+            player.update_buffs(chunk)
+
+            if died:
+                # Même pénalité que GameView._handle_player_death, le combat s'arrête
+                report["deaths"] += 1
+                player.base_stats.hp_current = player.base_stats.hp_max * 0.5
+                player.gold = int(player.gold * 0.9)
+                break
+
+            hp_after = hp - rates["hp_loss_per_kill"] * kills
+            if rates["hp_loss_per_kill"] < 0:
+                hp_after = stats.hp_max
+            player.base_stats.hp_current = min(stats.hp_max, hp_after)
+
+        report["levels"] = player.level - start_level
+        report["gold"] = player.gold - gold_before
+        report["compute_ms"] = (time.perf_counter() - start) * 1000.0
+        return report
+
+    def _combat_rates(self, player) -> Optional[Dict]:
+        """
+        Taux attendus contre un ennemi moyen de la zone actuelle
+
+        Returns:
+            None si aucun ennemi n'est battable, sinon un dict avec
+            time_per_kill, hp_loss_per_kill, lethal_hits (coups mortels
+            attendus par combat), xp_per_kill, gold_per_kill, item_chance,
+            resources_per_kill, tier et rarity_tables
+        """
+        zone = self.data.get_zone(player.current_zone_id)
+        if not zone or not zone.get("enemies"):
+            return None
+
+        tier_data = self.data.get_tier(zone["tier"])
+        recommended_level = tier_data.get("recommended_level", 1)
+        player_stats = player.get_total_stats()
+        if player_stats.vitesse_attaque <= 0:
+            return None
+
+        enemies: List[Enemy] = [
+            Enemy(enemy_data, tier_data, self.difficulty, player.level, recommended_level)
+            for enemy_data in self.data.get_enemies_by_zone(player.current_zone_id)
+        ]
+        if not enemies:
+            return None
+
+        totals = {
+            "time_per_kill": 0.0,
+            "hp_loss_per_kill": 0.0,
+            "xp_per_kill": 0.0,
+            "gold_per_kill": 0.0,
+            "item_chance": 0.0,
+            "lethal_hits": 0.0
+        }
+        resources: Dict[str, float] = {}
+        rarity_tables: List[Dict[str, float]] = []
+
+        double_hit = 1.0 + 0.5 * CombatCalculator.chance(player_stats.proc_double_coup_chance)
+
+        for enemy in enemies:
+            # Dégâts du joueur (exécution sous 30% HP) + épines renvoyées
+            enemy_hit_chance = CombatCalculator.hit_chance(enemy.stats, player_stats)
+            thorns_dps = player_stats.epines * enemy_hit_chance * enemy.stats.vitesse_attaque
+            dps = (CombatCalculator.expected_damage(player_stats, enemy.stats, enemy.is_boss)
+                   * double_hit * player_stats.vitesse_attaque + thorns_dps)
+            execute_dps = (CombatCalculator.expected_damage(player_stats, enemy.stats, enemy.is_boss, True)
+                           * double_hit * player_stats.vitesse_attaque + thorns_dps)
+            if dps <= 0:
+                return None
+
+            if player_stats.flag_execute > 0:
+                fight_time = 0.7 * enemy.stats.hp_max / dps + 0.3 * enemy.stats.hp_max / execute_dps
+            else:
+                fight_time = enemy.stats.hp_max / dps
+
+            # Le combat live resynchronise les HP de base sur le total à chaque tick:
+            # avec un bonus de HP d'équipement, seul un coup >= hp_max est mortel
+            if player.max_hp_bonus >= 1.0:
+                hp_loss = 0.0
+                if self._worst_hit(enemy.stats, player_stats) >= player_stats.hp_max:
+                    crit = CombatCalculator.chance(enemy.stats.crit_chance) if self._worst_hit(
+                        enemy.stats, player_stats, crit=False) < player_stats.hp_max else 1.0
+                    totals["lethal_hits"] += crit * enemy_hit_chance * enemy.stats.vitesse_attaque * fight_time
+            else:
+                enemy_dps = (CombatCalculator.expected_damage(enemy.stats, player_stats)
+                             * enemy.stats.vitesse_attaque)
+                hp_loss = (enemy_dps - player_stats.hp_regen) * fight_time
+
+            # Récompenses (mêmes formules que CombatSystem._handle_enemy_death)
+            reward_factor = self.difficulty.reward_factor(player.level, enemy.recommended_level)
+            xp = max(1, int(enemy.xp_reward * reward_factor))
+            gold_rolls = range(enemy.gold_min, enemy.gold_max + 1)
+            gold = sum(max(1, int(g * self.difficulty.reward_gold_mult * reward_factor))
+                       for g in gold_rolls) / max(1, len(gold_rolls))
+
+            totals["time_per_kill"] += fight_time
+            totals["hp_loss_per_kill"] += hp_loss
+            totals["xp_per_kill"] += xp
+            totals["gold_per_kill"] += gold
+            totals["item_chance"] += enemy.item_drop_chance / 100.0
+            rarity_tables.append(enemy.rarity_weights)
+
+            for res_drop in enemy.resource_drops:
+                chance = res_drop.get("chance_pct", 25) / 100.0
+                quantity = sum(max(1, int(q * reward_factor)) for q in (1, 2, 3)) / 3.0
+                res_id = res_drop["resource"]
+                resources[res_id] = resources.get(res_id, 0.0) + chance * quantity
+
+        # Ennemi tiré uniformément (random.choice): moyenne sur la zone
+        count = len(enemies)
+        rates = {key: value / count for key, value in totals.items()}
+        rates["resources_per_kill"] = {res_id: qty / count for res_id, qty in resources.items()}
+        rates["tier"] = zone["tier"]
+        rates["rarity_tables"] = rarity_tables
+        return rates
+
+    @staticmethod
+    def _worst_hit(attacker, defender, crit: bool = True) -> float:
+        """Dégâts d'un coup non esquivé ni bloqué (critique si crit et possible)"""
+        attacker = attacker.copy()
+        defender = defender.copy()
+        if crit and attacker.crit_chance > 0:
+            attacker.crit_chance = 100.0
+        else:
+            attacker.crit_chance = 0.0
+        defender.esquive = 0.0
+        defender.blocage = 0.0
+        attacker.precision = 0.0
+        return CombatCalculator.expected_damage(attacker, defender)
+
+    def _grant_rewards(self, player, rates: Dict, kills: int, report: Dict):
+        """Applique les récompenses de `kills` combats gagnés"""
+        if kills <= 0:
+            return
+
+        xp = int(rates["xp_per_kill"] * kills)
+        level_before = player.level
+        xp_before = player.xp
+        player.add_xp(xp)
+        if player.level == level_before:
+            report["xp"] += player.xp - xp_before
+        else:
+            report["xp"] += xp
+
+        player.add_gold(int(rates["gold_per_kill"] * kills))
+
+        for res_id, per_kill in rates["resources_per_kill"].items():
+            quantity = int(round(per_kill * kills))
+            if quantity > 0:
+                player.add_resource(res_id, quantity)
+                report["resources"][res_id] = report["resources"].get(res_id, 0) + quantity
+
+        # Items: nombre attendu, borné par la place restante dans l'inventaire
+        expected_items = rates["item_chance"] * kills
+        drops = int(expected_items)
+        if random.random() < expected_items - drops:
+            drops += 1
+        drops = min(drops, player.inventory_size - len(player.inventory))
+        if drops > 0:
+            items = self.item_generator.generate_random_drops(rates["tier"], player.level, drops,
+                                                              random.choice(rates["rarity_tables"]))
+            for item in items:
+                if player.add_item_to_inventory(item):
+                    report["items"] += 1
+
+    @staticmethod
+    def format_report(report: Dict) -> List[str]:
+        """Résumé lisible du rapport, une ligne par élément"""
+        hours, rest = divmod(int(report["elapsed"]), 3600)
+        minutes = rest // 60
+        lines = [f"Hors-ligne: {hours}h{minutes:02d}"]
+        if report["kills"] == 0 and report["deaths"] == 0:
+            lines.append("Aucun gain pendant l'absence")
+            return lines
+
+        lines.append(f"+{report['kills']} kills, +{report['xp']} XP, {report['gold']:+d} or")
+        if report["levels"]:
+            lines.append(f"+{report['levels']} niveau(x)")
+        if report["resources"]:
+            total = sum(report["resources"].values())
+            lines.append(f"+{total} ressources")
+        if report["items"]:
+            lines.append(f"+{report['items']} item(s)")
+        if report["deaths"]:
+            lines.append("Vous êtes mort pendant l'absence: combat arrêté")
+        return lines
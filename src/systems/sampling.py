@@ -0,0 +1,120 @@
+"""
+Tirages pondérés - Tables d'alias de Walker pour le loot
+
+Une table est construite une fois par ensemble de poids (affixes d'un couple
+tags/tier, raretés d'un ennemi) puis chaque tirage coûte O(1): un index
+uniforme et une comparaison.
+"""
+
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, List, Optional, Sequence
+
+
+class AliasTable:
+    """Table d'alias de Walker: tirages pondérés avec remise en O(1)"""
+
+    def __init__(self, items: Sequence[Any], weights: Sequence[float]):
+        """
+        Args:
+            items: Éléments à tirer
+            weights: Poids (>= 0) de chaque élément, même longueur que items
+        """
+        if len(items) != len(weights):
+            raise ValueError("items et weights doivent avoir la même longueur")
+
+        self.items: List[Any] = list(items)
+        self.weights: List[float] = [max(0.0, float(w)) for w in weights]
+        self.total_weight: float = sum(self.weights)
+        self._positive_count: int = sum(1 for w in self.weights if w > 0)
+
+        count = len(self.items)
+        self._prob: List[float] = [1.0] * count
+        self._alias: List[int] = list(range(count))
+
+        if count == 0 or self.total_weight <= 0:
+            return
+
+        # Méthode de Vose: répartit l'excédent des grandes cases dans les petites
+        scaled = [w * count / self.total_weight for w in self.weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            low = small.pop()
+            high = large.pop()
+            self._prob[low] = scaled[low]
+            self._alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            if scaled[high] < 1.0:
+                small.append(high)
+            else:
+                large.append(high)
+
+        # Restes dus aux arrondis: cases pleines
+        for i in small + large:
+            self._prob[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def draw_index(self, rng: Optional[random.Random] = None) -> int:
+        """Tire l'index d'un élément"""
+        rand = (rng or random).random
+        column = int(rand() * len(self.items))
+        return column if rand() < self._prob[column] else self._alias[column]
+
+    def draw(self, rng: Optional[random.Random] = None) -> Any:
+        """Tire un élément"""
+        return self.items[self.draw_index(rng)]
+
+    def sample(self, n: int, rng: Optional[random.Random] = None) -> List[Any]:
+        """Tire n éléments avec remise"""
+        if not self.items or self.total_weight <= 0:
+            return []
+
+        rand = (rng or random).random
+        items, prob, alias = self.items, self._prob, self._alias
+        count = len(items)
+        result = []
+        for _ in range(n):
+            column = int(rand() * count)
+            result.append(items[column] if rand() < prob[column] else items[alias[column]])
+        return result
+
+    def sample_unique(self, k: int, rng: Optional[random.Random] = None) -> List[Any]:
+        """
+        Tire k éléments distincts (sans remise), chacun proportionnellement à son poids
+
+        Tirages par la table avec rejet des doublons; si les rejets deviennent trop
+        fréquents (k proche du nombre d'éléments), on termine par des tirages
+        cumulatifs sur les éléments restants.
+        """
+        k = min(k, self._positive_count)
+        if k <= 0:
+            return []
+
+        rand = (rng or random).random
+        prob, alias = self._prob, self._alias
+        count = len(self.items)
+        chosen: List[int] = []
+        seen = set()
+        attempts = 0
+        while len(chosen) < k and attempts < 4 * k:
+            attempts += 1
+            column = int(rand() * count)
+            index = column if rand() < prob[column] else alias[column]
+            if index not in seen:
+                seen.add(index)
+                chosen.append(index)
+
+        if len(chosen) < k:
+            remaining = [i for i, w in enumerate(self.weights) if w > 0 and i not in seen]
+            while len(chosen) < k:
+                cumulative = list(accumulate(self.weights[i] for i in remaining))
+                pick = bisect_right(cumulative, rand() * cumulative[-1])
+                pick = min(pick, len(remaining) - 1)
+                chosen.append(remaining.pop(pick))
+
+        return [self.items[i] for i in chosen]
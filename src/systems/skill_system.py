@@ -70,12 +70,7 @@ class SkillSystem:
             True si succès
         """
         # Trouver le skill
-        skill = None
-        for s in self.data.skills:
-            if s["id"] == skill_id:
-                skill = s
-                break
-
+        skill = self.data.get_skill(skill_id)
         if not skill:
             return False
 
@@ -133,20 +128,21 @@ class SkillSystem:
             bonus = current * (value / 100.0)
             player.base_stats.add_stat(stat, bonus)
 
+        player.invalidate_stats()
+
     def get_unlocked_skills(self) -> List[Dict]:
         """Retourne les skills débloqués"""
         unlocked = []
         for skill_id in self.unlocked_skills:
-            for skill in self.data.skills:
-                if skill["id"] == skill_id:
-                    unlocked.append(skill)
-                    break
+            skill = self.data.get_skill(skill_id)
+            if skill:
+                unlocked.append(skill)
         return unlocked
 
     def to_dict(self) -> Dict:
         """Pour sauvegarde"""
         return {
-            "unlocked_skills": self.unlocked_skills
+            "unlocked_skills": list(self.unlocked_skills)
         }
 
     def from_dict(self, data: Dict):
@@ -231,12 +227,7 @@ class StationUpgradeSystem:
         current_level = self.get_station_level(station_id)
 
         # Trouver la config de la station
-        station_config = None
-        for sc in self.data.station_upgrades:
-            if sc["station_id"] == station_id:
-                station_config = sc
-                break
-
+        station_config = self.data.get_station_upgrade(station_id)
         if not station_config:
             return False
 
@@ -274,12 +265,7 @@ class StationUpgradeSystem:
             return {}
 
         # Trouver la config
-        station_config = None
-        for sc in self.data.station_upgrades:
-            if sc["station_id"] == station_id:
-                station_config = sc
-                break
-
+        station_config = self.data.get_station_upgrade(station_id)
         if not station_config:
             return {}
 
@@ -295,7 +281,7 @@ class StationUpgradeSystem:
     def to_dict(self) -> Dict:
         """Pour sauvegarde"""
         return {
-            "station_levels": self.station_levels
+            "station_levels": dict(self.station_levels)
         }
 
     def from_dict(self, data: Dict):
@@ -2,110 +2,172 @@
 Système de statistiques - Gère toutes les stats du jeu
 """
 
-from typing import Dict, Optional
+import json
+import operator
 import random
+from array import array
+from pathlib import Path
+from typing import Dict, Optional
+
+# Registre des stats: (nom, valeur par défaut). L'ordre définit l'index dans le vecteur.
+_HARDCODED_STATS = (
+    # Stats de combat
+    ("hp_max", 100.0),
+    ("hp_current", 100.0),
+    ("hp_regen", 0.0),
+    ("atk", 10.0),
+    ("def_stat", 0.0),  # 'def' est un mot-clé en Python
+    ("armure", 0.0),
+    ("resistance_elementaire", 0.0),
+    ("vitesse_attaque", 1.0),
+    ("crit_chance", 5.0),
+    ("crit_degats", 150.0),
+    ("precision", 0.0),
+    ("esquive", 0.0),
+    ("blocage", 0.0),
+    ("vol_vie", 0.0),
+    ("epines", 0.0),
+    ("bouclier", 0.0),
+    ("cooldown_reduc", 0.0),
+
+    # Stats de récolte
+    ("ressources_gagnees_pct", 0.0),
+    ("chance_double_drop_pct", 0.0),
+    ("gather_power_wood", 0.0),
+    ("gather_power_ore", 0.0),
+    ("gather_power_herb", 0.0),
+    ("vitesse_recolte_pct", 0.0),
+
+    # Stats de craft
+    ("vitesse_craft_pct", 0.0),
+    ("cout_reroll_pct", 0.0),
+    ("rendement_demantelement_pct", 0.0),
+
+    # Stats utilitaires
+    ("gain_or_pct", 0.0),
+    ("gain_xp_pct", 0.0),
+
+    # Procs (chances en %)
+    ("proc_saignement_chance", 0.0),
+    ("proc_poison_chance", 0.0),
+    ("proc_etourdissement_chance", 0.0),
+    ("proc_double_coup_chance", 0.0),
+
+    # Flags spéciaux
+    ("flag_execute", 0.0),
+    ("flag_boss_slayer", 0.0),
+    ("flag_resource_spirit", 0.0),
+    ("flag_reroll_free_chance", 0.0),
+
+    # Dégâts élémentaires
+    ("degats_physique", 0.0),
+    ("degats_feu", 0.0),
+    ("degats_glace", 0.0),
+    ("degats_foudre", 0.0),
+    ("degats_poison", 0.0),
+    ("degats_ombre", 0.0),
+    ("degats_lumiere", 0.0),
+)
+
+# Alias des IDs JSON vers les noms d'attributs
+STAT_ALIASES: Dict[str, str] = {"def": "def_stat"}
+
+
+def _build_stat_registry():
+    """Construit le registre des stats (champs codés en dur + info/stats.json)"""
+    names = [name for name, _ in _HARDCODED_STATS]
+    defaults = [value for _, value in _HARDCODED_STATS]
+
+    # Les stats déclarées dans stats.json mais inconnues du code démarrent à 0
+    stats_file = Path(__file__).resolve().parents[2] / "info" / "stats.json"
+    try:
+        with open(stats_file, 'r', encoding='utf-8') as f:
+            for stat in json.load(f):
+                name = STAT_ALIASES.get(stat["id"], stat["id"])
+                if name not in names and name.isidentifier():
+                    names.append(name)
+                    defaults.append(0.0)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    return tuple(names), array('d', defaults)
+
+
+STAT_NAMES, _DEFAULT_VALUES = _build_stat_registry()
+
+# Index précalculé: nom (ou alias) -> position dans le vecteur
+STAT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(STAT_NAMES)}
+for _alias, _name in STAT_ALIASES.items():
+    STAT_INDEX[_alias] = STAT_INDEX[_name]
+
+
+def _stat_property(index: int) -> property:
+    """Crée l'accesseur d'attribut d'une stat (ex: stats.atk)"""
+    def getter(self) -> float:
+        return self._values[index]
+
+    def setter(self, value: float):
+        self._values[index] = value
+
+    return property(getter, setter)
+
 
 class StatsContainer:
-    """Conteneur pour toutes les statistiques d'une entité (joueur, ennemi, item)"""
+    """Conteneur pour toutes les statistiques d'une entité (joueur, ennemi, item)
+
+    Les valeurs sont stockées dans un vecteur array('d') indexé par STAT_INDEX:
+    la copie est une simple copie de buffer et l'addition une addition de vecteurs.
+    Chaque stat reste accessible comme attribut (stats.atk, stats.def_stat...).
+    """
+
+    __slots__ = ("_values",)
 
     def __init__(self):
-        # Stats de combat
-        self.hp_max: float = 100.0
-        self.hp_current: float = 100.0
-        self.hp_regen: float = 0.0
-        self.atk: float = 10.0
-        self.def_stat: float = 0.0  # 'def' est un mot-clé en Python
-        self.armure: float = 0.0
-        self.resistance_elementaire: float = 0.0
-        self.vitesse_attaque: float = 1.0
-        self.crit_chance: float = 5.0
-        self.crit_degats: float = 150.0
-        self.precision: float = 0.0
-        self.esquive: float = 0.0
-        self.blocage: float = 0.0
-        self.vol_vie: float = 0.0
-        self.epines: float = 0.0
-        self.bouclier: float = 0.0
-        self.cooldown_reduc: float = 0.0
-
-        # Stats de récolte
-        self.ressources_gagnees_pct: float = 0.0
-        self.chance_double_drop_pct: float = 0.0
-        self.gather_power_wood: float = 0.0
-        self.gather_power_ore: float = 0.0
-        self.gather_power_herb: float = 0.0
-        self.vitesse_recolte_pct: float = 0.0
-
-        # Stats de craft
-        self.vitesse_craft_pct: float = 0.0
-        self.cout_reroll_pct: float = 0.0
-        self.rendement_demantelement_pct: float = 0.0
-
-        # Stats utilitaires
-        self.gain_or_pct: float = 0.0
-        self.gain_xp_pct: float = 0.0
-
-        # Procs (chances en %)
-        self.proc_saignement_chance: float = 0.0
-        self.proc_poison_chance: float = 0.0
-        self.proc_etourdissement_chance: float = 0.0
-        self.proc_double_coup_chance: float = 0.0
-
-        # Flags spéciaux
-        self.flag_execute: float = 0.0
-        self.flag_boss_slayer: float = 0.0
-        self.flag_resource_spirit: float = 0.0
-        self.flag_reroll_free_chance: float = 0.0
-
-        # Dégâts élémentaires
-        self.degats_physique: float = 0.0
-        self.degats_feu: float = 0.0
-        self.degats_glace: float = 0.0
-        self.degats_foudre: float = 0.0
-        self.degats_poison: float = 0.0
-        self.degats_ombre: float = 0.0
-        self.degats_lumiere: float = 0.0
+        self._values = array('d', _DEFAULT_VALUES)
 
     def add_stat(self, stat_id: str, value: float):
         """Ajoute une valeur à une statistique"""
-        # Utilise 'def_stat' au lieu de 'def' qui est un mot-clé
-        actual_stat_id = "def_stat" if stat_id == "def" else stat_id
-
-        if hasattr(self, actual_stat_id):
-            current = getattr(self, actual_stat_id)
-            setattr(self, actual_stat_id, current + value)
+        # 'def' est redirigé vers 'def_stat' via STAT_INDEX
+        index = STAT_INDEX.get(stat_id)
+        if index is not None:
+            self._values[index] += value
 
     def get_stat(self, stat_id: str) -> float:
         """Récupère la valeur d'une statistique"""
-        actual_stat_id = "def_stat" if stat_id == "def" else stat_id
-        return getattr(self, actual_stat_id, 0.0)
+        index = STAT_INDEX.get(stat_id)
+        return self._values[index] if index is not None else 0.0
 
     def set_stat(self, stat_id: str, value: float):
         """Définit la valeur d'une statistique"""
-        actual_stat_id = "def_stat" if stat_id == "def" else stat_id
-        if hasattr(self, actual_stat_id):
-            setattr(self, actual_stat_id, value)
+        index = STAT_INDEX.get(stat_id)
+        if index is not None:
+            self._values[index] = value
 
     def apply_stats_dict(self, stats_dict: Dict[str, float]):
         """Applique un dictionnaire de stats à ce conteneur"""
+        values = self._values
         for stat_id, value in stats_dict.items():
-            self.add_stat(stat_id, value)
+            index = STAT_INDEX.get(stat_id)
+            if index is not None:
+                values[index] += value
+
+    def add(self, other: 'StatsContainer'):
+        """Ajoute toutes les stats d'un autre conteneur (addition de vecteurs)"""
+        self._values = array('d', map(operator.add, self._values, other._values))
 
     def copy(self) -> 'StatsContainer':
         """Crée une copie de ce conteneur de stats"""
-        new_stats = StatsContainer()
-        for attr in dir(self):
-            if not attr.startswith('_') and not callable(getattr(self, attr)):
-                setattr(new_stats, attr, getattr(self, attr))
+        new_stats = StatsContainer.__new__(StatsContainer)
+        new_stats._values = self._values[:]
         return new_stats
 
     def to_dict(self) -> Dict[str, float]:
         """Convertit les stats en dictionnaire"""
-        result = {}
-        for attr in dir(self):
-            if not attr.startswith('_') and not callable(getattr(self, attr)):
-                result[attr] = getattr(self, attr)
-        return result
+        return dict(zip(STAT_NAMES, self._values))
+
+
+for _index, _name in enumerate(STAT_NAMES):
+    setattr(StatsContainer, _name, _stat_property(_index))
 
 
 class CombatCalculator:
@@ -191,6 +253,51 @@ class CombatCalculator:
 
         return result
 
+    @staticmethod
+    def expected_damage(attacker: StatsContainer, defender: StatsContainer,
+                        is_boss: bool = False, execute: bool = False) -> float:
+        """
+        Espérance des dégâts d'une attaque (mêmes formules que calculate_damage)
+
+        Args:
+            execute: True si la cible est sous 30% de ses HP max
+        """
+        hit_chance = CombatCalculator.hit_chance(attacker, defender)
+        crit_chance = CombatCalculator.chance(attacker.crit_chance)
+        block_chance = CombatCalculator.chance(defender.blocage)
+
+        elemental_damage = (attacker.degats_feu + attacker.degats_glace +
+                            attacker.degats_foudre + attacker.degats_poison +
+                            attacker.degats_ombre + attacker.degats_lumiere)
+        base_damage = attacker.atk + attacker.degats_physique + elemental_damage
+
+        multiplier = 1.0
+        if is_boss and attacker.flag_boss_slayer > 0:
+            multiplier *= (1.0 + attacker.flag_boss_slayer / 100.0)
+        if execute and attacker.flag_execute > 0:
+            multiplier *= (1.0 + attacker.flag_execute / 100.0)
+        multiplier *= 100.0 / (100.0 + defender.def_stat + defender.armure)
+        if elemental_damage > 0:
+            multiplier *= (1.0 - (defender.resistance_elementaire / 100.0) * 0.5)
+
+        # Le minimum de 1 dégât n'est pas linéaire: on somme les 4 combinaisons crit/blocage
+        expected = 0.0
+        for crit_p, crit_mult in ((crit_chance, attacker.crit_degats / 100.0), (1.0 - crit_chance, 1.0)):
+            for block_p, block_mult in ((block_chance, 0.2), (1.0 - block_chance, 1.0)):
+                expected += crit_p * block_p * max(1.0, base_damage * crit_mult * block_mult * multiplier)
+
+        return hit_chance * expected
+
+    @staticmethod
+    def chance(percent: float) -> float:
+        """Convertit un pourcentage de chance en probabilité bornée [0, 1]"""
+        return min(1.0, max(0.0, percent / 100.0))
+
+    @staticmethod
+    def hit_chance(attacker: StatsContainer, defender: StatsContainer) -> float:
+        """Probabilité qu'une attaque ne soit pas esquivée (même règle que calculate_damage)"""
+        return 1.0 - CombatCalculator.chance(defender.esquive - (attacker.precision * 0.5))
+
     @staticmethod
     def _check_procs(attacker: StatsContainer, result: Dict):
         """Vérifie les déclenchements de procs"""
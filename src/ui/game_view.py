@@ -2,17 +2,29 @@
 Vue principale du jeu avec UI fantasy sombre
 """
 
+import time
 import arcade
 import arcade.gui
-from typing import Optional
+from typing import Dict, Hashable, List, Optional
+from src.core.timestep import FixedTimestep
+from src.ui import layout
+from src.ui.hit_regions import HitRegions
+from src.ui.recipe_list import RecipeListModel
+from src.ui.shape_batch import ShapeBatch
+from src.ui.text_cache import TextCache
 from src.ui.tooltip import ItemTooltip
+from src.utils.profiler import profiler
 
 class GameView(arcade.View):
     """Vue principale du jeu avec toutes les interfaces"""
 
+    # Noms des spans de profilage par mode (évite un f-string par frame)
+    DRAW_SPANS = {mode: f"draw.{mode}" for mode in ("combat", "gathering", "crafting", "inventory", "upgrades")}
+
     def __init__(self, player, data_manager, item_generator,
                  combat_system, gathering_system, crafting_system,
-                 skill_system, station_upgrade_system, save_system):
+                 skill_system, station_upgrade_system, save_system, sim_hz: float = 20.0,
+                 offline_system=None):
         super().__init__()
 
         self.player = player
@@ -43,13 +55,52 @@ class GameView(arcade.View):
         self.selected_recipe_index: Optional[int] = None
         self.show_player_stats: bool = False
         self.hovered_item: Optional[tuple] = None  # (item, x, y) pour tooltip
+
+        # Logique à pas fixes (sim_hz), indépendante du framerate; les barres
+        # sont interpolées entre les deux derniers pas
+        self.sim_clock = FixedTimestep(sim_hz)
+        self._smoothing: Dict[Hashable, List] = {}  # clé -> [précédent, courant, pas, propriétaire]
+        self._last_sim_steps: int = 0
+
+        # Mode basse consommation (fenêtre inactive ou réduite, piloté par Game):
+        # la logique suit le temps mur, en pas regroupés, et rattrape tout au retour
+        self.offline_system = offline_system
+        self.low_power: bool = False
+        self.hidden: bool = False
+        self.max_catch_up_steps: int = 1200  # Pas par update en rattrapage (~10 ms)
+        self.max_catch_up_seconds: float = 300.0  # Au-delà: progression hors-ligne (forme close)
+        self._wall_clock: float = time.monotonic()
+        self.hit_regions = HitRegions()  # Zones cliquables du dernier dessin
+        self._mouse_x: float = 0.0
+        self._mouse_y: float = 0.0
         self.tooltip = ItemTooltip()
         self.recipe_scroll_offset: int = 0  # Pour scroller les recettes
+        self.recipe_list = RecipeListModel(self.crafting, self.data)
         self._scrollbar_dragging: bool = False
         self._scroll_drag_start_y: float = 0.0
         self._scroll_drag_start_offset: int = 0
         self._scroll_drag_max_offset: int = 0
 
+        # Overlay de debug (F3): temps de frame et compteurs des chemins chauds
+        self.show_debug_overlay: bool = False
+        self._draw_text_calls: int = 0
+        self._frame_stats_calls_start: int = 0
+        self._frame_draw_text_start: int = 0
+        self._frame_text_updates_start: int = 0
+        self._frame_shape_rebuilds_start: int = 0
+        self._update_ms: float = 0.0
+        self._draw_ms: float = 0.0
+        self._frame_dt: float = 1.0 / 60.0  # Moyenne glissante de delta_time
+        self._debug_frame: Dict[str, float] = {"stats_calls": 0, "draw_text_calls": 0, "text_updates": 0, "shape_rebuilds": 0}
+
+        # Couches de dessin: une pour la vue du mode, une pour HUD + navigation.
+        # Chaque couche dessine ses formes fixes, puis les remplissages de barres,
+        # puis ses textes (arcade.Text persistants)
+        self._shape_layers: Dict[str, ShapeBatch] = {"view": ShapeBatch(), "hud": ShapeBatch()}
+        self._bar_layers: Dict[str, ShapeBatch] = {"view": ShapeBatch(), "hud": ShapeBatch()}
+        self._text_layers: Dict[str, TextCache] = {"view": TextCache(), "hud": TextCache()}
+        self._begin_layer("view")
+
         # Crafting en cours
         self.crafting_in_progress: bool = False
         self.craft_timer: float = 0.0
@@ -82,33 +133,131 @@ class GameView(arcade.View):
     def on_show_view(self):
         """Appelé quand la vue devient active"""
         arcade.set_background_color(self.COLOR_BG)
+        self._wall_clock = time.monotonic()  # Le temps passé dans une autre vue n'est pas simulé
 
     def on_hide_view(self):
         """Appelé quand la vue devient inactive"""
         self.ui_manager.disable()
 
     def on_update(self, delta_time: float):
-        """Update de la logique du jeu"""
-        # Update gathering
-        self.gathering.update(delta_time)
+        """Update de la logique du jeu, en pas fixes de sim_clock.timestep"""
+        # Une seule source de temps: l'horloge monotone (le timer d'arcade peut
+        # être ralenti ou suspendu en arrière-plan); delta_time n'est pas utilisé
+        now = time.monotonic()
+        frame_time, self._wall_clock = now - self._wall_clock, now
+        self._end_debug_frame(frame_time)
+        start = time.perf_counter()
+
+        with profiler.span("update"):
+            if self.low_power or self.sim_clock.backlog >= self.sim_clock.max_steps * self.sim_clock.timestep:
+                # Arrière-plan ou retour au premier plan: mêmes pas fixes, regroupés,
+                # aucun retard abandonné
+                self.sim_clock.add_time(frame_time)
+                self._hand_off_long_backlog()
+                steps = self.sim_clock.consume(self.max_catch_up_steps)
+            else:
+                steps = self.sim_clock.advance(frame_time)
+            for _ in range(steps):
+                self._step(self.sim_clock.timestep)
+            self._last_sim_steps = steps
+
+            # Auto-save (temps réel: c'est une politique d'écriture, pas de la logique de jeu)
+            with profiler.span("update.autosave"):
+                self.save.update_auto_save(frame_time, self.player, self.skills, self.station_upgrades)
+
+        self._update_ms = (time.perf_counter() - start) * 1000.0
+
+    def set_low_power(self, enabled: bool, hidden: bool = False):
+        """
+        Active/désactive le mode basse consommation (appelé par Game)
+
+        Args:
+            enabled: Fenêtre inactive ou réduite
+            hidden: Fenêtre réduite: plus rien n'est dessiné
+        """
+        self.low_power = enabled
+        self.hidden = enabled and hidden
+        if not enabled:
+            self.hovered_item = None  # La souris a pu bouger hors de la fenêtre
+
+    def _hand_off_long_backlog(self):
+        """Confie le retard au-delà de max_catch_up_seconds à la progression hors-ligne"""
+        excess = self.sim_clock.backlog - self.max_catch_up_seconds
+        if excess <= 0:
+            return
+
+        # Machine en veille, process suspendu...: trop long pour être rejoué pas à pas
+        self.sim_clock.accumulator -= excess
+        self.player.playtime += excess
+        if self.offline_system is None:
+            self.sim_clock.dropped_time += excess
+            return
+
+        report = self.offline_system.apply(self.player, excess)
+        if report["simulated"] <= 0:
+            return
+        for line in self.offline_system.format_report(report):
+            print(line)
+            self.combat.add_log(line)
+
+    def _step(self, dt: float):
+        """Un pas de simulation de durée fixe"""
+        self.player.playtime += dt
 
-        # Update player buffs
-        self.player.update_buffs(delta_time)
+        # Update gathering
+        with profiler.span("update.gathering"):
+            self.gathering.update(dt)
 
-        # Update combat si actif
+        # Update combat si actif (avance aussi les buffs du joueur)
         if self.combat.combat_active and self.current_mode == "combat":
-            result = self.combat.update(delta_time, self.player)
+            with profiler.span("update.combat"):
+                result = self.combat.update(dt, self.player)
 
+            # Les nouveaux ennemis sont spawnés par le combat lui-même (auto_respawn)
             if result.get("player_dead"):
                 self._handle_player_death()
-
-            if result.get("enemy_dead"):
-                # Spawn un nouvel ennemi après 1 seconde
-                # Pour l'instant, spawn immédiatement
-                self.combat.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
-
-        # Auto-save
-        self.save.update_auto_save(delta_time, self.player, self.skills, self.station_upgrades)
+        else:
+            with profiler.span("update.buffs"):
+                self.player.update_buffs(dt)
+
+    def _smoothed(self, key: Hashable, value: float, owner=None) -> float:
+        """
+        Valeur d'affichage interpolée entre les deux derniers pas de simulation
+
+        Args:
+            key: Identifie la barre
+            owner: Objet suivi (ennemi, niveau...): s'il change, pas d'interpolation
+        """
+        steps = self.sim_clock.total_steps
+        entry = self._smoothing.get(key)
+        if entry is None or entry[3] != owner or steps - entry[2] > self.sim_clock.max_steps:
+            # Nouvelle barre, autre objet suivi, ou barre non affichée depuis longtemps
+            entry = self._smoothing[key] = [value, value, steps, owner]
+        elif entry[2] != steps:
+            entry[0], entry[1], entry[2] = entry[1], value, steps
+        elif entry[1] != value:
+            # Changement hors simulation (clic): affiché immédiatement
+            entry[0] = entry[1] = value
+
+        previous, current = entry[0], entry[1]
+        return previous + (current - previous) * self.sim_clock.alpha
+
+    def _end_debug_frame(self, delta_time: float):
+        """Fige les compteurs de la frame précédente (update + draw) pour l'overlay"""
+        self._frame_dt += (delta_time - self._frame_dt) * 0.1
+        draw_text_calls = self._draw_text_calls + self.tooltip.draw_text_calls
+        self._debug_frame["stats_calls"] = self.player.stats_calls - self._frame_stats_calls_start
+        self._debug_frame["draw_text_calls"] = draw_text_calls - self._frame_draw_text_start
+        self._frame_stats_calls_start = self.player.stats_calls
+        self._frame_draw_text_start = draw_text_calls
+
+        text_updates = sum(layer.updated for layer in self._text_layers.values()) + self.tooltip.texts.updated
+        self._debug_frame["text_updates"] = text_updates - self._frame_text_updates_start
+        self._frame_text_updates_start = text_updates
+
+        shape_rebuilds = sum(layer.rebuilds for layer in self._shape_layers.values())
+        self._debug_frame["shape_rebuilds"] = shape_rebuilds - self._frame_shape_rebuilds_start
+        self._frame_shape_rebuilds_start = shape_rebuilds
 
     def _handle_player_death(self):
         """Gère la mort du joueur"""
@@ -119,38 +268,109 @@ class GameView(arcade.View):
 
     def on_draw(self):
         """Dessine l'interface"""
-        self.clear()
-
-        # Dessiner selon le mode
-        if self.current_mode == "combat":
-            self._draw_combat_view()
-        elif self.current_mode == "gathering":
-            self._draw_gathering_view()
-        elif self.current_mode == "crafting":
-            self._draw_crafting_view()
-        elif self.current_mode == "inventory":
-            self._draw_inventory_view()
-        elif self.current_mode == "upgrades":
-            self._draw_upgrades_view()
-
-        # HUD permanent (en haut)
-        self._draw_hud()
-
-        # Boutons de navigation (en bas)
-        self._draw_nav_buttons()
-
-        # Tooltip d'item si survol
-        if self.hovered_item and isinstance(self.hovered_item[0], object):
-            item, hx, hy = self.hovered_item
-            self.tooltip.draw(item, hx + 20, hy + 20, self.data)
+        if self.hidden:
+            return  # Fenêtre réduite: rien à afficher
+        start = time.perf_counter()
+
+        with profiler.span("draw"):
+            self.clear()
+            self.hit_regions.clear()
+
+            # Dessiner selon le mode
+            with profiler.span(self.DRAW_SPANS.get(self.current_mode, "draw.other")):
+                self._begin_layer("view")
+                if self.current_mode == "combat":
+                    self._draw_combat_view()
+                elif self.current_mode == "gathering":
+                    self._draw_gathering_view()
+                elif self.current_mode == "crafting":
+                    self._draw_crafting_view()
+                elif self.current_mode == "inventory":
+                    self._draw_inventory_view()
+                elif self.current_mode == "upgrades":
+                    self._draw_upgrades_view()
+                self._flush_layer()
+
+            # HUD permanent (en haut)
+            with profiler.span("draw.hud"):
+                self._begin_layer("hud")
+                self._draw_hud()
+
+                # Boutons de navigation (en bas)
+                self._draw_nav_buttons()
+                self._flush_layer()
+
+            # Tooltip d'item si survol
+            if self.hovered_item and isinstance(self.hovered_item[0], object):
+                item, hx, hy = self.hovered_item
+                with profiler.span("draw.tooltip"):
+                    self.tooltip.draw(item, hx + 20, hy + 20, self.data)
+
+        self._draw_ms = (time.perf_counter() - start) * 1000.0
+        if self.show_debug_overlay:
+            self._draw_debug_overlay()
+
+    def _begin_layer(self, name: str):
+        """Dirige les formes et textes suivants vers une couche"""
+        self._shape_layer = self._shape_layers[name]
+        self._bar_layer = self._bar_layers[name]
+        self._text_layer = self._text_layers[name]
+
+    def _flush_layer(self):
+        """Dessine la couche courante: formes, remplissages de barres, textes"""
+        self._shape_layer.flush()
+        self._bar_layer.flush()
+        self._text_layer.flush()
+
+    def _draw_text(self, *args, **kwargs):
+        """Texte via la couche courante (arcade.Text réutilisés), avec comptage des appels"""
+        self._draw_text_calls += 1
+        self._text_layer.draw_text(*args, **kwargs)
+
+    def _draw_debug_overlay(self):
+        """Overlay F3: FPS, update/draw, appels par frame, latence de sauvegarde"""
+        fps = 1.0 / self._frame_dt if self._frame_dt > 0 else 0.0
+        lines = [
+            f"FPS: {fps:.0f} ({self._frame_dt * 1000.0:.1f} ms)",
+            f"Simulation: {self.sim_clock.hz:.0f} Hz, {self._last_sim_steps} pas/frame, "
+            f"retard abandonné {self.sim_clock.dropped_time:.1f} s",
+            f"Update: {self._update_ms:.2f} ms  Draw: {self._draw_ms:.2f} ms",
+            f"get_total_stats: {self._debug_frame['stats_calls']}/frame",
+            f"draw_text: {self._debug_frame['draw_text_calls']}/frame, "
+            f"textes en cache {sum(len(layer) for layer in self._text_layers.values()) + len(self.tooltip.texts)}, "
+            f"mis à jour {self._debug_frame['text_updates']}/frame",
+            f"Formes en batch: {sum(len(layer) for layer in self._shape_layers.values())}, "
+            f"reconstructions {self._debug_frame['shape_rebuilds']}/frame",
+            f"Autosave: snapshot {self.save.last_autosave_snapshot_ms:.2f} ms, "
+            f"écriture {self.save.last_autosave_write_ms:.2f} ms, "
+            f"journal {self.save.journal.last_append_ms:.2f} ms",
+        ]
+
+        # Détail par sous-système si le profiler collecte (F8)
+        if profiler.enabled:
+            stats = profiler.stats()
+            for name in ("update.gathering", "update.combat", "update.buffs", "update.autosave",
+                         self.DRAW_SPANS.get(self.current_mode, "draw.other"), "draw.hud", "draw.tooltip"):
+                if name in stats:
+                    lines.append(f"{name}: p50 {stats[name]['p50']:.2f}  p95 {stats[name]['p95']:.2f} ms")
+
+        width = 430
+        height = 20 + len(lines) * 18
+        x = self.window.width - width - 10
+        y = self.window.height - 110 - height
+        arcade.draw_lrbt_rectangle_filled(x, x + width, y, y + height, (0, 0, 0, 190))
+        arcade.draw_lrbt_rectangle_outline(x, x + width, y, y + height, self.COLOR_BORDER, 1)
+        for i, line in enumerate(lines):
+            # Pas de self._draw_text: l'overlay ne doit pas fausser ses propres compteurs
+            arcade.draw_text(line, x + 10, y + height - 22 - i * 18, (120, 230, 120), 11)
 
     def _draw_rect_filled(self, x, y, width, height, color):
         """Helper pour dessiner un rectangle rempli (x, y, width, height)"""
-        arcade.draw_lrbt_rectangle_filled(x, x + width, y, y + height, color)
+        self._shape_layer.draw_lrbt_rectangle_filled(x, x + width, y, y + height, color)
 
     def _draw_rect_outline(self, x, y, width, height, color, border_width=2):
         """Helper pour dessiner un contour de rectangle"""
-        arcade.draw_lrbt_rectangle_outline(x, x + width, y, y + height, color, border_width)
+        self._shape_layer.draw_lrbt_rectangle_outline(x, x + width, y, y + height, color, border_width)
 
     def _draw_hud(self):
         """Dessine le HUD en haut de l'écran"""
@@ -167,71 +387,65 @@ class GameView(arcade.View):
         y = self.window.height - 25
 
         # Nom et niveau
-        arcade.draw_text(f"{self.player.name} - Niveau {self.player.level}",
+        self._draw_text(f"{self.player.name} - Niveau {self.player.level}",
                         20, y, self.COLOR_HIGHLIGHT, 16, bold=True)
 
         # Barre de HP
         y -= 25
-        hp_percent = stats.hp_current / stats.hp_max
+        hp_percent = self._smoothed("player_hp", stats.hp_current / stats.hp_max)
         self._draw_bar(20, y, 250, 20, hp_percent, self.COLOR_HP, self.COLOR_HP_BG)
-        arcade.draw_text(f"HP: {int(stats.hp_current)}/{int(stats.hp_max)}",
+        self._draw_text(f"HP: {int(stats.hp_current)}/{int(stats.hp_max)}",
                         30, y + 3, self.COLOR_TEXT, 12, bold=True)
 
         # Barre d'XP
         y -= 25
-        xp_percent = self.player.xp / self.player.xp_to_next_level
+        xp_percent = self._smoothed("player_xp", self.player.xp / self.player.xp_to_next_level,
+                                    owner=self.player.level)
         self._draw_bar(20, y, 250, 20, xp_percent, self.COLOR_XP, self.COLOR_XP_BG)
-        arcade.draw_text(f"XP: {self.player.xp}/{self.player.xp_to_next_level}",
+        self._draw_text(f"XP: {self.player.xp}/{self.player.xp_to_next_level}",
                         30, y + 3, self.COLOR_TEXT, 12, bold=True)
 
         # Or et zone
         y = self.window.height - 25
         x = 320
-        arcade.draw_text(f"Or: {self.player.gold}", x, y, self.COLOR_HIGHLIGHT, 14, bold=True)
+        self._draw_text(f"Or: {self.player.gold}", x, y, self.COLOR_HIGHLIGHT, 14, bold=True)
 
         zone = self.data.get_zone(self.player.current_zone_id)
         if zone:
             y -= 25
-            arcade.draw_text(f"Zone: {zone['name']}", x, y, self.COLOR_TEXT, 12)
+            self._draw_text(f"Zone: {zone['name']}", x, y, self.COLOR_TEXT, 12)
             y -= 20
-            arcade.draw_text(f"{zone['desc']}", x, y, self.COLOR_TEXT_DIM, 10, width=400)
+            self._draw_text(f"{zone['desc']}", x, y, self.COLOR_TEXT_DIM, 10, width=400)
             y -= 18
             rec_level = zone.get("level_requirement", zone.get("tier", "")) or ""
-            arcade.draw_text(f"Niveau conseillé: {rec_level}", x, y, self.COLOR_TEXT_DIM, 10)
+            self._draw_text(f"Niveau conseillé: {rec_level}", x, y, self.COLOR_TEXT_DIM, 10)
 
         # Stats de combat (droite)
         x = width - 300
         y = self.window.height - 25
         dps = stats.atk * stats.vitesse_attaque
-        arcade.draw_text(f"ATK: {int(stats.atk)}  DEF: {int(stats.def_stat)}  DPS: {dps:.1f}", x, y, self.COLOR_TEXT, 12)
+        self._draw_text(f"ATK: {int(stats.atk)}  DEF: {int(stats.def_stat)}  DPS: {dps:.1f}", x, y, self.COLOR_TEXT, 12)
         y -= 20
-        arcade.draw_text(f"Crit: {stats.crit_chance:.1f}%  Esq: {stats.esquive:.1f}%", x, y, self.COLOR_TEXT, 12)
+        self._draw_text(f"Crit: {stats.crit_chance:.1f}%  Esq: {stats.esquive:.1f}%", x, y, self.COLOR_TEXT, 12)
         y -= 20
-        arcade.draw_text(f"Vitesse: {stats.vitesse_attaque:.2f}/s  Regen: {stats.hp_regen:.1f}/s", x, y, self.COLOR_TEXT_DIM, 11)
+        self._draw_text(f"Vitesse: {stats.vitesse_attaque:.2f}/s  Regen: {stats.hp_regen:.1f}/s", x, y, self.COLOR_TEXT_DIM, 11)
 
     def _draw_nav_buttons(self):
         """Dessine les boutons de navigation"""
         width = self.window.width
-        button_width = width // 5  # 5 boutons maintenant
-        button_height = 50
-
-        buttons = [
-            ("COMBAT", "combat"),
-            ("RÉCOLTE", "gathering"),
-            ("CRAFT", "crafting"),
-            ("INVENTAIRE", "inventory"),
-            ("UPGRADES", "upgrades")
-        ]
+        button_width = width // len(layout.NAV_BUTTONS)
+        button_height = layout.NAV_HEIGHT
 
-        for i, (label, mode) in enumerate(buttons):
+        for i, (label, mode) in enumerate(layout.NAV_BUTTONS):
             x = i * button_width
             color = self.COLOR_HIGHLIGHT if mode == self.current_mode else self.COLOR_PANEL_LIGHT
 
-            arcade.draw_lrbt_rectangle_filled(x, x + button_width, 0, button_height, color)
-            arcade.draw_lrbt_rectangle_outline(x, x + button_width, 0, button_height, self.COLOR_BORDER, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(x, x + button_width, 0, button_height, color)
+            self._shape_layer.draw_lrbt_rectangle_outline(x, x + button_width, 0, button_height, self.COLOR_BORDER, 2)
+            self.hit_regions.add(x, x + button_width, 0, button_height, self._on_nav_click, mode)
 
             text_x = x + button_width // 2
-            arcade.draw_text(label, text_x, button_height // 2 - 7, self.COLOR_TEXT, 14,
+            self._draw_text(label, text_x, button_height // 2 - 7, self.COLOR_TEXT, 14,
                            bold=(mode == self.current_mode), anchor_x="center")
 
     def _draw_combat_view(self):
@@ -248,38 +462,38 @@ class GameView(arcade.View):
 
             # Nom de l'ennemi
             name_color = self.COLOR_HIGHLIGHT if enemy.is_boss else self.COLOR_TEXT
-            arcade.draw_text(enemy.name, combat_x, combat_y + 80, name_color, 20,
+            self._draw_text(enemy.name, combat_x, combat_y + 80, name_color, 20,
                            bold=enemy.is_boss, anchor_x="center")
-            arcade.draw_text(f"Tier {enemy.tier.upper()} | Niveau recommandé {enemy.recommended_level}",
+            self._draw_text(f"Tier {enemy.tier.upper()} | Niveau recommandé {enemy.recommended_level}",
                             combat_x, combat_y + 60, self.COLOR_TEXT_DIM, 11, anchor_x="center")
 
             # Barre de HP de l'ennemi
-            hp_percent = enemy.stats.hp_current / enemy.stats.hp_max
+            hp_percent = self._smoothed("enemy_hp", enemy.stats.hp_current / enemy.stats.hp_max, owner=id(enemy))
             bar_width = 400
             self._draw_bar(combat_x - bar_width // 2, combat_y + 50, bar_width, 30,
                           hp_percent, self.COLOR_HP, self.COLOR_HP_BG)
-            arcade.draw_text(f"{int(enemy.stats.hp_current)}/{int(enemy.stats.hp_max)}",
+            self._draw_text(f"{int(enemy.stats.hp_current)}/{int(enemy.stats.hp_max)}",
                            combat_x, combat_y + 58, self.COLOR_TEXT, 14,
                            bold=True, anchor_x="center")
 
             # Représentation visuelle de l'ennemi (placeholder)
             enemy_size = 100 if enemy.is_boss else 60
-            arcade.draw_circle_filled(combat_x, combat_y - 50, enemy_size, (120, 40, 40))
-            arcade.draw_circle_outline(combat_x, combat_y - 50, enemy_size, self.COLOR_BORDER, 3)
+            self._shape_layer.draw_circle_filled(combat_x, combat_y - 50, enemy_size, (120, 40, 40))
+            self._shape_layer.draw_circle_outline(combat_x, combat_y - 50, enemy_size, self.COLOR_BORDER, 3)
 
         # Log de combat
         log_x = 50
         log_y = combat_y - 200
-        arcade.draw_text("Combat Log:", log_x, log_y + 180, self.COLOR_HIGHLIGHT, 14, bold=True)
+        self._draw_text("Combat Log:", log_x, log_y + 180, self.COLOR_HIGHLIGHT, 14, bold=True)
 
-        arcade.draw_lrbt_rectangle_filled(log_x, log_x + 500, log_y, log_y + 160,
-                                         self.COLOR_PANEL)
-        arcade.draw_lrbt_rectangle_outline(log_x, log_x + 500, log_y, log_y + 160,
-                                          self.COLOR_BORDER, 2)
+        self._shape_layer.draw_lrbt_rectangle_filled(log_x, log_x + 500, log_y, log_y + 160,
+                                                    self.COLOR_PANEL)
+        self._shape_layer.draw_lrbt_rectangle_outline(log_x, log_x + 500, log_y, log_y + 160,
+                                                     self.COLOR_BORDER, 2)
 
         combat_log = self.combat.get_combat_log()
         for i, message in enumerate(reversed(combat_log)):
-            arcade.draw_text(message, log_x + 10, log_y + 140 - i * 15, self.COLOR_TEXT, 11)
+            self._draw_text(message, log_x + 10, log_y + 140 - i * 15, self.COLOR_TEXT, 11)
 
         # Boutons d'action de combat
         button_y = combat_y - 180
@@ -292,30 +506,36 @@ class GameView(arcade.View):
         pause_color = self.COLOR_HIGHLIGHT if self.combat.combat_paused else self.COLOR_PANEL_LIGHT
         pause_text = "REPRENDRE" if self.combat.combat_paused else "PAUSE"
 
-        arcade.draw_lrbt_rectangle_filled(pause_button_x, pause_button_x + button_width,
-                                         button_y, button_y + button_height, pause_color)
-        arcade.draw_lrbt_rectangle_outline(pause_button_x, pause_button_x + button_width,
-                                          button_y, button_y + button_height, self.COLOR_BORDER, 2)
-        arcade.draw_text(pause_text, pause_button_x + button_width // 2, button_y + 15,
+        self._shape_layer.draw_lrbt_rectangle_filled(pause_button_x, pause_button_x + button_width,
+                                                    button_y, button_y + button_height, pause_color)
+        self._shape_layer.draw_lrbt_rectangle_outline(pause_button_x, pause_button_x + button_width,
+                                                     button_y, button_y + button_height, self.COLOR_BORDER, 2)
+        self._draw_text(pause_text, pause_button_x + button_width // 2, button_y + 15,
                         self.COLOR_TEXT, 11, bold=True, anchor_x="center")
+        self.hit_regions.add(pause_button_x, pause_button_x + button_width, button_y, button_y + button_height,
+                             self._on_combat_button, "pause")
 
         # Bouton FUIR
         flee_button_x = pause_button_x + button_width + button_spacing
-        arcade.draw_lrbt_rectangle_filled(flee_button_x, flee_button_x + button_width,
-                                         button_y, button_y + button_height, (140, 40, 40))
-        arcade.draw_lrbt_rectangle_outline(flee_button_x, flee_button_x + button_width,
-                                          button_y, button_y + button_height, self.COLOR_BORDER, 2)
-        arcade.draw_text("FUIR (-20% OR)", flee_button_x + button_width // 2, button_y + 15,
+        self._shape_layer.draw_lrbt_rectangle_filled(flee_button_x, flee_button_x + button_width,
+                                                    button_y, button_y + button_height, (140, 40, 40))
+        self._shape_layer.draw_lrbt_rectangle_outline(flee_button_x, flee_button_x + button_width,
+                                                     button_y, button_y + button_height, self.COLOR_BORDER, 2)
+        self._draw_text("FUIR (-20% OR)", flee_button_x + button_width // 2, button_y + 15,
                         self.COLOR_TEXT, 11, bold=True, anchor_x="center")
+        self.hit_regions.add(flee_button_x, flee_button_x + button_width, button_y, button_y + button_height,
+                             self._on_combat_button, "flee")
 
         # Bouton SPAWN BOSS
         boss_button_x = flee_button_x + button_width + button_spacing
-        arcade.draw_lrbt_rectangle_filled(boss_button_x, boss_button_x + button_width,
-                                         button_y, button_y + button_height, self.COLOR_PANEL_LIGHT)
-        arcade.draw_lrbt_rectangle_outline(boss_button_x, boss_button_x + button_width,
-                                          button_y, button_y + button_height, self.COLOR_BORDER, 2)
-        arcade.draw_text("SPAWN BOSS", boss_button_x + button_width // 2, button_y + 15,
+        self._shape_layer.draw_lrbt_rectangle_filled(boss_button_x, boss_button_x + button_width,
+                                                    button_y, button_y + button_height, self.COLOR_PANEL_LIGHT)
+        self._shape_layer.draw_lrbt_rectangle_outline(boss_button_x, boss_button_x + button_width,
+                                                     button_y, button_y + button_height, self.COLOR_BORDER, 2)
+        self._draw_text("SPAWN BOSS", boss_button_x + button_width // 2, button_y + 15,
                         self.COLOR_HIGHLIGHT, 11, bold=True, anchor_x="center")
+        self.hit_regions.add(boss_button_x, boss_button_x + button_width, button_y, button_y + button_height,
+                             self._on_combat_button, "boss")
 
         # Panneau de stats de combat (à droite)
         stats_x = width - 350
@@ -323,54 +543,54 @@ class GameView(arcade.View):
         stats_width = 320
         stats_height = 200
 
-        arcade.draw_lrbt_rectangle_filled(stats_x, stats_x + stats_width,
-                                         stats_y, stats_y + stats_height, self.COLOR_PANEL)
-        arcade.draw_lrbt_rectangle_outline(stats_x, stats_x + stats_width,
-                                          stats_y, stats_y + stats_height, self.COLOR_BORDER, 2)
+        self._shape_layer.draw_lrbt_rectangle_filled(stats_x, stats_x + stats_width,
+                                                    stats_y, stats_y + stats_height, self.COLOR_PANEL)
+        self._shape_layer.draw_lrbt_rectangle_outline(stats_x, stats_x + stats_width,
+                                                     stats_y, stats_y + stats_height, self.COLOR_BORDER, 2)
 
-        arcade.draw_text("Stats de Combat", stats_x + 10, stats_y + stats_height - 25,
+        self._draw_text("Stats de Combat", stats_x + 10, stats_y + stats_height - 25,
                         self.COLOR_HIGHLIGHT, 13, bold=True)
 
         # Stats du combat actuel
         current_y = stats_y + stats_height - 50
         if self.combat.combat_active and self.combat.current_enemy:
-            arcade.draw_text("Combat actuel:", stats_x + 10, current_y, self.COLOR_TEXT, 11, bold=True)
+            self._draw_text("Combat actuel:", stats_x + 10, current_y, self.COLOR_TEXT, 11, bold=True)
             current_y -= 20
 
             fight_time = int(self.combat.current_fight_time)
-            arcade.draw_text(f"Duree: {fight_time}s", stats_x + 15, current_y, self.COLOR_TEXT, 10)
+            self._draw_text(f"Duree: {fight_time}s", stats_x + 15, current_y, self.COLOR_TEXT, 10)
             current_y -= 18
 
             dmg_dealt = int(self.combat.current_fight_damage_dealt)
-            arcade.draw_text(f"Degats infliges: {dmg_dealt}", stats_x + 15, current_y, (100, 200, 100), 10)
+            self._draw_text(f"Degats infliges: {dmg_dealt}", stats_x + 15, current_y, (100, 200, 100), 10)
             current_y -= 18
 
             dmg_taken = int(self.combat.current_fight_damage_taken)
-            arcade.draw_text(f"Degats recus: {dmg_taken}", stats_x + 15, current_y, (200, 100, 100), 10)
+            self._draw_text(f"Degats recus: {dmg_taken}", stats_x + 15, current_y, (200, 100, 100), 10)
             current_y -= 25
 
             enemy_speed = self.combat.current_enemy.stats.vitesse_attaque
-            arcade.draw_text(f"Vitesse ennemi: {enemy_speed:.2f}/s", stats_x + 15, current_y, self.COLOR_TEXT_DIM, 10)
+            self._draw_text(f"Vitesse ennemi: {enemy_speed:.2f}/s", stats_x + 15, current_y, self.COLOR_TEXT_DIM, 10)
             current_y -= 18
 
         # Stats globales
-        arcade.draw_text("Stats totales:", stats_x + 10, current_y, self.COLOR_TEXT, 11, bold=True)
+        self._draw_text("Stats totales:", stats_x + 10, current_y, self.COLOR_TEXT, 11, bold=True)
         current_y -= 20
 
-        arcade.draw_text(f"Kills: {self.player.combat_stats['kills']}",
+        self._draw_text(f"Kills: {self.player.combat_stats['kills']}",
                         stats_x + 15, current_y, self.COLOR_TEXT, 10)
         current_y -= 18
 
-        arcade.draw_text(f"Boss vaincus: {self.player.combat_stats['boss_kills']}",
+        self._draw_text(f"Boss vaincus: {self.player.combat_stats['boss_kills']}",
                         stats_x + 15, current_y, self.COLOR_HIGHLIGHT, 10)
         current_y -= 18
 
-        arcade.draw_text(f"Morts: {self.player.combat_stats['deaths']}",
+        self._draw_text(f"Morts: {self.player.combat_stats['deaths']}",
                         stats_x + 15, current_y, (200, 100, 100), 10)
         current_y -= 18
 
         total_dmg = self.player.combat_stats['damage_dealt']
-        arcade.draw_text(f"Degats total: {total_dmg}",
+        self._draw_text(f"Degats total: {total_dmg}",
                         stats_x + 15, current_y, (150, 150, 150), 9)
 
         # SÉLECTEUR DE ZONE (en bas à droite)
@@ -379,24 +599,24 @@ class GameView(arcade.View):
         zone_panel_x = width - zone_panel_width - 20
         zone_panel_y = 70  # Juste au-dessus des boutons de nav
 
-        arcade.draw_lrbt_rectangle_filled(
+        self._shape_layer.draw_lrbt_rectangle_filled(
             zone_panel_x, zone_panel_x + zone_panel_width,
             zone_panel_y, zone_panel_y + zone_panel_height,
             self.COLOR_PANEL
         )
-        arcade.draw_lrbt_rectangle_outline(
+        self._shape_layer.draw_lrbt_rectangle_outline(
             zone_panel_x, zone_panel_x + zone_panel_width,
             zone_panel_y, zone_panel_y + zone_panel_height,
             self.COLOR_BORDER, 2
         )
 
-        arcade.draw_text("Sélection de Zone", zone_panel_x + 10, zone_panel_y + zone_panel_height - 20,
+        self._draw_text("Sélection de Zone", zone_panel_x + 10, zone_panel_y + zone_panel_height - 20,
                         self.COLOR_HIGHLIGHT, 13, bold=True)
 
         # Zone actuelle
         current_zone = self.data.get_zone(self.player.current_zone_id)
         if current_zone:
-            arcade.draw_text(f"Actuelle: {current_zone['name']} (T{current_zone['tier'][1:]})",
+            self._draw_text(f"Actuelle: {current_zone['name']} (T{current_zone['tier'][1:]})",
                            zone_panel_x + 10, zone_panel_y + zone_panel_height - 45,
                            self.COLOR_TEXT, 11)
 
@@ -407,45 +627,49 @@ class GameView(arcade.View):
 
         # Bouton ZONE PRÉCÉDENTE
         prev_btn_x = zone_panel_x + 20
-        arcade.draw_lrbt_rectangle_filled(
+        self._shape_layer.draw_lrbt_rectangle_filled(
             prev_btn_x, prev_btn_x + btn_width,
             btn_y, btn_y + btn_height,
             self.COLOR_PANEL_LIGHT
         )
-        arcade.draw_lrbt_rectangle_outline(
+        self._shape_layer.draw_lrbt_rectangle_outline(
             prev_btn_x, prev_btn_x + btn_width,
             btn_y, btn_y + btn_height,
             self.COLOR_BORDER, 2
         )
-        arcade.draw_text("◄ ZONE PRÉC", prev_btn_x + btn_width // 2, btn_y + 10,
+        self._draw_text("◄ ZONE PRÉC", prev_btn_x + btn_width // 2, btn_y + 10,
                         self.COLOR_TEXT, 10, bold=True, anchor_x="center")
+        self.hit_regions.add(prev_btn_x, prev_btn_x + btn_width, btn_y, btn_y + btn_height,
+                             self._on_combat_button, "zone_prev")
 
         # Bouton ZONE SUIVANTE
         next_btn_x = prev_btn_x + btn_width + 20
         # Vérifier si la zone suivante est débloquée
         zones = self.data.zones
-        current_idx = next((i for i, z in enumerate(zones) if z["id"] == self.player.current_zone_id), 0)
+        current_idx = self.data.get_zone_index(self.player.current_zone_id)
         next_zone = zones[(current_idx + 1) % len(zones)]
         can_access = self.player.level >= next_zone.get("level_requirement", 1)
 
         btn_color = self.COLOR_HIGHLIGHT if can_access else (60, 60, 60)
-        arcade.draw_lrbt_rectangle_filled(
+        self._shape_layer.draw_lrbt_rectangle_filled(
             next_btn_x, next_btn_x + btn_width,
             btn_y, btn_y + btn_height,
             btn_color
         )
-        arcade.draw_lrbt_rectangle_outline(
+        self._shape_layer.draw_lrbt_rectangle_outline(
             next_btn_x, next_btn_x + btn_width,
             btn_y, btn_y + btn_height,
             self.COLOR_BORDER, 2
         )
-        arcade.draw_text("ZONE SUIV ►", next_btn_x + btn_width // 2, btn_y + 10,
+        self._draw_text("ZONE SUIV ►", next_btn_x + btn_width // 2, btn_y + 10,
                         self.COLOR_TEXT if can_access else self.COLOR_TEXT_DIM,
                         10, bold=True, anchor_x="center")
+        self.hit_regions.add(next_btn_x, next_btn_x + btn_width, btn_y, btn_y + btn_height,
+                             self._on_combat_button, "zone_next")
 
         # Info zone suivante
         if not can_access:
-            arcade.draw_text(f"Requis: Level {next_zone.get('level_requirement', 1)}",
+            self._draw_text(f"Requis: Level {next_zone.get('level_requirement', 1)}",
                            next_btn_x + btn_width // 2, btn_y - 15,
                            (200, 100, 100), 9, anchor_x="center")
 
@@ -455,15 +679,15 @@ class GameView(arcade.View):
         height = self.window.height - 150
 
         # Titre
-        arcade.draw_text("Nodes de Récolte", width // 2, height - 30, self.COLOR_HIGHLIGHT, 18,
+        self._draw_text("Nodes de Récolte", width // 2, height - 30, self.COLOR_HIGHLIGHT, 18,
                         bold=True, anchor_x="center")
 
         # Grille de nodes
         nodes = self.gathering.get_nodes_status()
-        cols = 3
-        node_width = 250
-        node_height = 120
-        spacing = 20
+        cols = layout.NODE_COLS
+        node_width = layout.NODE_WIDTH
+        node_height = layout.NODE_HEIGHT
+        spacing = layout.NODE_SPACING
 
         start_x = (width - (cols * node_width + (cols - 1) * spacing)) // 2
         start_y = height - 100
@@ -477,55 +701,60 @@ class GameView(arcade.View):
 
             # Panel du node
             color = self.COLOR_PANEL if not node_status["depleted"] else self.COLOR_PANEL_LIGHT
-            arcade.draw_lrbt_rectangle_filled(x, x + node_width, y, y + node_height, color)
-            arcade.draw_lrbt_rectangle_outline(x, x + node_width, y, y + node_height, self.COLOR_BORDER, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(x, x + node_width, y, y + node_height, color)
+            self._shape_layer.draw_lrbt_rectangle_outline(x, x + node_width, y, y + node_height, self.COLOR_BORDER, 2)
 
             if node_status["depleted"]:
                 # Node déplété
-                arcade.draw_text("ÉPUISÉ", x + node_width // 2, y + node_height // 2,
+                self._draw_text("ÉPUISÉ", x + node_width // 2, y + node_height // 2,
                                self.COLOR_TEXT_DIM, 14, bold=True, anchor_x="center")
-                arcade.draw_text(f"Respawn: {node_status['respawn_time']:.1f}s",
+                self._draw_text(f"Respawn: {node_status['respawn_time']:.1f}s",
                                x + node_width // 2, y + node_height // 2 - 20,
                                self.COLOR_TEXT_DIM, 11, anchor_x="center")
             else:
                 # Nom du node
-                arcade.draw_text(node_status["name"], x + node_width // 2, y + node_height - 20,
+                self._draw_text(node_status["name"], x + node_width // 2, y + node_height - 20,
                                self.COLOR_TEXT, 12, bold=True, anchor_x="center")
 
                 # Ressource
                 res = self.data.get_resource(node_status["resource_id"])
                 res_name = res.get("name", node_status["resource_id"]) if res else node_status["resource_id"]
-                arcade.draw_text(f"→ {res_name}", x + node_width // 2, y + node_height - 40,
+                self._draw_text(f"→ {res_name}", x + node_width // 2, y + node_height - 40,
                                self.COLOR_HIGHLIGHT, 10, anchor_x="center")
 
                 # Barre de HP
-                hp_pct = node_status["hp_percent"] / 100.0
+                hp_pct = self._smoothed(("node_hp", i), node_status["hp_percent"] / 100.0,
+                                        owner=node_status["name"])
                 self._draw_bar(x + 10, y + 30, node_width - 20, 20, hp_pct,
                              (100, 150, 100), (40, 60, 40))
 
                 # Bouton cliquer
-                arcade.draw_text("[ Cliquer pour récolter ]", x + node_width // 2, y + 8,
+                self._draw_text("[ Cliquer pour récolter ]", x + node_width // 2, y + 8,
                                self.COLOR_TEXT_DIM, 10, anchor_x="center")
+                self.hit_regions.add(x, x + node_width, y, y + node_height, self._on_node_click, i)
 
     def _recipe_scroll_context(self) -> dict:
         """Calcule les métriques partagées pour l'affichage et le drag de la scrollbar des recettes."""
         width = self.window.width
         height = self.window.height - 150
-        recipes = self.crafting.get_available_recipes(self.player)
-        total_recipes = len(recipes)
+        total_recipes = self.recipe_list.refresh(self.player)
 
         recipe_y = height - 80
-        recipe_width = 600
-        recipe_height = 70
+        recipe_width = layout.RECIPE_WIDTH
+        recipe_height = layout.RECIPE_HEIGHT
         recipe_x = (width - recipe_width) // 2
-        max_display = 8
+        max_display = layout.RECIPE_MAX_DISPLAY
         max_offset = max(0, total_recipes - max_display)
 
         # Clamp offset
         self.recipe_scroll_offset = max(0, min(self.recipe_scroll_offset, max_offset))
 
+        # Seules les lignes de la fenêtre visible sont matérialisées
+        rows = self.recipe_list.window(self.recipe_scroll_offset, max_display)
+        row_ys = [recipe_y - i * (recipe_height + layout.RECIPE_SPACING) for i in range(len(rows))]
+
         scrollbar_x = recipe_x + recipe_width + 15
-        scrollbar_height = max_display * (recipe_height + 10) - 10
+        scrollbar_height = max_display * (recipe_height + layout.RECIPE_SPACING) - layout.RECIPE_SPACING
         scrollbar_y_top = recipe_y
         scrollbar_y_bottom = scrollbar_y_top - scrollbar_height
         scrollbar_width = 12
@@ -541,7 +770,8 @@ class GameView(arcade.View):
         return {
             "width": width,
             "height": height,
-            "recipes": recipes,
+            "rows": rows,
+            "row_ys": row_ys,
             "total_recipes": total_recipes,
             "recipe_y": recipe_y,
             "recipe_width": recipe_width,
@@ -558,14 +788,6 @@ class GameView(arcade.View):
             "thumb_y_bottom": thumb_y_bottom
         }
 
-    def _is_on_recipe_scrollbar(self, x: float, y: float, ctx: dict) -> bool:
-        """Retourne True si le clic est sur la scrollbar ou son thumb."""
-        return (
-            ctx["total_recipes"] > ctx["max_display"]
-            and ctx["scrollbar_x"] <= x <= ctx["scrollbar_x"] + ctx["scrollbar_width"]
-            and ctx["scrollbar_y_bottom"] <= y <= ctx["scrollbar_y_top"]
-        )
-
     def _start_recipe_drag(self, x: float, y: float, ctx: dict):
         """Initialise un drag sur la scrollbar de recettes."""
         self._scrollbar_dragging = True
@@ -595,9 +817,7 @@ class GameView(arcade.View):
         ctx = self._recipe_scroll_context()
         width = ctx["width"]
         height = ctx["height"]
-        recipes = ctx["recipes"]
         total_recipes = ctx["total_recipes"]
-        recipe_y = ctx["recipe_y"]
         recipe_width = ctx["recipe_width"]
         recipe_height = ctx["recipe_height"]
         recipe_x = ctx["recipe_x"]
@@ -605,68 +825,49 @@ class GameView(arcade.View):
         max_offset = ctx["max_offset"]
 
         # Stations débloquées
-        arcade.draw_text("Stations de Craft", 20, height - 30, self.COLOR_HIGHLIGHT, 16, bold=True)
+        self._draw_text("Stations de Craft", 20, height - 30, self.COLOR_HIGHLIGHT, 16, bold=True)
 
         y = height - 60
         for station_id in self.player.unlocked_stations:
             station = self.data.get_station(station_id)
             if station:
-                arcade.draw_text(f"• {station['name']}", 30, y, self.COLOR_TEXT, 12)
+                self._draw_text(f"• {station['name']}", 30, y, self.COLOR_TEXT, 12)
                 y -= 20
 
         # Recettes disponibles
-        arcade.draw_text(f"Recettes ({total_recipes} disponibles)", width // 2, height - 30,
+        self._draw_text(f"Recettes ({total_recipes} disponibles)", width // 2, height - 30,
                         self.COLOR_HIGHLIGHT, 16, bold=True, anchor_x="center")
 
         # Instructions de navigation
-        if total_recipes > 8:
-            arcade.draw_text("[ UP/DOWN ou Molette pour naviguer ]", width // 2, height - 50,
+        if total_recipes > max_display:
+            self._draw_text("[ UP/DOWN ou Molette pour naviguer ]", width // 2, height - 50,
                            self.COLOR_TEXT_DIM, 10, anchor_x="center")
 
-        # Afficher les recettes avec offset
-        displayed_recipes = recipes[self.recipe_scroll_offset:self.recipe_scroll_offset + max_display]
-        for i, recipe_info in enumerate(displayed_recipes):
-            recipe = recipe_info["recipe"]
-            can_craft = recipe_info["can_craft"]
-
-            y = recipe_y - i * (recipe_height + 10)
+        # Afficher les recettes de la fenêtre visible (libellés précalculés)
+        for row, y in zip(ctx["rows"], ctx["row_ys"]):
+            can_craft = row.can_craft
 
             # Panel
             color = self.COLOR_PANEL_LIGHT if can_craft else self.COLOR_PANEL
-            arcade.draw_lrbt_rectangle_filled(recipe_x, recipe_x + recipe_width, y, y + recipe_height, color)
-            arcade.draw_lrbt_rectangle_outline(recipe_x, recipe_x + recipe_width, y, y + recipe_height,
-                                              self.COLOR_BORDER, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(recipe_x, recipe_x + recipe_width, y, y + recipe_height, color)
+            self._shape_layer.draw_lrbt_rectangle_outline(recipe_x, recipe_x + recipe_width, y, y + recipe_height,
+                                                         self.COLOR_BORDER, 2)
+            self.hit_regions.add(recipe_x, recipe_x + recipe_width, y, y + recipe_height, self._on_recipe_click, row)
 
             # Nom de la recette (depuis l'output)
-            outputs = recipe.get("outputs", [])
-            if outputs and "item_base" in outputs[0]:
-                item_base = self.data.get_item_base(outputs[0]["item_base"])
-                output_name = item_base.get("name", "???") if item_base else "???"
-            else:
-                output_name = recipe.get("id", "???")
-
-            arcade.draw_text(output_name, recipe_x + 10, y + recipe_height - 25,
+            self._draw_text(row.title, recipe_x + 10, y + recipe_height - 25,
                            self.COLOR_HIGHLIGHT if can_craft else self.COLOR_TEXT_DIM, 14, bold=True)
 
-            # Coûts (format: inputs avec resource et qty)
-            cost_text = ""
-            for res in recipe.get("inputs", [])[:3]:  # Afficher 3 premières ressources
-                res_data = self.data.get_resource(res["resource"])
-                res_name = res_data.get("name", res["resource"]) if res_data else res["resource"]
-                cost_text += f"{res['qty']}x {res_name}, "
-
-            if recipe.get("gold_cost", 0) > 0:
-                cost_text += f"{recipe['gold_cost']} or"
-
-            arcade.draw_text(cost_text.rstrip(", "), recipe_x + 10, y + recipe_height - 50,
+            # Coûts (3 premières ressources puis or)
+            self._draw_text(row.cost_text, recipe_x + 10, y + recipe_height - 50,
                            self.COLOR_TEXT if can_craft else self.COLOR_TEXT_DIM, 10)
 
             # Status
             if can_craft:
-                arcade.draw_text("[ Cliquer pour crafter ]", recipe_x + recipe_width - 150, y + 20,
+                self._draw_text("[ Cliquer pour crafter ]", recipe_x + recipe_width - 150, y + 20,
                                self.COLOR_HIGHLIGHT, 11)
             else:
-                arcade.draw_text(recipe_info["reason"], recipe_x + recipe_width - 200, y + 20,
+                self._draw_text(row.reason, recipe_x + recipe_width - 200, y + 20,
                                self.COLOR_TEXT_DIM, 10)
 
         # Scroll bar visuelle si plus de 8 recettes
@@ -678,25 +879,27 @@ class GameView(arcade.View):
             thumb_y_top = ctx["thumb_y_top"]
             thumb_y_bottom = ctx["thumb_y_bottom"]
 
-            arcade.draw_lrbt_rectangle_filled(
+            self._shape_layer.draw_lrbt_rectangle_filled(
                 scrollbar_x, scrollbar_x + scrollbar_width,
                 scrollbar_y_bottom, scrollbar_y_top,
                 self.COLOR_PANEL
             )
-            arcade.draw_lrbt_rectangle_outline(
+            self._shape_layer.draw_lrbt_rectangle_outline(
                 scrollbar_x, scrollbar_x + scrollbar_width,
                 scrollbar_y_bottom, scrollbar_y_top,
                 self.COLOR_BORDER, 1
             )
 
-            arcade.draw_lrbt_rectangle_filled(
+            self._shape_layer.draw_lrbt_rectangle_filled(
                 scrollbar_x + 2, scrollbar_x + scrollbar_width - 2,
                 thumb_y_bottom, thumb_y_top,
                 self.COLOR_HIGHLIGHT
             )
+            self.hit_regions.add(scrollbar_x, scrollbar_x + scrollbar_width, scrollbar_y_bottom, scrollbar_y_top,
+                                 self._on_recipe_scrollbar_press)
 
             # Indicateur de position
-            arcade.draw_text(
+            self._draw_text(
                 f"{self.recipe_scroll_offset + 1}-{min(self.recipe_scroll_offset + max_display, total_recipes)} / {total_recipes}",
                 scrollbar_x, scrollbar_y_bottom - 20,
                 self.COLOR_TEXT_DIM, 9, anchor_x="left"
@@ -708,76 +911,75 @@ class GameView(arcade.View):
         height = self.window.height - 150
 
         # Équipement (gauche)
-        equip_x = 50
+        equip_x = layout.EQUIPMENT_X
         equip_y = height - 50
+        row_height = layout.EQUIPMENT_ROW_HEIGHT
 
-        arcade.draw_text("Équipement", equip_x, equip_y, self.COLOR_HIGHLIGHT, 16, bold=True)
-
-        slot_names = {
-            "weapon": "Arme",
-            "helmet": "Casque",
-            "chest": "Armure",
-            "legs": "Jambes",
-            "boots": "Bottes",
-            "gloves": "Gants",
-            "ring1": "Anneau 1",
-            "ring2": "Anneau 2",
-            "amulet": "Amulette"
-        }
+        self._draw_text("Équipement", equip_x, equip_y, self.COLOR_HIGHLIGHT, 16, bold=True)
 
         y = equip_y - 30
-        for slot, label in slot_names.items():
+        for slot, label in layout.EQUIPMENT_SLOTS.items():
             item = self.player.equipment.get(slot)
 
             if item and hasattr(item, 'name'):
                 rarity_color = self.RARITY_COLORS.get(item.rarity_id, self.COLOR_TEXT)
-                arcade.draw_text(f"{label}: {item.name}", equip_x, y, rarity_color, 11)
+                self._draw_text(f"{label}: {item.name}", equip_x, y, rarity_color, 11)
             else:
-                arcade.draw_text(f"{label}: [Vide]", equip_x, y, self.COLOR_TEXT_DIM, 11)
+                item = None
+                self._draw_text(f"{label}: [Vide]", equip_x, y, self.COLOR_TEXT_DIM, 11)
 
-            y -= 25
+            # Ligne autour du texte (ligne de base à y)
+            self.hit_regions.add(equip_x, equip_x + layout.EQUIPMENT_ROW_WIDTH, y - 7, y - 7 + row_height,
+                                 self._on_equipment_click, slot, hover=item)
+            y -= row_height
 
         # Potions et buffs (gauche, en dessous équipement)
         potion_y = y - 30
-        arcade.draw_text("Potions", equip_x, potion_y, self.COLOR_HIGHLIGHT, 14, bold=True)
+        self._draw_text("Potions", equip_x, potion_y, self.COLOR_HIGHLIGHT, 14, bold=True)
         potion_y -= 25
 
         if self.player.potions:
-            for potion_id, qty in list(self.player.potions.items())[:5]:  # Afficher 5 premières
+            for potion_id, qty in list(self.player.potions.items())[:layout.MAX_LISTED_POTIONS]:
                 item_base = self.data.get_item_base(potion_id)
                 potion_name = item_base.get("name", potion_id) if item_base else potion_id
-                arcade.draw_text(f"[{qty}x] {potion_name}", equip_x, potion_y, (100, 200, 255), 10)
-                potion_y -= 18
+                self._draw_text(f"[{qty}x] {potion_name}", equip_x, potion_y, (100, 200, 255), 10)
+                self.hit_regions.add(equip_x, equip_x + layout.EQUIPMENT_ROW_WIDTH,
+                                     potion_y - 5, potion_y - 5 + layout.POTION_ROW_HEIGHT,
+                                     self._on_potion_click, potion_id)
+                potion_y -= layout.POTION_ROW_HEIGHT
         else:
-            arcade.draw_text("Aucune potion", equip_x, potion_y, self.COLOR_TEXT_DIM, 10)
+            self._draw_text("Aucune potion", equip_x, potion_y, self.COLOR_TEXT_DIM, 10)
 
         # Buffs actifs
         if self.player.buffs:
             buff_y = potion_y - 20
-            arcade.draw_text("Buffs actifs:", equip_x, buff_y, self.COLOR_HIGHLIGHT, 12, bold=True)
+            self._draw_text("Buffs actifs:", equip_x, buff_y, self.COLOR_HIGHLIGHT, 12, bold=True)
             buff_y -= 20
 
             for buff in self.player.buffs[:3]:  # Afficher 3 premiers buffs
                 buff_type = buff.get("type")
                 buff_value = buff.get("value")
                 time_left = int(buff.get("remaining", 0))
-                arcade.draw_text(f"+{buff_value} {buff_type} ({time_left}s)",
+                self._draw_text(f"+{buff_value} {buff_type} ({time_left}s)",
                                equip_x, buff_y, (255, 200, 100), 10)
                 buff_y -= 18
         else:
-            arcade.draw_text("Aucun buff actif", equip_x, potion_y - 20, self.COLOR_TEXT_DIM, 10)
+            self._draw_text("Aucun buff actif", equip_x, potion_y - 20, self.COLOR_TEXT_DIM, 10)
 
         # Inventaire (centre-droit)
-        inv_x = 350
+        inv_x = layout.INVENTORY_X
         inv_y = height - 50
 
-        arcade.draw_text(f"Inventaire ({len(self.player.inventory)}/{self.player.inventory_size})",
+        self._draw_text(f"Inventaire ({len(self.player.inventory)}/{self.player.inventory_size})",
                         inv_x, inv_y, self.COLOR_HIGHLIGHT, 16, bold=True)
 
-        # Grille d'inventaire
-        cols = 5
-        item_size = 60
-        spacing = 10
+        # Grille d'inventaire (une seule zone, case résolue par arithmétique)
+        cols = layout.INVENTORY_COLS
+        item_size = layout.INVENTORY_CELL
+        spacing = layout.INVENTORY_SPACING
+        self.hit_regions.add_grid(inv_x, inv_y - 40 + item_size, cols, item_size, item_size, spacing,
+                                  tuple(self.player.inventory), self._on_inventory_item_click,
+                                  hover_payloads=True)
 
         for i, item in enumerate(self.player.inventory):
             row = i // cols
@@ -788,17 +990,17 @@ class GameView(arcade.View):
 
             # Case d'item
             rarity_color = self.RARITY_COLORS.get(item.rarity_id, self.COLOR_TEXT)
-            arcade.draw_lrbt_rectangle_filled(x, x + item_size, y, y + item_size, self.COLOR_PANEL)
-            arcade.draw_lrbt_rectangle_outline(x, x + item_size, y, y + item_size, rarity_color, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(x, x + item_size, y, y + item_size, self.COLOR_PANEL)
+            self._shape_layer.draw_lrbt_rectangle_outline(x, x + item_size, y, y + item_size, rarity_color, 2)
 
             # Icône simplifiée (première lettre du slot)
             icon = item.slot[0].upper()
-            arcade.draw_text(icon, x + item_size // 2, y + item_size // 2 - 8,
+            self._draw_text(icon, x + item_size // 2, y + item_size // 2 - 8,
                            rarity_color, 20, bold=True, anchor_x="center")
 
         # Ressources (bas) - Couleurs selon rareté
         res_y = 200
-        arcade.draw_text("Ressources:", 50, res_y, self.COLOR_HIGHLIGHT, 14, bold=True)
+        self._draw_text("Ressources:", 50, res_y, self.COLOR_HIGHLIGHT, 14, bold=True)
 
         res_x = 50
         res_y -= 25
@@ -818,59 +1020,29 @@ class GameView(arcade.View):
             res_rarity = res_data.get("rarity", "commun") if res_data else "commun"
 
             color = rarity_colors_res.get(res_rarity, self.COLOR_TEXT)
-            arcade.draw_text(f"{res_name}: {quantity}", res_x + col * 210, res_y - (col // 4) * 18,
+            self._draw_text(f"{res_name}: {quantity}", res_x + col * 210, res_y - (col // 4) * 18,
                            color, 9)
             col += 1
 
     def _draw_bar(self, x, y, width, height, percent, color, bg_color):
         """Dessine une barre de progression"""
-        # Fond
-        arcade.draw_lrbt_rectangle_filled(x, x + width, y, y + height, bg_color)
-
-        # Remplissage
-        fill_width = width * max(0.0, min(1.0, percent))
-        if fill_width > 0:
-            arcade.draw_lrbt_rectangle_filled(x, x + fill_width, y, y + height, color)
+        # Fond et bordure: formes fixes de la couche
+        self._shape_layer.draw_lrbt_rectangle_filled(x, x + width, y, y + height, bg_color)
+        self._shape_layer.draw_lrbt_rectangle_outline(x, x + width, y, y + height, self.COLOR_BORDER, 2)
 
-        # Bordure
-        arcade.draw_lrbt_rectangle_outline(x, x + width, y, y + height, self.COLOR_BORDER, 2)
+        # Remplissage dans un batch à part (change à chaque coup), à l'intérieur de la
+        # bordure (épaisseur 2 centrée sur le bord) puisqu'il est dessiné après elle
+        fill_right = min(x + width * max(0.0, min(1.0, percent)), x + width - 1)
+        if fill_right > x + 1:
+            self._bar_layer.draw_lrbt_rectangle_filled(x + 1, fill_right, y + 1, y + height - 1, color)
 
     def on_mouse_press(self, x, y, button, modifiers):
-        """Gère les clics de souris"""
-        width = self.window.width
-        height = self.window.height
-
-        # Navigation buttons
-        if y < 50:
-            button_width = width // 5  # 5 boutons maintenant
-            button_index = int(x // button_width)
-            modes = ["combat", "gathering", "crafting", "inventory", "upgrades"]
-            if 0 <= button_index < len(modes):
-                self.current_mode = modes[button_index]
-
-                # Respawn nodes si on va sur gathering
-                if self.current_mode == "gathering":
-                    if not self.gathering.active_nodes:
-                        self.gathering.spawn_nodes_for_zone(self.player.current_zone_id, 5)
-
-                # Redémarrer un combat si on revient sur combat et qu'il n'y en a pas
-                elif self.current_mode == "combat":
-                    if not self.combat.combat_active:
-                        self.combat.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
-
-                return
-
-        # Clics spécifiques selon le mode
-        if self.current_mode == "combat":
-            self._handle_combat_click(x, y, button)
-        elif self.current_mode == "gathering":
-            self._handle_gathering_click(x, y, button)
-        elif self.current_mode == "crafting":
-            self._handle_crafting_click(x, y, button)
-        elif self.current_mode == "inventory":
-            self._handle_inventory_click(x, y, button)
-        elif self.current_mode == "upgrades":
-            self._handle_upgrades_click(x, y, button)
+        """Gère les clics de souris via les zones enregistrées au dernier dessin"""
+        self._mouse_x, self._mouse_y = x, y
+        hit = self.hit_regions.hit(x, y)
+        if hit and hit[0]:
+            action, payload, _ = hit
+            action(payload, button)
 
     def on_mouse_release(self, x, y, button, modifiers):
         """Stoppe un éventuel drag de scrollbar."""
@@ -885,289 +1057,126 @@ class GameView(arcade.View):
 
     def on_mouse_motion(self, x, y, dx, dy):
         """Gère le survol pour les tooltips d'items."""
+        self._mouse_x, self._mouse_y = x, y
+        hit = self.hit_regions.hit(x, y)
+        item = hit[2] if hit else None
+        self.hovered_item = (item, x, y) if item else None
+
+    def _on_nav_click(self, mode: str, button):
+        """Bouton de navigation"""
+        self.current_mode = mode
+
+        # Les zones du mode précédent ne sont plus affichées
+        self.hit_regions.clear()
         self.hovered_item = None
-        height = self.window.height - 150
 
-        # Survol équipement
-        equip_x = 50
-        equip_y = height - 50
-        slot_names = {
-            "weapon": "Arme",
-            "helmet": "Casque",
-            "chest": "Armure",
-            "legs": "Jambes",
-            "boots": "Bottes",
-            "gloves": "Gants",
-            "ring1": "Anneau 1",
-            "ring2": "Anneau 2",
-            "amulet": "Amulette"
-        }
-        y_pos = equip_y - 30
-        for slot in slot_names.keys():
-            if equip_x <= x <= equip_x + 250 and y_pos - 25 <= y <= y_pos:
-                item = self.player.equipment.get(slot)
-                if item:
-                    self.hovered_item = (item, x, y)
-                    return
-            y_pos -= 25
-
-        # Survol inventaire
-        inv_x = 350
-        inv_y = height - 50
-        cols = 5
-        item_size = 60
-        spacing = 10
-        for i, item in enumerate(self.player.inventory):
-            row = i // cols
-            col = i % cols
-            ix = inv_x + col * (item_size + spacing)
-            iy = inv_y - 40 - row * (item_size + spacing)
-            if ix <= x <= ix + item_size and iy <= y <= iy + item_size:
-                self.hovered_item = (item, x, y)
-                return
-
-    def _handle_combat_click(self, x, y, button):
-        """Gère les clics en mode combat"""
+        # Respawn nodes si on va sur gathering
+        if self.current_mode == "gathering":
+            if not self.gathering.active_nodes:
+                self.gathering.spawn_nodes_for_zone(self.player.current_zone_id, 5)
+
+        # Redémarrer un combat si on revient sur combat et qu'il n'y en a pas
+        elif self.current_mode == "combat":
+            if not self.combat.combat_active:
+                self.combat.start_combat(self.player.current_zone_id, self.player, spawn_boss=False)
+
+    def _on_combat_button(self, name: str, button):
+        """Boutons de la vue combat (actions et sélection de zone)"""
         if button != arcade.MOUSE_BUTTON_LEFT:
             return
-        width = self.window.width
-        height = self.window.height - 150
 
-        combat_y = height - 200
-        button_y = combat_y - 180
-        button_width = 140
-        button_height = 45
-        button_spacing = 15
-
-        # Bouton PAUSE
-        pause_button_x = width - 500
-        if (pause_button_x <= x <= pause_button_x + button_width and
-            button_y <= y <= button_y + button_height):
+        if name == "pause":
             if self.combat.combat_active:
                 self.combat.toggle_pause()
-            return
-
-        # Bouton FUIR
-        flee_button_x = pause_button_x + button_width + button_spacing
-        if (flee_button_x <= x <= flee_button_x + button_width and
-            button_y <= y <= button_y + button_height):
+        elif name == "flee":
             if self.combat.combat_active:
                 self.combat.flee_combat(self.player)
-            return
-
-        # Bouton SPAWN BOSS
-        boss_button_x = flee_button_x + button_width + button_spacing
-        if (boss_button_x <= x <= boss_button_x + button_width and
-            button_y <= y <= button_y + button_height):
+        elif name == "boss":
             # Spawn un boss
             self.combat.combat_active = False
             self.combat.start_combat(self.player.current_zone_id, self.player, spawn_boss=True)
-            return
-
-        # Boutons de changement de zone (en bas à droite)
-        zone_panel_width = 400
-        zone_panel_x = width - zone_panel_width - 20
-        zone_panel_y = 70
-        zone_btn_width = 120
-        zone_btn_height = 35
-        zone_btn_y = zone_panel_y + 20
-
-        # Bouton ZONE PRÉCÉDENTE
-        prev_btn_x = zone_panel_x + 20
-        if (prev_btn_x <= x <= prev_btn_x + zone_btn_width and
-            zone_btn_y <= y <= zone_btn_y + zone_btn_height):
+        elif name == "zone_prev":
             self._change_zone(-1)
-            return
-
-        # Bouton ZONE SUIVANTE
-        next_btn_x = prev_btn_x + zone_btn_width + 20
-        if (next_btn_x <= x <= next_btn_x + zone_btn_width and
-            zone_btn_y <= y <= zone_btn_y + zone_btn_height):
+        elif name == "zone_next":
             # Vérifier si on peut accéder à la zone suivante
             zones = self.data.zones
-            current_idx = next((i for i, z in enumerate(zones) if z["id"] == self.player.current_zone_id), 0)
+            current_idx = self.data.get_zone_index(self.player.current_zone_id)
             next_zone = zones[(current_idx + 1) % len(zones)]
 
             if self.player.level >= next_zone.get("level_requirement", 1):
                 self._change_zone(1)
             else:
                 print(f"Zone verrouillée! Requis: Level {next_zone.get('level_requirement', 1)}")
-            return
 
-    def _handle_gathering_click(self, x, y, button):
-        """Gère les clics en mode récolte"""
+    def _on_node_click(self, node_index: int, button):
+        """Clic sur un node de récolte"""
         if button != arcade.MOUSE_BUTTON_LEFT:
             return
-        width = self.window.width
-        height = self.window.height - 150
-
-        nodes = self.gathering.get_nodes_status()
-        cols = 3
-        node_width = 250
-        node_height = 120
-        spacing = 20
-
-        start_x = (width - (cols * node_width + (cols - 1) * spacing)) // 2
-        start_y = height - 100
+        reward = self.gathering.harvest_node(node_index, self.player)
+        if reward:
+            print(f"Récolté: {reward['quantity']}x {reward['resource_id']} (+{reward['xp']} XP)")
 
-        for i, node_status in enumerate(nodes):
-            if node_status["depleted"]:
-                continue
-
-            row = i // cols
-            col = i % cols
-
-            nx = start_x + col * (node_width + spacing)
-            ny = start_y - row * (node_height + spacing)
-
-            if nx <= x <= nx + node_width and ny <= y <= ny + node_height:
-                # Clic sur ce node
-                reward = self.gathering.harvest_node(i, self.player)
-                if reward:
-                    print(f"Récolté: {reward['quantity']}x {reward['resource_id']} (+{reward['xp']} XP)")
-                break
-
-    def _handle_crafting_click(self, x, y, button):
-        """Gère les clics en mode crafting"""
+    def _on_recipe_scrollbar_press(self, _, button):
+        """Début de drag sur la scrollbar des recettes"""
         if button != arcade.MOUSE_BUTTON_LEFT:
             return
-        width = self.window.width
-        height = self.window.height - 150
-
         ctx = self._recipe_scroll_context()
-        if self._is_on_recipe_scrollbar(x, y, ctx):
-            self._start_recipe_drag(x, y, ctx)
-            return
-
-        recipes = ctx["recipes"]
-        recipe_y = ctx["recipe_y"]
-        recipe_width = ctx["recipe_width"]
-        recipe_height = ctx["recipe_height"]
-        recipe_x = ctx["recipe_x"]
-        max_display = ctx["max_display"]
-
-        # Utiliser le même offset que pour l'affichage
-        displayed_recipes = recipes[self.recipe_scroll_offset:self.recipe_scroll_offset + max_display]
-        for i, recipe_info in enumerate(displayed_recipes):
-            if not recipe_info["can_craft"]:
-                continue
+        self._start_recipe_drag(self._mouse_x, self._mouse_y, ctx)
 
-            ry = recipe_y - i * (recipe_height + 10)
-
-            if recipe_x <= x <= recipe_x + recipe_width and ry <= y <= ry + recipe_height:
-                # Craft!
-                item = self.crafting.craft_item(recipe_info["recipe"]["id"], self.player)
-                if item:
-                    self.player.add_item_to_inventory(item)
-                    print(f"Crafté: {item.name}")
-                break
-
-    def _handle_inventory_click(self, x, y, button):
-        """Gère les clics en mode inventaire"""
-        height = self.window.height - 150
-        equip_x = 50
+    def _on_recipe_click(self, row, button):
+        """Clic sur une recette: craft si possible"""
+        if button != arcade.MOUSE_BUTTON_LEFT or not row.can_craft:
+            return
+        item = self.crafting.craft_item(row.recipe["id"], self.player)
+        if item:
+            self.player.add_item_to_inventory(item)
+            print(f"Crafté: {item.name}")
+
+    def _on_equipment_click(self, slot: str, button):
+        """Clic droit sur un emplacement d'équipement: déséquiper"""
+        if button != arcade.MOUSE_BUTTON_RIGHT:
+            return
+        item = self.player.unequip_item(slot)
+        if item:
+            self.player.add_item_to_inventory(item)
+            print(f"Déséquipé: {item.name}")
 
-        # Clic droit sur équipement pour déséquiper
-        if button == arcade.MOUSE_BUTTON_RIGHT:
-            equip_y = height - 50
-            slot_names = {
-                "weapon": "Arme",
-                "helmet": "Casque",
-                "chest": "Armure",
-                "legs": "Jambes",
-                "boots": "Bottes",
-                "gloves": "Gants",
-                "ring1": "Anneau 1",
-                "ring2": "Anneau 2",
-                "amulet": "Amulette"
-            }
-
-            y_pos = equip_y - 30
-            for slot, label in slot_names.items():
-                if equip_x <= x <= equip_x + 250 and y_pos - 25 <= y <= y_pos:
-                    item = self.player.equipment.get(slot)
-                    if item:
-                        # Déséquiper l'item
-                        self.player.equipment[slot] = None
-                        item.is_equipped = False
-                        self.player.add_item_to_inventory(item)
-                        print(f"Déséquipé: {item.name}")
-                        return
-                y_pos -= 25
-
-            # Clic droit sur inventaire pour inspecter
-            inv_x = 350
-            inv_y = height - 50
-            cols = 5
-            item_size = 60
-            spacing = 10
-
-            for i, item in enumerate(self.player.inventory):
-                row = i // cols
-                col = i % cols
-                ix = inv_x + col * (item_size + spacing)
-                iy = inv_y - 40 - row * (item_size + spacing)
-
-                if ix <= x <= ix + item_size and iy <= y <= iy + item_size:
-                    # Afficher stats de l'item
-                    print(f"\n=== {item.name} ===")
-                    print(f"Tier: {item.tier} | Rareté: {item.rarity_id} | Qualité: {item.quality_id}")
-                    stats = item.get_total_stats()
-                    if stats.atk > 0: print(f"ATK: +{stats.atk}")
-                    if stats.def_stat > 0: print(f"DEF: +{stats.def_stat}")
-                    if stats.hp_max > 0: print(f"HP Max: +{stats.hp_max}")
-                    if stats.crit_chance > 0: print(f"Crit: +{stats.crit_chance}%")
-                    if stats.crit_dmg > 0: print(f"Crit Dmg: +{stats.crit_dmg}%")
-                    if item.affixes:
-                        print("Affixes:")
-                        for affix in item.affixes:
-                            affix_data = self.data.get_affix(affix["affix_id"])
-                            print(f"  - {affix_data.get('name', 'Unknown')}: +{affix['rolled_value']}")
-                    print(f"Valeur: {item.gold_value} or")
-                    return
-
-        # Clic gauche - potions et équiper items
+    def _on_potion_click(self, potion_id: str, button):
+        """Clic gauche sur une potion: l'utiliser"""
         if button != arcade.MOUSE_BUTTON_LEFT:
             return
+        item_base = self.data.get_item_base(potion_id)
+        if item_base and self.player.use_potion(potion_id, item_base):
+            print(f"Utilisé: {item_base.get('name', potion_id)}")
 
-        # Vérifier clics sur les potions (gauche, sous équipement)
-        # Calculer la position Y approximative des potions
-        potion_start_y = height - 50 - (9 * 25) - 30 - 25  # équipement + marge + titre potions
-        potion_height = 18
-
-        potion_list = list(self.player.potions.items())[:5]
-        for i, (potion_id, qty) in enumerate(potion_list):
-            py = potion_start_y - i * potion_height
-            if equip_x <= x <= equip_x + 250 and py - potion_height <= y <= py:
-                # Utiliser la potion
-                item_base = self.data.get_item_base(potion_id)
-                if item_base and self.player.use_potion(potion_id, item_base):
-                    print(f"Utilisé: {item_base.get('name', potion_id)}")
-                return
-
-        # Clics sur l'inventaire normal
-        inv_x = 350
-        inv_y = height - 50
-
-        cols = 5
-        item_size = 60
-        spacing = 10
+    def _on_inventory_item_click(self, item, button):
+        """Clic sur une case d'inventaire: gauche équipe, droit inspecte"""
+        if item not in self.player.inventory:
+            return  # Déjà déplacé depuis le dernier dessin
 
-        for i, item in enumerate(self.player.inventory):
-            row = i // cols
-            col = i % cols
-
-            ix = inv_x + col * (item_size + spacing)
-            iy = inv_y - 40 - row * (item_size + spacing)
-
-            if ix <= x <= ix + item_size and iy <= y <= iy + item_size:
-                # Équiper l'item
-                old_item = self.player.equip_item(item)
-                self.player.inventory.remove(item)
-                if old_item:
-                    self.player.add_item_to_inventory(old_item)
-                print(f"Équipé: {item.name}")
-                break
+        if button == arcade.MOUSE_BUTTON_RIGHT:
+            # Afficher stats de l'item
+            print(f"\n=== {item.name} ===")
+            print(f"Tier: {item.tier} | Rareté: {item.rarity_id} | Qualité: {item.quality_id}")
+            stats = item.get_total_stats()
+            if stats.atk > 0: print(f"ATK: +{stats.atk}")
+            if stats.def_stat > 0: print(f"DEF: +{stats.def_stat}")
+            if stats.hp_max > 0: print(f"HP Max: +{stats.hp_max}")
+            if stats.crit_chance > 0: print(f"Crit: +{stats.crit_chance}%")
+            if stats.crit_dmg > 0: print(f"Crit Dmg: +{stats.crit_dmg}%")
+            if item.affixes:
+                print("Affixes:")
+                for affix in item.affixes:
+                    affix_data = self.data.get_affix(affix["affix_id"])
+                    print(f"  - {affix_data.get('name', 'Unknown')}: +{affix['rolled_value']}")
+            print(f"Valeur: {item.gold_value} or")
+        elif button == arcade.MOUSE_BUTTON_LEFT:
+            # Équiper l'item
+            old_item = self.player.equip_item(item)
+            self.player.inventory.remove(item)
+            if old_item:
+                self.player.add_item_to_inventory(old_item)
+            print(f"Équipé: {item.name}")
 
     def on_key_press(self, symbol, modifiers):
         """Gère les touches du clavier"""
@@ -1176,21 +1185,30 @@ class GameView(arcade.View):
             self.save.save_game(self.player, self.skills, self.station_upgrades)
             print("Jeu sauvegardé manuellement")
 
+        # Overlay de debug
+        if symbol == arcade.key.F3:
+            self.show_debug_overlay = not self.show_debug_overlay
+
+        # Profilage: F8 active/désactive la collecte, F9 écrit le rapport JSON
+        if symbol == arcade.key.F8:
+            print(f"Profilage {'activé' if profiler.toggle() else 'désactivé'}")
+        elif symbol == arcade.key.F9:
+            if not profiler.dump():
+                print("Aucune mesure de profilage (F8 pour activer)")
+
         # Scroller les recettes avec UP/DOWN (si en mode crafting)
         if self.current_mode == "crafting":
             if symbol == arcade.key.UP:
                 self.recipe_scroll_offset = max(0, self.recipe_scroll_offset - 1)
             elif symbol == arcade.key.DOWN:
-                recipes = self.crafting.get_available_recipes(self.player)
-                max_offset = max(0, len(recipes) - 8)
+                max_offset = max(0, self.recipe_list.refresh(self.player) - layout.RECIPE_MAX_DISPLAY)
                 self.recipe_scroll_offset = min(max_offset, self.recipe_scroll_offset + 1)
 
     def on_mouse_scroll(self, x, y, scroll_x, scroll_y):
         """Gère le scroll de la molette de la souris"""
         # Scroll dans le craft
         if self.current_mode == "crafting":
-            recipes = self.crafting.get_available_recipes(self.player)
-            max_offset = max(0, len(recipes) - 8)
+            max_offset = max(0, self.recipe_list.refresh(self.player) - layout.RECIPE_MAX_DISPLAY)
 
             # scroll_y > 0 = scroll up, scroll_y < 0 = scroll down
             self.recipe_scroll_offset -= int(scroll_y)
@@ -1199,7 +1217,7 @@ class GameView(arcade.View):
     def _change_zone(self, direction: int):
         """Change de zone"""
         zones = self.data.zones
-        current_index = next((i for i, z in enumerate(zones) if z["id"] == self.player.current_zone_id), 0)
+        current_index = self.data.get_zone_index(self.player.current_zone_id)
 
         new_index = (current_index + direction) % len(zones)
         new_zone_id = zones[new_index]["id"]
@@ -1224,29 +1242,29 @@ class GameView(arcade.View):
         height = self.window.height - 150
 
         # Titre
-        arcade.draw_text("SKILLS & UPGRADES", width // 2, height - 20,
+        self._draw_text("SKILLS & UPGRADES", width // 2, height - 20,
                         self.COLOR_HIGHLIGHT, 20, bold=True, anchor_x="center")
 
         # Colonne gauche: Skills
         skill_x = 50
         skill_y = height - 60
 
-        arcade.draw_text("COMPETENCES", skill_x, skill_y, self.COLOR_HIGHLIGHT, 16, bold=True)
+        self._draw_text("COMPETENCES", skill_x, skill_y, self.COLOR_HIGHLIGHT, 16, bold=True)
         skill_y -= 30
 
         # Skills deja debloques
         unlocked_skills = self.skills.get_unlocked_skills()
         if unlocked_skills:
-            arcade.draw_text("Actives:", skill_x, skill_y, (100, 200, 100), 12, bold=True)
+            self._draw_text("Actives:", skill_x, skill_y, (100, 200, 100), 12, bold=True)
             skill_y -= 20
             for skill in unlocked_skills[:3]:
-                arcade.draw_text(f"[OK] {skill['name']}", skill_x + 10, skill_y, (100, 200, 100), 10)
+                self._draw_text(f"[OK] {skill['name']}", skill_x + 10, skill_y, (100, 200, 100), 10)
                 skill_y -= 16
             skill_y -= 10
 
         # Skills disponibles
         available_skills = self.skills.get_available_skills(self.player)
-        arcade.draw_text("Disponibles:", skill_x, skill_y, self.COLOR_TEXT, 12, bold=True)
+        self._draw_text("Disponibles:", skill_x, skill_y, self.COLOR_TEXT, 12, bold=True)
         skill_y -= 25
 
         for i, skill_info in enumerate(available_skills[:5]):
@@ -1258,28 +1276,29 @@ class GameView(arcade.View):
             panel_y = skill_y - panel_height
 
             color = self.COLOR_PANEL_LIGHT if can_unlock else self.COLOR_PANEL
-            arcade.draw_lrbt_rectangle_filled(skill_x, skill_x + panel_width,
-                                             panel_y, skill_y, color)
-            arcade.draw_lrbt_rectangle_outline(skill_x, skill_x + panel_width,
-                                              panel_y, skill_y, self.COLOR_BORDER, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(skill_x, skill_x + panel_width,
+                                                        panel_y, skill_y, color)
+            self._shape_layer.draw_lrbt_rectangle_outline(skill_x, skill_x + panel_width,
+                                                         panel_y, skill_y, self.COLOR_BORDER, 2)
+            self.hit_regions.add(skill_x, skill_x + panel_width, panel_y, skill_y, self._on_skill_click, skill_info)
 
             # Nom + type
             type_colors = {"combat": (255, 100, 100), "crafting": (100, 200, 255), 
                            "gathering": (100, 255, 100), "general": (255, 200, 100)}
             type_color = type_colors.get(skill.get("type"), self.COLOR_TEXT)
 
-            arcade.draw_text(skill["name"], skill_x + 5, skill_y - 20, type_color, 12, bold=True)
-            arcade.draw_text(f"[{skill['type']}]", skill_x + 5, skill_y - 35, type_color, 9)
+            self._draw_text(skill["name"], skill_x + 5, skill_y - 20, type_color, 12, bold=True)
+            self._draw_text(f"[{skill['type']}]", skill_x + 5, skill_y - 35, type_color, 9)
 
             # Description
-            arcade.draw_text(skill["desc"], skill_x + 5, skill_y - 52, self.COLOR_TEXT_DIM, 9)
+            self._draw_text(skill["desc"], skill_x + 5, skill_y - 52, self.COLOR_TEXT_DIM, 9)
 
             # Status
             if can_unlock:
-                arcade.draw_text("[CLIQUER POUR DEBLOQUER]", skill_x + panel_width - 140,
+                self._draw_text("[CLIQUER POUR DEBLOQUER]", skill_x + panel_width - 140,
                                skill_y - 70, self.COLOR_HIGHLIGHT, 9)
             else:
-                arcade.draw_text(skill_info["reason"], skill_x + panel_width - 140,
+                self._draw_text(skill_info["reason"], skill_x + panel_width - 140,
                                skill_y - 70, self.COLOR_TEXT_DIM, 8)
 
             skill_y -= panel_height + 10
@@ -1288,7 +1307,7 @@ class GameView(arcade.View):
         station_x = width - 550
         station_y = height - 60
 
-        arcade.draw_text("AMELIORATIONS DE STATIONS", station_x, station_y,
+        self._draw_text("AMELIORATIONS DE STATIONS", station_x, station_y,
                         self.COLOR_HIGHLIGHT, 16, bold=True)
         station_y -= 30
 
@@ -1308,81 +1327,46 @@ class GameView(arcade.View):
             panel_y = station_y - panel_height
 
             color = self.COLOR_PANEL_LIGHT if can_upgrade else self.COLOR_PANEL
-            arcade.draw_lrbt_rectangle_filled(station_x, station_x + panel_width,
-                                             panel_y, station_y, color)
-            arcade.draw_lrbt_rectangle_outline(station_x, station_x + panel_width,
-                                              panel_y, station_y, self.COLOR_BORDER, 2)
+            self._shape_layer.draw_lrbt_rectangle_filled(station_x, station_x + panel_width,
+                                                        panel_y, station_y, color)
+            self._shape_layer.draw_lrbt_rectangle_outline(station_x, station_x + panel_width,
+                                                         panel_y, station_y, self.COLOR_BORDER, 2)
+            self.hit_regions.add(station_x, station_x + panel_width, panel_y, station_y,
+                                 self._on_station_upgrade_click, upgrade_info)
 
             # Nom station + level
-            arcade.draw_text(f"{station_name} LVL {current_level} -> {upgrade['level']}",
+            self._draw_text(f"{station_name} LVL {current_level} -> {upgrade['level']}",
                            station_x + 5, station_y - 20, self.COLOR_HIGHLIGHT, 12, bold=True)
 
             # Nom upgrade
-            arcade.draw_text(upgrade["name"], station_x + 5, station_y - 38,
+            self._draw_text(upgrade["name"], station_x + 5, station_y - 38,
                            self.COLOR_TEXT, 10)
 
             # Bonus
             bonus_text = "Bonus: " + ", ".join([f"+{v} {k}" for k, v in upgrade.get("bonus", {}).items()])
-            arcade.draw_text(bonus_text, station_x + 5, station_y - 55,
+            self._draw_text(bonus_text, station_x + 5, station_y - 55,
                            (100, 200, 255), 9)
 
             # Status
             if can_upgrade:
-                arcade.draw_text("[CLIQUER POUR AMELIORER]", station_x + panel_width - 160,
+                self._draw_text("[CLIQUER POUR AMELIORER]", station_x + panel_width - 160,
                                station_y - 75, self.COLOR_HIGHLIGHT, 9)
             else:
-                arcade.draw_text(upgrade_info["reason"], station_x + panel_width - 160,
+                self._draw_text(upgrade_info["reason"], station_x + panel_width - 160,
                                station_y - 75, self.COLOR_TEXT_DIM, 8)
 
             station_y -= panel_height + 10
 
-    def _handle_upgrades_click(self, x, y, button):
-        """Gère les clics en mode upgrades"""
-        if button != arcade.MOUSE_BUTTON_LEFT:
+    def _on_skill_click(self, skill_info, button):
+        """Clic sur un skill disponible: le débloquer"""
+        if button != arcade.MOUSE_BUTTON_LEFT or not skill_info["can_unlock"]:
             return
-        width = self.window.width
-        height = self.window.height - 150
+        if self.skills.unlock_skill(skill_info["skill"]["id"], self.player):
+            print(f"Skill debloque: {skill_info['skill']['name']}")
 
-        # Skills (gauche)
-        skill_x = 50
-        skill_y = height - 90
-        unlocked_count = len(self.skills.get_unlocked_skills())
-        if unlocked_count > 0:
-            skill_y -= 20 + unlocked_count * 16 + 10
-        skill_y -= 25
-
-        available_skills = self.skills.get_available_skills(self.player)
-        panel_width = 350
-        panel_height = 80
-
-        for i, skill_info in enumerate(available_skills[:5]):
-            panel_y = skill_y - panel_height
-
-            if (skill_x <= x <= skill_x + panel_width and
-                panel_y <= y <= skill_y):
-                if skill_info["can_unlock"]:
-                    if self.skills.unlock_skill(skill_info["skill"]["id"], self.player):
-                        print(f"Skill debloque: {skill_info['skill']['name']}")
-                return
-
-            skill_y -= panel_height + 10
-
-        # Station Upgrades (droite)
-        station_x = width - 550
-        station_y = height - 90
-
-        available_upgrades = self.station_upgrades.get_available_upgrades(self.player)
-        panel_width = 500
-        panel_height = 90
-
-        for i, upgrade_info in enumerate(available_upgrades[:6]):
-            panel_y = station_y - panel_height
-
-            if (station_x <= x <= station_x + panel_width and
-                panel_y <= y <= station_y):
-                if upgrade_info["can_upgrade"]:
-                    if self.station_upgrades.upgrade_station(upgrade_info["station_id"], self.player):
-                        print(f"Station amelioree: {upgrade_info['station_id']} -> LVL {upgrade_info['current_level'] + 1}")
-                return
-
-            station_y -= panel_height + 10
+    def _on_station_upgrade_click(self, upgrade_info, button):
+        """Clic sur une amélioration de station"""
+        if button != arcade.MOUSE_BUTTON_LEFT or not upgrade_info["can_upgrade"]:
+            return
+        if self.station_upgrades.upgrade_station(upgrade_info["station_id"], self.player):
+            print(f"Station amelioree: {upgrade_info['station_id']} -> LVL {upgrade_info['current_level'] + 1}")
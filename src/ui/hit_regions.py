@@ -0,0 +1,142 @@
+"""
+Zones cliquables - Registre rempli pendant le dessin, interrogé par la souris
+
+Chaque passe de dessin enregistre ses rectangles (boutons, panneaux, cases) avec
+l'action à appeler. Les événements souris résolvent ensuite la zone sous le
+pointeur via une grille uniforme: seules les zones de la cellule visée sont
+testées, et une grille de cases (inventaire) se résout par simple arithmétique.
+La zone enregistrée en dernier (dessinée au-dessus) est prioritaire.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# (action, payload, item survolé)
+Hit = Tuple[Optional[Callable], Any, Any]
+
+
+class _RectRegion:
+    """Rectangle associé à une action"""
+
+    __slots__ = ("left", "right", "bottom", "top", "action", "payload", "hover")
+
+    def __init__(self, left: float, right: float, bottom: float, top: float,
+                 action: Optional[Callable], payload: Any, hover: Any):
+        self.left = left
+        self.right = right
+        self.bottom = bottom
+        self.top = top
+        self.action = action
+        self.payload = payload
+        self.hover = hover
+
+    def resolve(self, x: float, y: float) -> Optional[Hit]:
+        if self.left <= x <= self.right and self.bottom <= y <= self.top:
+            return self.action, self.payload, self.hover
+        return None
+
+
+class _GridRegion:
+    """Grille de cases de même taille, remplies ligne par ligne depuis le haut à gauche"""
+
+    __slots__ = ("left", "right", "bottom", "top", "cols", "cell_width", "cell_height",
+                 "spacing", "payloads", "action", "hover_payloads")
+
+    def __init__(self, left: float, top: float, cols: int, cell_width: float, cell_height: float,
+                 spacing: float, payloads: Sequence, action: Optional[Callable], hover_payloads: bool):
+        rows = (len(payloads) + cols - 1) // cols
+        self.left = left
+        self.top = top
+        self.right = left + cols * (cell_width + spacing) - spacing
+        self.bottom = top - rows * (cell_height + spacing) + spacing
+        self.cols = cols
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.spacing = spacing
+        self.payloads = payloads
+        self.action = action
+        self.hover_payloads = hover_payloads
+
+    def resolve(self, x: float, y: float) -> Optional[Hit]:
+        if not (self.left <= x <= self.right and self.bottom <= y <= self.top):
+            return None
+
+        # Case visée par arithmétique, puis rejet des espacements entre cases
+        col, dx = divmod(x - self.left, self.cell_width + self.spacing)
+        row, dy = divmod(self.top - y, self.cell_height + self.spacing)
+        if dx > self.cell_width or dy > self.cell_height:
+            return None
+
+        index = int(row) * self.cols + int(col)
+        if int(col) >= self.cols or index >= len(self.payloads):
+            return None
+        payload = self.payloads[index]
+        return self.action, payload, payload if self.hover_payloads else None
+
+
+class HitRegions:
+    """Registre des zones cliquables d'une frame"""
+
+    def __init__(self, cell_size: int = 64):
+        """
+        Args:
+            cell_size: Taille (px) des cellules de la grille uniforme
+        """
+        self.cell_size = cell_size
+        self._regions: List = []
+        self._cells: Dict[Tuple[int, int], List] = {}
+
+    def __len__(self) -> int:
+        return len(self._regions)
+
+    def clear(self):
+        """Oublie toutes les zones (début de la passe de dessin)"""
+        self._regions.clear()
+        self._cells.clear()
+
+    def add(self, left: float, right: float, bottom: float, top: float,
+            action: Optional[Callable] = None, payload: Any = None, hover: Any = None):
+        """
+        Enregistre un rectangle
+
+        Args:
+            action: Appelée par action(payload, button) au clic
+            payload: Donnée passée à l'action
+            hover: Item dont le tooltip s'affiche au survol
+        """
+        self._insert(_RectRegion(left, right, bottom, top, action, payload, hover))
+
+    def add_grid(self, left: float, top: float, cols: int, cell_width: float, cell_height: float,
+                 spacing: float, payloads: Sequence, action: Optional[Callable] = None,
+                 hover_payloads: bool = False):
+        """
+        Enregistre une grille de cases (une case par payload)
+
+        Args:
+            left, top: Coin haut-gauche de la première case
+            hover_payloads: Les payloads sont aussi les items survolés
+        """
+        if payloads:
+            self._insert(_GridRegion(left, top, cols, cell_width, cell_height, spacing,
+                                     payloads, action, hover_payloads))
+
+    def hit(self, x: float, y: float) -> Optional[Hit]:
+        """Zone la plus haute sous le point (action, payload, item survolé), None sinon"""
+        cell = self._cells.get((int(x // self.cell_size), int(y // self.cell_size)))
+        if not cell:
+            return None
+        for region in reversed(cell):
+            result = region.resolve(x, y)
+            if result is not None:
+                return result
+        return None
+
+    def _insert(self, region):
+        """Ajoute une zone aux cellules qu'elle recouvre"""
+        self._regions.append(region)
+        size = self.cell_size
+        for cx in range(int(region.left // size), int(region.right // size) + 1):
+            for cy in range(int(region.bottom // size), int(region.top // size) + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is None:
+                    cell = self._cells[(cx, cy)] = []
+                cell.append(region)
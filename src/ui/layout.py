@@ -0,0 +1,51 @@
+"""
+Constantes de mise en page de GameView
+
+Partagées entre le dessin et les zones cliquables (HitRegions) qu'il enregistre.
+"""
+
+# Boutons de navigation (en bas)
+NAV_HEIGHT = 50
+NAV_BUTTONS = [
+    ("COMBAT", "combat"),
+    ("RÉCOLTE", "gathering"),
+    ("CRAFT", "crafting"),
+    ("INVENTAIRE", "inventory"),
+    ("UPGRADES", "upgrades")
+]
+
+# Équipement (inventaire, colonne gauche)
+EQUIPMENT_SLOTS = {
+    "weapon": "Arme",
+    "helmet": "Casque",
+    "chest": "Armure",
+    "legs": "Jambes",
+    "boots": "Bottes",
+    "gloves": "Gants",
+    "ring1": "Anneau 1",
+    "ring2": "Anneau 2",
+    "amulet": "Amulette"
+}
+EQUIPMENT_X = 50
+EQUIPMENT_ROW_WIDTH = 250
+EQUIPMENT_ROW_HEIGHT = 25
+POTION_ROW_HEIGHT = 18
+MAX_LISTED_POTIONS = 5
+
+# Grille d'inventaire
+INVENTORY_X = 350
+INVENTORY_COLS = 5
+INVENTORY_CELL = 60
+INVENTORY_SPACING = 10
+
+# Grille de nodes de récolte
+NODE_COLS = 3
+NODE_WIDTH = 250
+NODE_HEIGHT = 120
+NODE_SPACING = 20
+
+# Liste de recettes
+RECIPE_WIDTH = 600
+RECIPE_HEIGHT = 70
+RECIPE_SPACING = 10
+RECIPE_MAX_DISPLAY = 8
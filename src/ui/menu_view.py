@@ -1,10 +1,12 @@
 """
-Menu principal : Continuer, Nouvelle partie, Importer.
+Menu principal : Continuer, Emplacements de sauvegarde, Nouvelle partie, Importer.
 """
 
+import time
 import arcade
 import arcade.gui
 from pathlib import Path
+from typing import Dict
 
 
 class MenuView(arcade.View):
@@ -20,6 +22,11 @@ class MenuView(arcade.View):
         self.ui_manager.enable()
 
         self.import_input = arcade.gui.UIInputText(text="", width=320)
+        self.name_input = arcade.gui.UIInputText(text="Aventurier", width=320)
+        self.max_listed_slots = 6
+
+        # Métadonnées des emplacements depuis l'index (aucune sauvegarde n'est ouverte)
+        self.slots = self.save_system.list_slots()
 
         self._build_layout()
 
@@ -52,7 +59,21 @@ class MenuView(arcade.View):
         import_button.on_click = lambda _: self._on_import()
 
         v_box.add(continue_button)
-        v_box.add(new_button)
+
+        # Emplacements de sauvegarde (du plus récent au plus ancien)
+        if self.slots:
+            slots_box = arcade.gui.UIBoxLayout(space_between=4)
+            for slot in self.slots[:self.max_listed_slots]:
+                slot_button = arcade.gui.UIFlatButton(text=self._format_slot(slot), width=520)
+                slot_button.on_click = lambda _, slot_id=slot["slot"]: self._on_load_slot(slot_id)
+                slots_box.add(slot_button)
+            v_box.add(slots_box)
+
+        # Bloc nouvelle partie
+        new_box = arcade.gui.UIBoxLayout(space_between=6)
+        new_box.add(self.name_input)
+        new_box.add(new_button)
+        v_box.add(new_box)
 
         # Bloc import
         import_box = arcade.gui.UIBoxLayout(space_between=6)
@@ -79,15 +100,27 @@ class MenuView(arcade.View):
         if self.message_label:
             self.message_label.text = message
 
+    def _format_slot(self, slot: Dict) -> str:
+        """Ligne affichée pour un emplacement"""
+        zone = self.game_window.data_manager.get_zone(slot.get("zone_id")) or {}
+        hours, rest = divmod(int(slot.get("playtime", 0)), 3600)
+        saved = time.strftime("%d/%m %H:%M", time.localtime(slot.get("saved_at") or 0))
+        return (f"{slot['name']} - Niv {slot['level']} - {zone.get('name', '?')} - "
+                f"{slot['gold']} or - {hours}h{rest // 60:02d} - {saved}")
+
     def _on_continue(self):
-        if not self.save_system.has_save():
+        if not self.slots:
             self.set_message("Aucune sauvegarde détectée.")
             return
-        self.game_window.continue_game()
+        self.game_window.continue_game(self.slots[0]["slot"])
+
+    def _on_load_slot(self, slot_id: str):
+        self.set_message("Chargement...")
+        self.game_window.continue_game(slot_id)
 
     def _on_new_game(self):
         self.set_message("Nouvelle partie en cours...")
-        self.game_window.start_new_game()
+        self.game_window.start_new_game(self.name_input.text)
 
     def _on_import(self):
         path = self.import_input.text.strip()
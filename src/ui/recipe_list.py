@@ -0,0 +1,92 @@
+"""
+Liste de recettes virtualisée pour la vue de crafting
+
+Les libellés d'une recette (nom de l'objet produit, coûts) ne dépendent que des
+données: ils sont calculés une fois par recette. Les lignes ne sont refaites que
+quand CraftingSystem reconstruit sa liste de recettes disponibles, et la vue ne
+demande que la fenêtre visible: faire défiler des centaines de recettes coûte
+autant que d'en faire défiler huit.
+"""
+
+from typing import Dict, List, Tuple
+
+
+class RecipeRow:
+    """Une recette disponible et ses libellés précalculés"""
+
+    __slots__ = ("entry", "recipe", "title", "cost_text")
+
+    def __init__(self, entry: Dict, title: str, cost_text: str):
+        self.entry = entry  # Entrée de CraftingSystem, can_craft/reason mis à jour en place
+        self.recipe = entry["recipe"]
+        self.title = title
+        self.cost_text = cost_text
+
+    @property
+    def can_craft(self) -> bool:
+        return self.entry["can_craft"]
+
+    @property
+    def reason(self) -> str:
+        return self.entry["reason"]
+
+
+class RecipeListModel:
+    """Lignes de recettes disponibles pour un joueur, dans l'ordre de CraftingSystem"""
+
+    def __init__(self, crafting_system, data_manager, max_cost_inputs: int = 3):
+        """
+        Args:
+            max_cost_inputs: Nombre de ressources affichées dans le coût
+        """
+        self.crafting = crafting_system
+        self.data = data_manager
+        self.max_cost_inputs = max_cost_inputs
+        self._labels: Dict[int, Tuple[str, str]] = {}  # id(recette) -> (titre, coûts)
+        self._rows: List[RecipeRow] = []
+        self._player = None
+        self._revision: int = -1
+
+    def refresh(self, player) -> int:
+        """Met les lignes à jour si la liste disponible a changé, retourne le nombre de lignes"""
+        revision = self.crafting.get_available_revision(player)
+        if revision != self._revision or player is not self._player:
+            self._rows = [RecipeRow(entry, *self._get_labels(entry["recipe"]))
+                          for entry in self.crafting.get_available_recipes(player)]
+            self._revision = revision
+            self._player = player
+        return len(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def window(self, offset: int, count: int) -> List[RecipeRow]:
+        """Lignes visibles à partir de offset (au plus count)"""
+        return self._rows[offset:offset + count]
+
+    def _get_labels(self, recipe: Dict) -> Tuple[str, str]:
+        """Titre et texte de coût d'une recette (calculés au premier affichage)"""
+        labels = self._labels.get(id(recipe))
+        if labels is None:
+            labels = self._labels[id(recipe)] = (self._format_title(recipe), self._format_cost(recipe))
+        return labels
+
+    def _format_title(self, recipe: Dict) -> str:
+        """Nom de la recette (depuis l'output)"""
+        outputs = recipe.get("outputs", [])
+        if outputs and "item_base" in outputs[0]:
+            item_base = self.data.get_item_base(outputs[0]["item_base"])
+            return item_base.get("name", "???") if item_base else "???"
+        return recipe.get("id", "???")
+
+    def _format_cost(self, recipe: Dict) -> str:
+        """Coûts (premières ressources puis or)"""
+        parts = []
+        for res in recipe.get("inputs", [])[:self.max_cost_inputs]:
+            res_data = self.data.get_resource(res["resource"])
+            res_name = res_data.get("name", res["resource"]) if res_data else res["resource"]
+            parts.append(f"{res['qty']}x {res_name}")
+
+        if recipe.get("gold_cost", 0) > 0:
+            parts.append(f"{recipe['gold_cost']} or")
+        return ", ".join(parts)
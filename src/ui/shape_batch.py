@@ -0,0 +1,112 @@
+"""
+Batch de formes - rectangles et cercles dessinés en un seul appel
+
+Les vues appellent draw_lrbt_rectangle_filled & co comme avec arcade, mais les
+formes sont seulement enregistrées. Au flush(), si la suite de formes est
+identique à la frame précédente, la ShapeElementList déjà construite est
+redessinée telle quelle; sinon elle est reconstruite (changement de mise en page,
+survol, sélection...).
+
+Les éléments qui changent souvent (remplissage des barres) vont dans un batch
+séparé pour ne pas reconstruire toute la mise en page.
+"""
+
+import math
+from typing import List, Optional, Tuple
+import arcade
+
+# Types de formes enregistrées (premier élément du tuple)
+_RECT_FILLED = 0
+_RECT_OUTLINE = 1
+_CIRCLE_FILLED = 2
+_CIRCLE_OUTLINE = 3
+
+
+class ShapeBatch:
+    """Une couche de formes, reconstruite uniquement quand elle change"""
+
+    def __init__(self, circle_segments: int = 48):
+        """
+        Args:
+            circle_segments: Nombre de segments des cercles
+        """
+        self.circle_segments = circle_segments
+        self.shapes: Optional[arcade.shape_list.ShapeElementList] = None  # Créée au premier flush (contexte GL)
+        self._built: List[Tuple] = []
+        self._pending: List[Tuple] = []
+
+        # Compteur pour l'overlay de debug
+        self.rebuilds: int = 0
+
+    def __len__(self) -> int:
+        return len(self._built)
+
+    def draw_lrbt_rectangle_filled(self, left: float, right: float, bottom: float, top: float, color):
+        self._pending.append((_RECT_FILLED, left, right, bottom, top, color))
+
+    def draw_lrbt_rectangle_outline(self, left: float, right: float, bottom: float, top: float, color,
+                                    border_width: float = 1):
+        self._pending.append((_RECT_OUTLINE, left, right, bottom, top, color, border_width))
+
+    def draw_circle_filled(self, center_x: float, center_y: float, radius: float, color):
+        self._pending.append((_CIRCLE_FILLED, center_x, center_y, radius, color))
+
+    def draw_circle_outline(self, center_x: float, center_y: float, radius: float, color,
+                            border_width: float = 1):
+        self._pending.append((_CIRCLE_OUTLINE, center_x, center_y, radius, color, border_width))
+
+    def flush(self):
+        """Dessine les formes enregistrées depuis le dernier flush"""
+        if self._pending != self._built:
+            self._rebuild(self._pending)
+            self._built = self._pending
+            self._pending = []
+        else:
+            self._pending.clear()
+
+        if self._built:
+            self.shapes.draw()
+
+    def _rebuild(self, pending: List[Tuple]):
+        """Reconstruit la ShapeElementList (un seul mode GL: l'ordre de dessin est conservé)"""
+        if self.shapes is None:
+            self.shapes = arcade.shape_list.ShapeElementList()
+        else:
+            self.shapes.clear()
+
+        for shape in pending:
+            self.shapes.append(self._create(shape))
+        self.rebuilds += 1
+
+    def _create(self, shape: Tuple) -> arcade.shape_list.Shape:
+        """Crée la forme arcade correspondant à un tuple enregistré"""
+        kind = shape[0]
+        if kind == _RECT_FILLED or kind == _RECT_OUTLINE:
+            left, right, bottom, top, color = shape[1:6]
+            center_x, center_y = (left + right) / 2, (bottom + top) / 2
+            if kind == _RECT_FILLED:
+                return arcade.shape_list.create_rectangle_filled(center_x, center_y, right - left, top - bottom, color)
+            return arcade.shape_list.create_rectangle_outline(center_x, center_y, right - left, top - bottom,
+                                                              color, shape[6])
+
+        center_x, center_y, radius, color = shape[1:5]
+        if kind == _CIRCLE_FILLED:
+            return arcade.shape_list.create_ellipse_filled(center_x, center_y, radius * 2, radius * 2, color,
+                                                           num_segments=self.circle_segments)
+
+        # Anneau en triangle strip (create_ellipse_outline ignore l'épaisseur)
+        half = shape[5] / 2
+        points = []
+        for segment in range(self.circle_segments + 1):
+            theta = 2.0 * math.pi * segment / self.circle_segments
+            cos, sin = math.cos(theta), math.sin(theta)
+            points.append((center_x + (radius + half) * cos, center_y + (radius + half) * sin))
+            points.append((center_x + (radius - half) * cos, center_y + (radius - half) * sin))
+        return arcade.shape_list.create_triangles_strip_filled_with_colors(points, [color] * len(points))
+
+    def clear(self):
+        """Oublie les formes construites"""
+        if self.shapes is not None:
+            self.shapes.clear()
+        self._built = []
+        self._pending = []
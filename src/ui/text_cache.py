@@ -0,0 +1,132 @@
+"""
+Cache de textes - arcade.Text persistants au lieu d'arcade.draw_text
+
+arcade.draw_text recrée la mise en page des glyphes à chaque appel. Ici chaque
+emplacement de texte garde son arcade.Text: d'une frame à l'autre, seuls le
+contenu, la couleur ou la position modifiés sont mis à jour, puis tous les
+textes d'une couche sont dessinés en un seul batch pyglet.
+
+L'emplacement est identifié par une clé explicite, ou par défaut par la
+position et le style du texte (les mises en page de GameView sont fixes).
+"""
+
+from typing import Any, Dict, Hashable, Optional
+import arcade
+import pyglet
+
+
+class _CachedText:
+    """Un arcade.Text et les dernières valeurs appliquées"""
+
+    __slots__ = ("text", "value", "color", "x", "y", "last_frame")
+
+    def __init__(self, text: arcade.Text, value: str, color, x: float, y: float, frame: int):
+        self.text = text
+        self.value = value
+        self.color = color
+        self.x = x
+        self.y = y
+        self.last_frame = frame
+
+
+class TextCache:
+    """
+    Une couche de textes dessinée d'un bloc
+
+    Appeler draw_text pendant la frame puis flush() pour dessiner la couche.
+    Les textes non redemandés depuis le dernier flush ne sont pas dessinés.
+    """
+
+    def __init__(self, max_idle_frames: int = 300):
+        """
+        Args:
+            max_idle_frames: Frames sans utilisation avant de libérer un texte
+        """
+        self.batch = pyglet.graphics.Batch()
+        self.max_idle_frames = max_idle_frames
+        self._entries: Dict[Hashable, _CachedText] = {}
+        self._in_batch: Dict[Hashable, _CachedText] = {}
+        self._duplicates: Dict[Hashable, int] = {}
+        self._frame: int = 0
+
+        # Compteurs pour l'overlay de debug
+        self.created: int = 0
+        self.updated: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def draw_text(self, text: Any, x: float, y: float, color=arcade.color.WHITE, font_size: float = 12,
+                  width: Optional[int] = None, align: str = "left", font_name=("calibri", "arial"),
+                  bold: bool = False, italic: bool = False, anchor_x: str = "left",
+                  anchor_y: str = "baseline", multiline: bool = False, rotation: float = 0,
+                  key: Optional[Hashable] = None):
+        """Mêmes paramètres qu'arcade.draw_text, plus la clé optionnelle de l'emplacement"""
+        value = str(text)
+        if key is None:
+            key = (x, y, font_size, width, align, font_name, bold, italic,
+                   anchor_x, anchor_y, multiline, rotation)
+
+        # Deux textes au même emplacement dans la frame: clés distinctes
+        count = self._duplicates.get(key, 0)
+        self._duplicates[key] = count + 1
+        if count:
+            key = (key, count)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            label = arcade.Text(value, x, y, color, font_size, width=width, align=align,
+                                font_name=font_name, bold=bold, italic=italic, anchor_x=anchor_x,
+                                anchor_y=anchor_y, multiline=multiline, rotation=rotation,
+                                batch=self.batch)
+            entry = _CachedText(label, value, color, x, y, self._frame)
+            self._entries[key] = entry
+            self._in_batch[key] = entry
+            self.created += 1
+            return
+
+        entry.last_frame = self._frame
+        if key not in self._in_batch:
+            entry.text.batch = self.batch
+            self._in_batch[key] = entry
+        if entry.value != value:
+            entry.text.text = value
+            entry.value = value
+            self.updated += 1
+        if entry.color != color:
+            entry.text.color = color
+            entry.color = color
+        if entry.x != x or entry.y != y:
+            entry.text.position = (x, y)
+            entry.x = x
+            entry.y = y
+
+    def flush(self):
+        """Dessine les textes demandés depuis le dernier flush"""
+        frame = self._frame
+        stale = [key for key, entry in self._in_batch.items() if entry.last_frame != frame]
+        for key in stale:
+            self._in_batch.pop(key).text.batch = None
+
+        if self._in_batch:
+            self.batch.draw()
+
+        self._duplicates.clear()
+        self._frame += 1
+        if self._frame % 60 == 0:
+            self._evict()
+
+    def _evict(self):
+        """Libère les textes inutilisés depuis longtemps"""
+        limit = self._frame - self.max_idle_frames
+        for key in [key for key, entry in self._entries.items() if entry.last_frame < limit]:
+            del self._entries[key]
+            self._in_batch.pop(key, None)
+
+    def clear(self):
+        """Oublie tous les textes (changement de fenêtre, de police...)"""
+        for entry in self._in_batch.values():
+            entry.text.batch = None
+        self._entries.clear()
+        self._in_batch.clear()
+        self._duplicates.clear()
@@ -4,6 +4,7 @@ Système de tooltip pour afficher les détails des items
 
 import arcade
 from src.systems.item_system import Item
+from src.ui.text_cache import TextCache
 
 class ItemTooltip:
     """Affiche un tooltip avec les stats d'un item"""
@@ -24,6 +25,18 @@ class ItemTooltip:
             "legendary": (255, 180, 50)
         }
 
+        self.draw_text_calls: int = 0  # Compteur pour l'overlay de debug
+
+        # Le tooltip suit la souris: les textes sont identifiés par leur style et
+        # leur rang (doublons numérotés par le cache), pas par leur position
+        self.texts = TextCache()
+
+    def _draw_text(self, text, x, y, color, font_size, **kwargs):
+        """Texte via le cache du tooltip, avec comptage des appels"""
+        self.draw_text_calls += 1
+        self.texts.draw_text(text, x, y, color, font_size,
+                             key=("tooltip", font_size, kwargs.get("bold", False)), **kwargs)
+
     def draw(self, item: Item, x: int, y: int, data_manager):
         """Dessine le tooltip à la position donnée"""
         if not item:
@@ -47,7 +60,7 @@ class ItemTooltip:
 
         # Nom de l'item (avec couleur de rareté)
         rarity_color = self.RARITY_COLORS.get(item.rarity_id, self.COLOR_TEXT)
-        arcade.draw_text(item.name, x + 10, y + height - 25, rarity_color, 14, bold=True)
+        self._draw_text(item.name, x + 10, y + height - 25, rarity_color, 14, bold=True)
 
         # Ligne: Tier + Rareté + Qualité
         rarity_data = data_manager.get_rarity(item.rarity_id)
@@ -55,11 +68,11 @@ class ItemTooltip:
         rarity_name = rarity_data.get("name", item.rarity_id) if rarity_data else item.rarity_id
         quality_name = quality_data.get("name", item.quality_id) if quality_data else item.quality_id
 
-        arcade.draw_text(f"{item.tier.upper()} | {rarity_name} | {quality_name}",
+        self._draw_text(f"{item.tier.upper()} | {rarity_name} | {quality_name}",
                         x + 10, y + height - 45, self.COLOR_TEXT_DIM, 10)
 
         # Slot et Level requirement
-        arcade.draw_text(f"Slot: {item.slot} | Niveau requis: {item.level_requirement}",
+        self._draw_text(f"Slot: {item.slot} | Niveau requis: {item.level_requirement}",
                         x + 10, y + height - 60, self.COLOR_TEXT_DIM, 10)
 
         # Séparateur
@@ -81,7 +94,7 @@ class ItemTooltip:
 
         for stat_name, stat_value in main_stats:
             if stat_value > 0:
-                arcade.draw_text(f"+{stat_value:.1f} {stat_name}",
+                self._draw_text(f"+{stat_value:.1f} {stat_name}",
                                x + 10, current_y, self.COLOR_STAT_POSITIVE, 11)
                 current_y -= 18
 
@@ -92,12 +105,14 @@ class ItemTooltip:
             current_y -= 10
 
             for affix in item.affixes:
-                arcade.draw_text(f"+{affix['rolled_value']:.1f} {affix['name']}",
+                self._draw_text(f"+{affix['rolled_value']:.1f} {affix['name']}",
                                x + 10, current_y, self.RARITY_COLORS.get(item.rarity_id, self.COLOR_TEXT), 10)
                 current_y -= 18
 
         # Power score en bas
         arcade.draw_line(x + 10, current_y + 8, x + width - 10, current_y + 8,
                         self.COLOR_BORDER, 1)
-        arcade.draw_text(f"Power: {int(item.power_score)} | Valeur: {item.gold_value} or",
+        self._draw_text(f"Power: {int(item.power_score)} | Valeur: {item.gold_value} or",
                         x + 10, current_y - 8, self.COLOR_TEXT_DIM, 9)
+
+        self.texts.flush()
@@ -0,0 +1,173 @@
+"""
+Profiler - Mesure du temps passé par sous-système
+
+Usage:
+    from src.utils.profiler import profiler
+
+    with profiler.span("update.combat"):
+        ...
+
+    @profiler.timed("save.write")
+    def _write(...): ...
+
+Chaque span garde ses dernières durées dans un buffer circulaire (p50/p95/max).
+Désactivé par défaut (variable d'environnement PYCLICK_PROFILE=1 pour l'activer
+au lancement, F8 en jeu): un span ne coûte alors qu'un appel de méthode.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Optional
+
+
+class _NullSpan:
+    """Span sans effet, partagé quand le profiler est désactivé"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """Mesure une section et l'enregistre à la sortie"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class Profiler:
+    """Collecte les durées (ms) par nom de span"""
+
+    def __init__(self, enabled: bool = False, capacity: int = 600):
+        """
+        Args:
+            enabled: Collecte active
+            capacity: Nombre de mesures gardées par span (10 s à 60 fps)
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.report_dir = Path("profiles")
+        self._samples: Dict[str, Deque[float]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()  # Les sauvegardes mesurent aussi sur leur thread
+
+    def span(self, name: str):
+        """Context manager mesurant une section"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def timed(self, name: str) -> Callable:
+        """Décorateur mesurant chaque appel d'une fonction"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, (time.perf_counter() - start) * 1000.0)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, duration_ms: float):
+        """Ajoute une mesure (ms) à un span"""
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.capacity)
+                self._counts[name] = 0
+            samples.append(duration_ms)
+            self._counts[name] += 1
+
+    def toggle(self) -> bool:
+        """Active/désactive la collecte, retourne le nouvel état"""
+        self.enabled = not self.enabled
+        return self.enabled
+
+    def reset(self):
+        """Oublie toutes les mesures"""
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+    def last(self, name: str) -> float:
+        """Dernière mesure d'un span (0 si aucune)"""
+        samples = self._samples.get(name)
+        return samples[-1] if samples else 0.0
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Statistiques par span sur les mesures du buffer: count, p50, p95, max, last"""
+        with self._lock:
+            snapshot = {name: (list(samples), self._counts[name]) for name, samples in self._samples.items()}
+
+        result = {}
+        for name, (samples, count) in sorted(snapshot.items()):
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[name] = {
+                "count": count,
+                "p50": self._percentile(ordered, 0.50),
+                "p95": self._percentile(ordered, 0.95),
+                "max": ordered[-1],
+                "last": samples[-1]
+            }
+        return result
+
+    @staticmethod
+    def _percentile(ordered, fraction: float) -> float:
+        """Percentile par rang le plus proche sur une liste triée"""
+        index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def dump(self, path: Optional[str] = None) -> Optional[Path]:
+        """
+        Écrit le rapport JSON (profiles/profile_<date>.json par défaut)
+
+        Returns:
+            Chemin du rapport, None si aucune mesure
+        """
+        stats = self.stats()
+        if not stats:
+            return None
+
+        if path is None:
+            self.report_dir.mkdir(exist_ok=True)
+            target = self.report_dir / time.strftime("profile_%Y%m%d_%H%M%S.json")
+        else:
+            target = Path(path)
+
+        report = {"created_at": time.time(), "capacity": self.capacity, "spans": stats}
+        with open(target, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Rapport de profilage écrit: {target}")
+        return target
+
+
+# Instance partagée par tout le jeu
+profiler = Profiler(enabled=os.environ.get("PYCLICK_PROFILE", "") not in ("", "0"))
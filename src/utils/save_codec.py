@@ -0,0 +1,289 @@
+"""
+Codec de sauvegarde binaire - Format compact alternatif au JSON
+
+Structure d'un fichier:
+    b"PYCK" | version (1 octet) | compression (1 octet) | charge utile
+
+La charge utile encode la même structure que la sauvegarde JSON avec des
+valeurs typées (entiers en varint, flottants à 2 décimales en centièmes,
+UUID sur 16 octets). Chaque chaîne n'est écrite qu'une fois: les occurrences
+suivantes (clés, base_id, affix_id, noms d'items...) sont des index dans la
+table des chaînes. Les dicts de stats ne stockent que les valeurs différentes
+des valeurs par défaut de StatsContainer, repérées par leur nom (lui aussi dans
+la table des chaînes): réordonner les stats (info/stats.json) ne change pas le
+sens d'une sauvegarde.
+
+Le décodage redonne exactement le dict qu'aurait produit json.load.
+"""
+
+import lzma
+import math
+import struct
+import uuid
+import zlib
+from typing import Any, Dict, List
+
+from src.systems.stats_system import STAT_NAMES, _DEFAULT_VALUES
+
+MAGIC = b"PYCK"
+FORMAT_VERSION = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZMA = 2
+COMPRESSIONS = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "lzma": COMPRESSION_LZMA}
+
+# Types de valeurs
+_NONE, _FALSE, _TRUE = 0, 1, 2
+_INT, _FLOAT, _FLOAT_INT, _FLOAT_CENTI = 3, 4, 5, 6
+_STR_NEW, _STR_REF, _UUID = 7, 8, 9
+_LIST, _DICT, _STATS = 10, 11, 12
+
+_DOUBLE = struct.Struct("<d")
+_STAT_DEFAULTS = dict(zip(STAT_NAMES, _DEFAULT_VALUES))
+
+
+class SaveCodecError(ValueError):
+    """Fichier binaire invalide ou incompatible"""
+
+
+def is_binary_save(raw: bytes) -> bool:
+    """Vérifie si des octets commencent par l'en-tête du format binaire"""
+    return raw[:4] == MAGIC
+
+
+def encode(save_data: Dict, compression: str = "zlib") -> bytes:
+    """Encode une sauvegarde (dict JSON-compatible) au format binaire"""
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Compression inconnue: {compression}")
+
+    encoder = _Encoder()
+    encoder.write_value(save_data)
+    payload = bytes(encoder.out)
+
+    flag = COMPRESSIONS[compression]
+    if flag == COMPRESSION_ZLIB:
+        payload = zlib.compress(payload, 6)
+    elif flag == COMPRESSION_LZMA:
+        payload = lzma.compress(payload)
+
+    return MAGIC + bytes((FORMAT_VERSION, flag)) + payload
+
+
+def decode(raw: bytes) -> Dict:
+    """Décode une sauvegarde binaire"""
+    if not is_binary_save(raw) or len(raw) < 6:
+        raise SaveCodecError("En-tête de sauvegarde binaire invalide")
+
+    version, flag = raw[4], raw[5]
+    if version > FORMAT_VERSION:
+        raise SaveCodecError(f"Version de sauvegarde non supportée: {version}")
+
+    payload = raw[6:]
+    try:
+        if flag == COMPRESSION_ZLIB:
+            payload = zlib.decompress(payload)
+        elif flag == COMPRESSION_LZMA:
+            payload = lzma.decompress(payload)
+        elif flag != COMPRESSION_NONE:
+            raise SaveCodecError(f"Compression inconnue: {flag}")
+
+        decoder = _Decoder(payload)
+        return decoder.read_value()
+    except (zlib.error, lzma.LZMAError, IndexError, UnicodeDecodeError, struct.error) as e:
+        raise SaveCodecError(f"Sauvegarde binaire corrompue: {e}") from e
+
+
+class _Encoder:
+    """Sérialise les valeurs dans un buffer, avec table de chaînes"""
+
+    def __init__(self):
+        self.out = bytearray()
+        self.strings: Dict[str, int] = {}
+
+    def write_varint(self, value: int):
+        while value >= 0x80:
+            self.out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.out.append(value)
+
+    def write_signed(self, value: int):
+        self.write_varint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def write_str(self, value: str):
+        index = self.strings.get(value)
+        if index is not None:
+            self.out.append(_STR_REF)
+            self.write_varint(index)
+            return
+
+        # Les UUID (ids d'items) tiennent sur 16 octets, sans entrée dans la table
+        if len(value) == 36 and value.count("-") == 4:
+            try:
+                parsed = uuid.UUID(value)
+            except ValueError:
+                parsed = None
+            if parsed is not None and str(parsed) == value:
+                self.out.append(_UUID)
+                self.out += parsed.bytes
+                return
+
+        self.strings[value] = len(self.strings)
+        data = value.encode("utf-8")
+        self.out.append(_STR_NEW)
+        self.write_varint(len(data))
+        self.out += data
+
+    def write_float(self, value: float):
+        if not math.isfinite(value):
+            self.out.append(_FLOAT)
+            self.out += _DOUBLE.pack(value)
+            return
+
+        if value.is_integer() and abs(value) < 2 ** 53:
+            self.out.append(_FLOAT_INT)
+            self.write_signed(int(value))
+            return
+
+        centi = round(value * 100)
+        if abs(centi) < 2 ** 53 and centi / 100 == value:
+            self.out.append(_FLOAT_CENTI)
+            self.write_signed(centi)
+            return
+
+        self.out.append(_FLOAT)
+        self.out += _DOUBLE.pack(value)
+
+    def write_value(self, value: Any):
+        if value is None:
+            self.out.append(_NONE)
+        elif value is True:
+            self.out.append(_TRUE)
+        elif value is False:
+            self.out.append(_FALSE)
+        elif isinstance(value, int):
+            self.out.append(_INT)
+            self.write_signed(value)
+        elif isinstance(value, float):
+            self.write_float(value)
+        elif isinstance(value, str):
+            self.write_str(value)
+        elif isinstance(value, (list, tuple)):
+            self.out.append(_LIST)
+            self.write_varint(len(value))
+            for element in value:
+                self.write_value(element)
+        elif isinstance(value, dict):
+            if self._is_stats_dict(value):
+                self.write_stats(value)
+            else:
+                self.out.append(_DICT)
+                self.write_varint(len(value))
+                for key, element in value.items():
+                    self.write_str(str(key))
+                    self.write_value(element)
+        else:
+            raise TypeError(f"Type non sérialisable: {type(value).__name__}")
+
+    @staticmethod
+    def _is_stats_dict(value: Dict) -> bool:
+        """Dict produit par StatsContainer.to_dict (mêmes clés, même ordre)"""
+        return (len(value) == len(STAT_NAMES)
+                and all(isinstance(v, float) for v in value.values())
+                and tuple(value) == STAT_NAMES)
+
+    def write_stats(self, value: Dict[str, float]):
+        changed = [(name, v) for name, v in value.items() if v != _STAT_DEFAULTS[name]]
+        self.out.append(_STATS)
+        self.write_varint(len(changed))
+        for name, stat_value in changed:
+            self.write_str(name)
+            self.write_float(stat_value)
+
+
+class _Decoder:
+    """Relit un buffer produit par _Encoder"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+        self.strings: List[str] = []
+
+    def read_varint(self) -> int:
+        result = 0
+        shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def read_signed(self) -> int:
+        value = self.read_varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def read_tag(self) -> int:
+        tag = self.data[self.pos]
+        self.pos += 1
+        return tag
+
+    def read_value(self) -> Any:
+        tag = self.read_tag()
+
+        if tag == _NONE:
+            return None
+        if tag == _FALSE:
+            return False
+        if tag == _TRUE:
+            return True
+        if tag == _INT:
+            return self.read_signed()
+        if tag in (_FLOAT, _FLOAT_INT, _FLOAT_CENTI):
+            return self._read_float(tag)
+        if tag in (_STR_NEW, _STR_REF, _UUID):
+            return self._read_str(tag)
+        if tag == _LIST:
+            return [self.read_value() for _ in range(self.read_varint())]
+        if tag == _DICT:
+            result = {}
+            for _ in range(self.read_varint()):
+                key = self._read_str(self.read_tag())
+                result[key] = self.read_value()
+            return result
+        if tag == _STATS:
+            result = dict(_STAT_DEFAULTS)
+            for _ in range(self.read_varint()):
+                name = self._read_str(self.read_tag())
+                result[name] = self._read_float(self.read_tag())
+            return result
+
+        raise SaveCodecError(f"Type de valeur inconnu: {tag}")
+
+    def _read_float(self, tag: int) -> float:
+        if tag == _FLOAT_INT:
+            return float(self.read_signed())
+        if tag == _FLOAT_CENTI:
+            return self.read_signed() / 100
+        if tag == _FLOAT:
+            value = _DOUBLE.unpack_from(self.data, self.pos)[0]
+            self.pos += _DOUBLE.size
+            return value
+        raise SaveCodecError(f"Flottant attendu, type {tag}")
+
+    def _read_str(self, tag: int) -> str:
+        if tag == _STR_REF:
+            return self.strings[self.read_varint()]
+        if tag == _UUID:
+            value = str(uuid.UUID(bytes=bytes(self.data[self.pos:self.pos + 16])))
+            self.pos += 16
+            return value
+        if tag == _STR_NEW:
+            length = self.read_varint()
+            value = self.data[self.pos:self.pos + length].decode("utf-8")
+            self.pos += length
+            self.strings.append(value)
+            return value
+        raise SaveCodecError(f"Chaîne attendue, type {tag}")
+
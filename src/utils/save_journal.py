@@ -0,0 +1,253 @@
+"""
+Journal de sauvegarde - Deltas ajoutés entre deux sauvegardes complètes
+
+Chaque sauvegarde complète (snapshot) porte un "journal_id". Entre deux
+snapshots, le journal ajoute des lignes JSON ne contenant que ce qui a changé
+depuis la ligne précédente:
+
+    {"base": "<journal_id>", "seq": 3, "t": 1700000000.0, "ops": [...]}
+
+Opérations (valeurs absolues, le rejeu est donc idempotent):
+    ["set", champ, valeur]       champ du joueur (gold, xp, level, ...)
+    ["res", resource_id, qty]    quantité d'une ressource
+    ["item", item_id, item]      item ajouté ou modifié dans l'inventaire
+    ["drop", item_id]            item retiré de l'inventaire
+    ["equip", slot, item|None]   slot d'équipement
+    ["section", nom, valeur]     "skills" ou "station_upgrades"
+
+Au chargement, seules les lignes dont "base" correspond au snapshot sont
+rejouées; une dernière ligne tronquée (crash pendant l'écriture) est ignorée.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Champs simples du joueur comparés à chaque ajout
+PLAYER_FIELDS = ("name", "level", "xp", "xp_to_next_level", "gold", "current_zone_id", "playtime")
+# Champs conteneurs: comparés par valeur, réécrits entiers s'ils changent
+# (buffs: durée restante comprise, un buff actif est donc réécrit à chaque ajout)
+PLAYER_CONTAINERS = ("potions", "unlocked_stations", "combat_stats", "buffs")
+
+
+class SaveJournal:
+    """Journal append-only des changements d'état entre deux snapshots"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.base_id: Optional[str] = None
+        self.seq: int = 0
+
+        # Lignes du snapshot courant, pour réécrire le fichier sans les anciennes
+        self._lines: List[str] = []
+        self._has_stale_lines: bool = False
+
+        # Dernier état journalisé (empreintes légères, pas de to_dict complet)
+        self._state: Optional[Dict] = None
+
+        self.last_append_ms: float = 0.0
+
+    def reset(self, base_id: str, player, skill_system=None, station_upgrade_system=None):
+        """
+        Repart d'un nouveau snapshot
+
+        Le fichier garde les lignes de l'ancien snapshot tant que compact()
+        n'a pas été appelé (le snapshot peut encore être en cours d'écriture).
+        """
+        if self._lines or self.path.exists():
+            self._has_stale_lines = True
+        self.base_id = base_id
+        self.seq = 0
+        self._lines = []
+        self._state = self._capture(player, skill_system, station_upgrade_system)
+
+    def compact(self):
+        """Retire du fichier les lignes des snapshots précédents (snapshot écrit)"""
+        if not self._has_stale_lines:
+            return
+
+        if self._lines:
+            tmp_file = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.writelines(self._lines)
+            os.replace(tmp_file, self.path)
+        elif self.path.exists():
+            os.remove(self.path)
+        self._has_stale_lines = False
+
+    def append(self, player, skill_system=None, station_upgrade_system=None) -> int:
+        """
+        Ajoute une ligne avec les changements depuis le dernier ajout
+
+        Returns:
+            Nombre d'opérations écrites (0 si rien n'a changé)
+        """
+        if self.base_id is None or self._state is None:
+            return 0
+
+        start = time.perf_counter()
+        state = self._capture(player, skill_system, station_upgrade_system)
+        ops = self._diff(self._state, state, player)
+        if not ops:
+            return 0
+
+        self.seq += 1
+        line = json.dumps({"base": self.base_id, "seq": self.seq, "t": time.time(), "ops": ops},
+                          ensure_ascii=False) + "\n"
+
+        # flush sans fsync: survit à un crash du jeu sans bloquer la frame sur le disque
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+
+        self._lines.append(line)
+        self._state = state
+        self.last_append_ms = (time.perf_counter() - start) * 1000.0
+        return len(ops)
+
+    def delete(self):
+        """Supprime le journal (nouvelle partie, import)"""
+        if self.path.exists():
+            os.remove(self.path)
+        self.base_id = None
+        self.seq = 0
+        self._lines = []
+        self._has_stale_lines = False
+        self._state = None
+
+    def replay(self, save_data: Dict) -> int:
+        """
+        Rejoue sur une sauvegarde chargée les lignes qui lui correspondent
+
+        saved_at prend l'heure de la dernière ligne rejouée. Appeler ensuite
+        resume() pour continuer le journal de ce snapshot.
+
+        Returns:
+            Nombre de lignes rejouées
+        """
+        self.base_id = save_data.get("journal_id")
+        self.seq = 0
+        self._lines = []
+        self._has_stale_lines = False
+        self._state = None
+        if self.base_id is None or not self.path.exists():
+            return 0
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for raw_line in f:
+                try:
+                    entry = json.loads(raw_line)
+                except json.JSONDecodeError:
+                    # Ligne tronquée par un crash: on la retire à la prochaine compaction
+                    self._has_stale_lines = True
+                    break
+                if entry.get("base") != self.base_id:
+                    self._has_stale_lines = True
+                    continue
+                self._apply_ops(save_data, entry.get("ops", []))
+                save_data["saved_at"] = entry.get("t", save_data.get("saved_at"))
+                self.seq = entry.get("seq", self.seq + 1)
+                self._lines.append(raw_line)
+        return len(self._lines)
+
+    def resume(self, player, skill_system=None, station_upgrade_system=None):
+        """Reprend le journal du snapshot rejoué à partir de l'état chargé"""
+        if self.base_id is None:
+            return
+        # Le snapshot chargé est sur disque: on peut retirer lignes périmées et tronquées
+        self.compact()
+        self._state = self._capture(player, skill_system, station_upgrade_system)
+
+    @staticmethod
+    def _apply_ops(save_data: Dict, ops: List):
+        """Applique des opérations au dict de sauvegarde"""
+        player = save_data["player"]
+        for op in ops:
+            kind = op[0]
+            if kind == "set":
+                player[op[1]] = op[2]
+            elif kind == "res":
+                player["resources"][op[1]] = op[2]
+            elif kind == "item":
+                inventory = player["inventory"]
+                for i, item_data in enumerate(inventory):
+                    if item_data["id"] == op[1]:
+                        inventory[i] = op[2]
+                        break
+                else:
+                    inventory.append(op[2])
+            elif kind == "drop":
+                player["inventory"] = [item_data for item_data in player["inventory"]
+                                       if item_data["id"] != op[1]]
+            elif kind == "equip":
+                player["equipment"][op[1]] = op[2]
+            elif kind == "section":
+                save_data[op[1]] = op[2]
+
+    @staticmethod
+    def _item_signature(item) -> Tuple:
+        """Empreinte d'un item: change si un craft/reforge le modifie"""
+        return (item.id, item.name, item.rarity_id, item.quality_id, item.power_score,
+                tuple(affix["rolled_value"] for affix in item.affixes))
+
+    def _capture(self, player, skill_system=None, station_upgrade_system=None) -> Dict:
+        """Empreinte de l'état suivi par le journal"""
+        base_stats = player.base_stats.to_dict()
+        base_stats.pop("hp_current")  # Varie à chaque tick, sauvegardé par le snapshot
+
+        return {
+            "fields": {field: getattr(player, field) for field in PLAYER_FIELDS},
+            "containers": {field: json.dumps(getattr(player, field), sort_keys=True)
+                           for field in PLAYER_CONTAINERS},
+            "base_stats": base_stats,
+            "resources": dict(player.resources),
+            "inventory": {item.id: self._item_signature(item) for item in player.inventory},
+            "equipment": {slot: self._item_signature(item) if item else None
+                          for slot, item in player.equipment.items()},
+            "sections": {
+                "skills": skill_system.to_dict() if skill_system else None,
+                "station_upgrades": station_upgrade_system.to_dict() if station_upgrade_system else None
+            }
+        }
+
+    @staticmethod
+    def _diff(old: Dict, new: Dict, player) -> List:
+        """Opérations qui transforment l'état `old` en `new`"""
+        ops = []
+
+        for field, value in new["fields"].items():
+            if old["fields"].get(field) != value:
+                ops.append(["set", field, value])
+
+        for field, value in new["containers"].items():
+            if old["containers"].get(field) != value:
+                ops.append(["set", field, json.loads(value)])
+
+        if old["base_stats"] != new["base_stats"]:
+            ops.append(["set", "base_stats", player.base_stats.to_dict()])
+
+        old_resources = old["resources"]
+        for res_id, quantity in new["resources"].items():
+            if old_resources.get(res_id) != quantity:
+                ops.append(["res", res_id, quantity])
+
+        if old["inventory"] != new["inventory"]:
+            for item_id in old["inventory"]:
+                if item_id not in new["inventory"]:
+                    ops.append(["drop", item_id])
+            for item in player.inventory:
+                if old["inventory"].get(item.id) != new["inventory"][item.id]:
+                    ops.append(["item", item.id, item.to_dict()])
+
+        for slot, signature in new["equipment"].items():
+            if old["equipment"].get(slot) != signature:
+                item = player.equipment[slot]
+                ops.append(["equip", slot, item.to_dict() if item else None])
+
+        for name, value in new["sections"].items():
+            if value is not None and old["sections"].get(name) != value:
+                ops.append(["section", name, value])
+
+        return ops
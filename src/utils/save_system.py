@@ -4,44 +4,110 @@ Système de sauvegarde/chargement
 
 import json
 import os
+import re
+import threading
+import time
+import unicodedata
+import uuid
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 import shutil
 from src.entities.player import Player
+from src.utils import save_codec
+from src.utils.save_journal import SaveJournal
+from src.utils.profiler import profiler
+
+DEFAULT_SLOT = "savegame"  # Emplacement historique (saves/savegame.json)
+SAVE_EXTENSIONS = (".json", ".sav")
 
 class SaveSystem:
-    """Gère la sauvegarde et le chargement du jeu"""
+    """Gère la sauvegarde et le chargement du jeu (un fichier par emplacement)"""
+
+    def __init__(self, save_format: str = "json", compression: str = "zlib", slot: str = DEFAULT_SLOT):
+        """
+        Args:
+            save_format: "json" (lisible) ou "binary" (compact, voir save_codec)
+            compression: Compression du format binaire ("none", "zlib", "lzma")
+            slot: Emplacement de sauvegarde actif
+        """
+        if save_format not in ("json", "binary"):
+            raise ValueError(f"Format de sauvegarde inconnu: {save_format}")
 
-    def __init__(self):
         self.save_dir = Path("saves")
         self.save_dir.mkdir(exist_ok=True)
-        self.save_file = self.save_dir / "savegame.json"
+        self.save_format = save_format
+        self.compression = compression
+
+        # Index des emplacements: métadonnées lues par le menu sans ouvrir les sauvegardes
+        self.index_file = self.save_dir / "index.json"
+        self._index: Optional[Dict[str, Dict]] = None
+
+        self.slot = slot
+        self._set_slot_paths(slot)
         self.auto_save_timer: float = 0.0
-        self.auto_save_interval: float = 30.0  # Sauvegarde auto toutes les 30 secondes
+        self.auto_save_interval: float = 120.0  # Snapshot complet toutes les 2 minutes
+        self.journal_timer: float = 0.0
+        self.journal_interval: float = 2.0  # Deltas ajoutés au journal toutes les 2 secondes
+        self.last_saved_at: Optional[float] = None  # Horodatage de la sauvegarde chargée
+
+        # Sauvegarde auto en arrière-plan: un seul snapshot en attente (le plus récent)
+        self._write_lock = threading.Lock()
+        self._pending_cond = threading.Condition()
+        self._pending: Optional[Dict] = None
+        self._writing: bool = False
+        self._worker: Optional[threading.Thread] = None
+        self._written_journal_id: Optional[str] = None  # Dernier snapshot écrit sur disque
+        self.last_autosave_snapshot_ms: float = 0.0  # Coût sur le thread de jeu
+        self.last_autosave_write_ms: float = 0.0  # Coût sur le thread d'écriture
+
+    def _set_slot_paths(self, slot: str):
+        """Fichiers (sauvegarde JSON/binaire, journal) d'un emplacement"""
+        self.json_file = self.save_dir / f"{slot}.json"
+        self.binary_file = self.save_dir / f"{slot}.sav"
+        self.save_file = self.binary_file if self.save_format == "binary" else self.json_file
+        self.journal = SaveJournal(self.save_dir / f"{slot}.journal")
+
+    def set_slot(self, slot: str):
+        """Change d'emplacement actif (les écritures en cours sont terminées avant)"""
+        if slot == self.slot:
+            return
+        self.flush()
+        self.slot = slot
+        self._set_slot_paths(slot)
+        self.last_saved_at = None
+        self._written_journal_id = None
+        self.auto_save_timer = 0.0
+        self.journal_timer = 0.0
 
+    def new_slot_id(self, name: str) -> str:
+        """Identifiant de fichier libre dérivé d'un nom de personnage"""
+        ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+        base = re.sub(r"[^a-z0-9]+", "_", ascii_name.lower()).strip("_") or "partie"
+        if base == "index":
+            base = "partie"
+        slot = base
+        suffix = 2
+        while any((self.save_dir / f"{slot}{ext}").exists() for ext in SAVE_EXTENSIONS):
+            slot = f"{base}_{suffix}"
+            suffix += 1
+        return slot
+
+    @profiler.timed("save.sync")
     def save_game(self, player: Player, skill_system=None, station_upgrade_system=None) -> bool:
         """
-        Sauvegarde le jeu
+        Sauvegarde le jeu (synchrone)
+
+        Une sauvegarde auto en attente est annulée (ce snapshot est plus récent)
+        et une écriture en cours est attendue, pour qu'elle ne passe pas après.
 
         Returns:
             True si succès
         """
         try:
-            save_data = {
-                "version": "1.1",
-                "player": player.to_dict()
-            }
-
-            # Sauvegarder les skills si fournis
-            if skill_system:
-                save_data["skills"] = skill_system.to_dict()
-
-            # Sauvegarder les station upgrades si fournis
-            if station_upgrade_system:
-                save_data["station_upgrades"] = station_upgrade_system.to_dict()
-
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            self._cancel_pending()
+            save_data = self._build_save_data(player, skill_system, station_upgrade_system)
+            self._write_save_data(save_data)
+            self.journal.compact()
 
             print(f"Jeu sauvegardé: {self.save_file}")
             return True
@@ -50,6 +116,141 @@ class SaveSystem:
             print(f"ERREUR lors de la sauvegarde: {e}")
             return False
 
+    def save_game_async(self, player: Player, skill_system=None, station_upgrade_system=None):
+        """
+        Sauvegarde en arrière-plan
+
+        Le snapshot est pris tout de suite (thread de jeu); la sérialisation et
+        l'écriture se font sur un thread dédié. Si une écriture est déjà en
+        attente, elle est remplacée par ce snapshot plus récent.
+        """
+        start = time.perf_counter()
+        save_data = self._build_save_data(player, skill_system, station_upgrade_system)
+        self.last_autosave_snapshot_ms = (time.perf_counter() - start) * 1000.0
+
+        with self._pending_cond:
+            self._pending = save_data
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._save_worker, name="autosave", daemon=True)
+                self._worker.start()
+            self._pending_cond.notify()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Attend la fin des écritures en arrière-plan (à appeler avant de quitter)
+
+        Returns:
+            True si plus rien n'est en attente
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending is not None or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    def _cancel_pending(self):
+        """Abandonne le snapshot en attente et attend la fin de l'écriture en cours"""
+        with self._pending_cond:
+            self._pending = None
+            self._pending_cond.notify_all()
+            while self._writing:
+                self._pending_cond.wait()
+
+    def _save_worker(self):
+        """Boucle du thread d'écriture: écrit le dernier snapshot reçu"""
+        while True:
+            with self._pending_cond:
+                while self._pending is None:
+                    self._pending_cond.wait()
+                save_data = self._pending
+                self._pending = None
+                self._writing = True
+
+            start = time.perf_counter()
+            try:
+                self._write_save_data(save_data)
+            except Exception as e:
+                print(f"ERREUR lors de la sauvegarde automatique: {e}")
+            self.last_autosave_write_ms = (time.perf_counter() - start) * 1000.0
+
+            with self._pending_cond:
+                self._writing = False
+                self._pending_cond.notify_all()
+
+    @profiler.timed("save.snapshot")
+    def _build_save_data(self, player: Player, skill_system=None, station_upgrade_system=None) -> Dict:
+        """Snapshot détaché de l'état à sauvegarder (le journal repart de ce snapshot)"""
+        journal_id = uuid.uuid4().hex
+        save_data = {
+            "version": "1.1",
+            "saved_at": time.time(),
+            "journal_id": journal_id,
+            "player": player.to_dict()
+        }
+
+        # Sauvegarder les skills si fournis
+        if skill_system:
+            save_data["skills"] = skill_system.to_dict()
+
+        # Sauvegarder les station upgrades si fournis
+        if station_upgrade_system:
+            save_data["station_upgrades"] = station_upgrade_system.to_dict()
+
+        self.journal.reset(journal_id, player, skill_system, station_upgrade_system)
+        return save_data
+
+    def _encode_save(self, save_data: Dict) -> bytes:
+        """Sérialise la sauvegarde dans le format configuré"""
+        if self.save_format == "binary":
+            return save_codec.encode(save_data, self.compression)
+        return json.dumps(save_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    @staticmethod
+    def _decode_save(raw: bytes) -> Dict:
+        """Relit une sauvegarde JSON ou binaire (détection par l'en-tête)"""
+        if save_codec.is_binary_save(raw):
+            return save_codec.decode(raw)
+        return json.loads(raw.decode("utf-8"))
+
+    @profiler.timed("save.write")
+    def _write_save_data(self, save_data: Dict):
+        """Écrit dans un fichier temporaire puis le renomme: la sauvegarde n'est jamais à moitié écrite"""
+        raw = self._encode_save(save_data)
+        with self._write_lock:
+            tmp_file = self.save_file.with_name(self.save_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(raw)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.save_file)
+            self._backup_other_format(self.save_file)
+            self._written_journal_id = save_data.get("journal_id")
+            self._update_index_entry(self.slot, self.save_file, save_data)
+
+    def _backup_other_format(self, kept_file: Path):
+        """
+        Met de côté la sauvegarde de l'autre format pour qu'elle ne soit pas rechargée
+
+        Elle est renommée en .bak (ex: savegame.json.bak) plutôt que supprimée:
+        un changement de format garde l'ancienne sauvegarde en secours.
+        """
+        for save_file in (self.json_file, self.binary_file):
+            if save_file != kept_file and save_file.exists():
+                backup = save_file.with_name(save_file.name + ".bak")
+                os.replace(save_file, backup)
+                print(f"Ancienne sauvegarde conservée: {backup}")
+
+    def _find_save_file(self) -> Optional[Path]:
+        """Sauvegarde existante la plus récente, quel que soit son format"""
+        existing = [f for f in (self.save_file, self.json_file, self.binary_file) if f.exists()]
+        if not existing:
+            return None
+        return max(existing, key=lambda f: f.stat().st_mtime)
+
+    @profiler.timed("save.load")
     def load_game(self, data_manager, skill_system=None, station_upgrade_system=None) -> Optional[Player]:
         """
         Charge le jeu
@@ -57,15 +258,23 @@ class SaveSystem:
         Returns:
             Player si succès, None sinon
         """
-        if not self.save_file.exists():
+        self.flush()
+        save_file = self._find_save_file()
+        if save_file is None:
             print("Aucune sauvegarde trouvée")
             return None
 
         try:
-            with open(self.save_file, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            with open(save_file, 'rb') as f:
+                save_data = self._decode_save(f.read())
+
+            # Changements journalisés depuis ce snapshot (crash avant la sauvegarde suivante)
+            replayed = self.journal.replay(save_data)
+            if replayed:
+                print(f"Journal: {replayed} entrée(s) rejouée(s)")
 
             player = Player.from_dict(save_data["player"], data_manager)
+            self.last_saved_at = save_data.get("saved_at")
 
             # Charger les skills
             if skill_system and "skills" in save_data:
@@ -75,16 +284,25 @@ class SaveSystem:
             if station_upgrade_system and "station_upgrades" in save_data:
                 station_upgrade_system.from_dict(save_data["station_upgrades"])
 
-            print(f"Jeu chargé: {self.save_file}")
+            # Les prochains deltas s'ajoutent à ceux déjà journalisés pour ce snapshot
+            self.journal.resume(player, skill_system, station_upgrade_system)
+            self._written_journal_id = save_data.get("journal_id")
+            print(f"Jeu chargé: {save_file}")
             return player
 
         except Exception as e:
             print(f"ERREUR lors du chargement: {e}")
             return None
 
+    def get_offline_seconds(self) -> float:
+        """Temps écoulé depuis la sauvegarde chargée (0 si inconnu)"""
+        if self.last_saved_at is None:
+            return 0.0
+        return max(0.0, time.time() - self.last_saved_at)
+
     def has_save(self) -> bool:
         """Vérifie si une sauvegarde existe"""
-        return self.save_file.exists()
+        return self._find_save_file() is not None
 
     def import_save(self, source_path: str) -> Tuple[bool, str]:
         """
@@ -98,11 +316,18 @@ class SaveSystem:
             if not src.exists():
                 return False, f"Fichier introuvable: {src}"
 
-            # Vérifier que le JSON est valide avant de l'écraser
-            with open(src, "r", encoding="utf-8") as f:
-                json.load(f)
+            # Vérifier que la sauvegarde (JSON ou binaire) est valide avant d'écraser
+            raw = src.read_bytes()
+            is_binary = save_codec.is_binary_save(raw)
+            save_data = self._decode_save(raw)
 
-            shutil.copy(src, self.save_file)
+            self.flush()
+            target = self.binary_file if is_binary else self.json_file
+            with self._write_lock:
+                shutil.copy(src, target)
+                self._backup_other_format(target)
+                self.journal.delete()
+                self._update_index_entry(self.slot, target, save_data)
             return True, f"Sauvegarde importée depuis {src}"
         except Exception as exc:
             return False, f"Import impossible: {exc}"
@@ -110,17 +335,150 @@ class SaveSystem:
     def delete_save(self) -> bool:
         """Supprime la sauvegarde"""
         try:
-            if self.save_file.exists():
-                os.remove(self.save_file)
+            self.flush()
+            removed = False
+            for save_file in (self.json_file, self.binary_file):
+                if save_file.exists():
+                    os.remove(save_file)
+                    removed = True
+            self.journal.delete()
+            with self._write_lock:
+                self._remove_index_entry(self.slot)
+            if removed:
                 print("Sauvegarde supprimée")
             return True
         except Exception as e:
             print(f"ERREUR lors de la suppression: {e}")
             return False
 
+    @profiler.timed("save.journal")
+    def append_journal(self, player: Player, skill_system=None, station_upgrade_system=None) -> int:
+        """
+        Ajoute au journal les changements depuis le dernier ajout
+
+        Returns:
+            Nombre d'opérations écrites
+        """
+        try:
+            # Le snapshot courant est sur disque: les lignes des précédents sont inutiles
+            if self._written_journal_id == self.journal.base_id:
+                self.journal.compact()
+            return self.journal.append(player, skill_system, station_upgrade_system)
+        except Exception as e:
+            print(f"ERREUR lors de l'écriture du journal: {e}")
+            return 0
+
+    def list_slots(self) -> List[Dict]:
+        """
+        Emplacements existants, du plus récent au plus ancien
+
+        Les métadonnées viennent de l'index; une entrée n'est relue depuis la
+        sauvegarde que si le fichier ne correspond plus (taille/mtime), par
+        exemple après un crash entre l'écriture de la sauvegarde et de l'index.
+        """
+        self.flush()
+        with self._write_lock:
+            index = self._load_index()
+            changed = False
+
+            files: Dict[str, Path] = {}
+            for path in self.save_dir.iterdir():
+                if path.suffix in SAVE_EXTENSIONS and path != self.index_file:
+                    current = files.get(path.stem)
+                    if current is None or path.stat().st_mtime > current.stat().st_mtime:
+                        files[path.stem] = path
+
+            for slot in list(index):
+                if slot not in files:
+                    del index[slot]
+                    changed = True
+
+            for slot, path in files.items():
+                entry = index.get(slot)
+                if entry is None or not self._entry_matches(entry, path):
+                    try:
+                        save_data = self._decode_save(path.read_bytes())
+                        index[slot] = self._make_index_entry(slot, path, save_data)
+                    except Exception as e:
+                        print(f"Sauvegarde illisible ignorée ({path.name}): {e}")
+                        index.pop(slot, None)
+                    changed = True
+
+            if changed:
+                self._write_index()
+
+            return sorted((dict(entry) for entry in index.values()),
+                          key=lambda entry: entry.get("saved_at") or 0.0, reverse=True)
+
+    def _load_index(self) -> Dict[str, Dict]:
+        """Index en mémoire (lu depuis le disque au premier accès)"""
+        if self._index is None:
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._index = data.get("slots", {}) if isinstance(data, dict) else {}
+            except (OSError, ValueError):
+                self._index = {}  # Absent ou corrompu: reconstruit depuis les sauvegardes
+        return self._index
+
+    def _write_index(self):
+        """Écrit l'index atomiquement (appelé sous _write_lock)"""
+        tmp_file = self.index_file.with_name(self.index_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "slots": self._index}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.index_file)
+
+    @staticmethod
+    def _entry_matches(entry: Dict, path: Path) -> bool:
+        """L'entrée décrit-elle bien ce fichier (pas réécrit depuis)?"""
+        stat = path.stat()
+        return (entry.get("file") == path.name and entry.get("size") == stat.st_size
+                and entry.get("mtime_ns") == stat.st_mtime_ns)
+
+    @staticmethod
+    def _make_index_entry(slot: str, path: Path, save_data: Dict) -> Dict:
+        """Métadonnées d'un emplacement pour le menu"""
+        player = save_data.get("player", {})
+        stat = path.stat()
+        return {
+            "slot": slot,
+            "name": player.get("name", slot),
+            "level": player.get("level", 1),
+            "zone_id": player.get("current_zone_id"),
+            "gold": player.get("gold", 0),
+            "playtime": player.get("playtime", 0.0),
+            "saved_at": save_data.get("saved_at") or stat.st_mtime,
+            "file": path.name,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns
+        }
+
+    def _update_index_entry(self, slot: str, path: Path, save_data: Dict):
+        """Met à jour l'entrée d'un emplacement qui vient d'être écrit (sous _write_lock)"""
+        try:
+            index = self._load_index()
+            index[slot] = self._make_index_entry(slot, path, save_data)
+            self._write_index()
+        except Exception as e:
+            # L'index sera reconstruit depuis la sauvegarde au prochain listing
+            print(f"ERREUR lors de la mise à jour de l'index: {e}")
+
+    def _remove_index_entry(self, slot: str):
+        """Retire un emplacement supprimé de l'index (sous _write_lock)"""
+        index = self._load_index()
+        if index.pop(slot, None) is not None:
+            self._write_index()
+
     def update_auto_save(self, delta_time: float, player: Player, skill_system=None, station_upgrade_system=None):
-        """Met à jour le timer de sauvegarde automatique"""
+        """Met à jour les timers du journal et de la sauvegarde automatique"""
         self.auto_save_timer += delta_time
         if self.auto_save_timer >= self.auto_save_interval:
             self.auto_save_timer = 0.0
-            self.save_game(player, skill_system, station_upgrade_system)
+            self.journal_timer = 0.0
+            self.save_game_async(player, skill_system, station_upgrade_system)
+            return
+
+        self.journal_timer += delta_time
+        if self.journal_timer >= self.journal_interval:
+            self.journal_timer = 0.0
+            self.append_journal(player, skill_system, station_upgrade_system)
@@ -0,0 +1,51 @@
+"""
+Tests du combat événementiel (CombatSystem.update)
+"""
+
+import signal
+from contextlib import contextmanager
+
+import pytest
+
+from src.core.simulation import Simulation
+
+
+@contextmanager
+def time_limit(seconds: int):
+    """Fait échouer le test au lieu de bloquer si la boucle ne termine pas"""
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise TimeoutError(f"Pas de fin après {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def add_atk_buff(player, duration: float = 60.0):
+    player.buffs.append({"type": "atk", "value": 5, "duration": duration, "remaining": duration})
+    player.invalidate_stats()
+
+
+def test_long_session_with_buffs_terminates():
+    """Régression: un résidu flottant (~1e-14) sur un buff bloquait la boucle d'événements"""
+    timestep = 0.05
+    sim = Simulation(seed=7, timestep=timestep)
+    steps_per_minute = int(60 / timestep)
+
+    with time_limit(60):
+        for i in range(int(2 * 3600 / timestep)):
+            if i % steps_per_minute == 0:
+                add_atk_buff(sim.player)
+            sim.step(timestep)
+
+    assert sim.sim_time == pytest.approx(2 * 3600)
+    assert sim.kills > 0
+
@@ -0,0 +1,54 @@
+"""
+Tests du cache des recettes disponibles (CraftingSystem.get_available_recipes)
+"""
+
+import pytest
+
+from src.core.simulation import Simulation
+
+
+@pytest.fixture
+def sim():
+    return Simulation(seed=3)
+
+
+def assert_matches_can_craft(crafting, player):
+    """Chaque entrée en cache correspond à un can_craft recalculé"""
+    for entry in crafting.get_available_recipes(player):
+        assert (entry["can_craft"], entry["reason"]) == crafting.can_craft(entry["recipe"]["id"], player)
+
+
+def test_resource_change_refreshes_entries(sim):
+    crafting, player = sim.crafting_system, sim.player
+    entry = next(e for e in crafting.get_available_recipes(player) if e["recipe"].get("inputs"))
+    recipe_id = entry["recipe"]["id"]
+    assert_matches_can_craft(crafting, player)
+    revision = crafting.get_available_revision(player)
+
+    # Assez de tout: la recette devient craftable sans reconstruire la liste
+    gold_cost, inputs = crafting.difficulty.recipe_cost(entry["recipe"])
+    for res_id, quantity in inputs:
+        player.add_resource(res_id, quantity)
+    player.gold += gold_cost
+    assert_matches_can_craft(crafting, player)
+    assert crafting.can_craft(recipe_id, player)[0]
+    assert crafting.get_available_revision(player) == revision
+
+    # Une ressource consommée la rend de nouveau indisponible
+    res_id, quantity = inputs[0]
+    player.consume_resource(res_id, player.resources[res_id])
+    assert_matches_can_craft(crafting, player)
+    assert not crafting.can_craft(recipe_id, player)[0]
+
+
+def test_level_and_station_changes_rebuild(sim):
+    crafting, player = sim.crafting_system, sim.player
+    revision = crafting.get_available_revision(player)
+
+    player.add_xp(player.xp_to_next_level)
+    assert crafting.get_available_revision(player) == revision + 1
+
+    locked = next(s["id"] for s in sim.data_manager.stations if s["id"] not in player.unlocked_stations)
+    player.unlock_station(locked)
+    assert crafting.get_available_revision(player) == revision + 2
+    assert_matches_can_craft(crafting, player)
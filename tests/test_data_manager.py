@@ -0,0 +1,81 @@
+"""
+Tests du cache des tables de données
+"""
+
+from src.core.data_manager import DataManager
+
+
+def load(cache_file) -> DataManager:
+    data = DataManager()
+    data.cache_file = cache_file
+    data.load_all()
+    return data
+
+
+def test_cache_reused_when_unchanged(tmp_path):
+    cache_file = tmp_path / "data_tables.pickle"
+    assert not load(cache_file).loaded_from_cache
+    assert load(cache_file).loaded_from_cache
+
+
+def test_cache_invalidated_when_index_builder_changes(tmp_path, monkeypatch):
+    cache_file = tmp_path / "data_tables.pickle"
+    original = load(cache_file)
+
+    def _parse_tier(tier) -> int:
+        return int(str(tier).lstrip("tT"))
+
+    monkeypatch.setattr(DataManager, "_parse_tier", staticmethod(_parse_tier))
+    rebuilt = load(cache_file)
+
+    assert not rebuilt.loaded_from_cache
+    assert rebuilt._tier_numbers == original._tier_numbers
+
+
+def scan(rows, **fields):
+    """Recherche linéaire de référence (ordre du fichier)"""
+    return tuple(row for row in rows if all(row.get(key) == value for key, value in fields.items()))
+
+
+def test_secondary_indexes_match_linear_scan():
+    data = DataManager()
+    data.load_all()
+    assert data.items_base and data.recipes and data.nodes and data.enemies and data.zones
+
+    for tier in {item.get("tier") for item in data.items_base} | {"t99"}:
+        assert data.get_items_base_by_tier(tier) == scan(data.items_base, tier=tier)
+    for slot in {item.get("slot") for item in data.items_base} | {"inconnu"}:
+        assert data.get_items_base_by_slot(slot) == scan(data.items_base, slot=slot)
+        for tier in {item.get("tier") for item in data.items_base}:
+            assert data.get_items_base(slot, tier) == scan(data.items_base, slot=slot, tier=tier)
+
+    station_ids = [station["id"] for station in data.stations]
+    for station_id in station_ids:
+        assert data.get_recipes_by_station(station_id) == scan(data.recipes, station=station_id)
+    unlocked = station_ids[:2]
+    assert data.get_recipes_for_stations(unlocked) == [
+        recipe for recipe in data.recipes if not recipe.get("station") or recipe["station"] in unlocked]
+    for output_id in {o.get("item_base") or o.get("resource") for r in data.recipes for o in r.get("outputs", [])}:
+        assert data.get_recipes_by_output(output_id) == tuple(
+            recipe for recipe in data.recipes
+            if any(output_id in (o.get("item_base"), o.get("resource")) for o in recipe.get("outputs", [])))
+
+    for resource_id in {node.get("resource") for node in data.nodes}:
+        assert data.get_nodes_by_resource(resource_id) == scan(data.nodes, resource=resource_id)
+    for zone in data.zones:
+        assert data.get_nodes_by_zone(zone["id"]) == scan(data.nodes, zone=zone["id"])
+        assert data.get_zone_nodes(zone["id"]) == tuple(
+            node for node in data.nodes
+            if node.get("resource") in zone.get("resources", []) and node.get("tier") == zone["tier"])
+        # Ennemis listés par la zone (dernier ennemi du fichier pour un ID en double)
+        assert data.get_enemies_by_zone(zone["id"]) == tuple(
+            scan(data.enemies, id=enemy_id)[-1] for enemy_id in zone.get("enemies", [])
+            if scan(data.enemies, id=enemy_id))
+    for tier in {enemy.get("tier") for enemy in data.enemies}:
+        assert data.get_enemies_by_tier(tier) == scan(data.enemies, tier=tier)
+
+    for skill in data.skills:
+        assert data.get_skill(skill["id"]) == scan(data.skills, id=skill["id"])[-1]
+    for upgrade in data.station_upgrades:
+        assert data.get_station_upgrade(upgrade["station_id"]) == scan(
+            data.station_upgrades, station_id=upgrade["station_id"])[-1]
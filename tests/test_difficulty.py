@@ -0,0 +1,39 @@
+"""
+Tests des réglages de difficulté (table des coûts de recettes)
+"""
+
+from src.core.difficulty import DifficultySettings
+from src.core.simulation import Simulation
+
+RECIPE = {"id": "recette_test", "gold_cost": 100, "inputs": [{"resource": "bois", "qty": 10}]}
+
+
+def test_multiplier_change_resets_costs():
+    difficulty = DifficultySettings(crafting_gold_mult=1.0, crafting_resource_mult=1.0)
+    assert difficulty.recipe_cost(RECIPE) == (100, (("bois", 10),))
+    version = difficulty.cost_version
+
+    difficulty.set_crafting_multipliers(gold_mult=2.0)
+    assert difficulty.cost_version == version + 1
+    assert difficulty.recipe_cost(RECIPE) == (200, (("bois", 10),))
+
+    difficulty.set_crafting_multipliers(resource_mult=1.5)
+    assert difficulty.recipe_cost(RECIPE) == (200, (("bois", 15),))
+
+
+def test_cache_not_part_of_equality():
+    difficulty = DifficultySettings()
+    difficulty.recipe_cost(RECIPE)
+    assert difficulty == DifficultySettings()
+    assert "_recipe_costs" not in repr(difficulty)
+
+
+def test_multiplier_change_rebuilds_available_recipes():
+    sim = Simulation(seed=3)
+    crafting, player = sim.crafting_system, sim.player
+    revision = crafting.get_available_revision(player)
+
+    sim.difficulty.set_crafting_multipliers(gold_mult=0.0, resource_mult=0.0)
+    assert crafting.get_available_revision(player) == revision + 1
+    for entry in crafting.get_available_recipes(player):
+        assert entry["can_craft"] == crafting.can_craft(entry["recipe"]["id"], player)[0]
@@ -0,0 +1,94 @@
+"""
+Tests de la génération d'items (ItemGenerator)
+"""
+
+import random
+import uuid
+
+import pytest
+
+from src.core.data_manager import DataManager
+from src.systems.item_system import ItemGenerator, POWER_SCORE_WEIGHTS
+
+
+@pytest.fixture(scope="module")
+def data_manager():
+    data = DataManager()
+    data.load_all()
+    return data
+
+
+@pytest.fixture
+def generator(data_manager):
+    random.seed(5)
+    return ItemGenerator(data_manager)
+
+
+def expected_power_score(item, data_manager) -> float:
+    """Power score recalculé depuis les stats totales de l'item"""
+    total = item.get_total_stats()
+    score = sum(total.get_stat(stat) * weight for stat, weight in POWER_SCORE_WEIGHTS.items())
+    return score + data_manager.get_tier(item.tier).get("base_power", 10)
+
+
+def test_generate_item_matches_batch_rules(generator, data_manager):
+    base_ids = [base["id"] for base in data_manager.get_items_base_by_tier("t1")]
+    for base_id in base_ids * 20:
+        item = generator.generate_item(base_id, force_set="set_test")
+        rarity = data_manager.get_rarity(item.rarity_id)
+
+        assert item.base_id == base_id
+        assert item.set_id == "set_test"
+        assert item.name.endswith(data_manager.get_item_base(base_id)["name"])
+        assert item.power_score == pytest.approx(expected_power_score(item, data_manager))
+        if "max_affixes" in rarity:
+            assert len({affix["affix_id"] for affix in item.affixes}) <= rarity["max_affixes"]
+
+
+def test_generate_item_unknown_base(generator):
+    with pytest.raises(ValueError):
+        generator.generate_item("base_inexistante")
+
+
+def test_reroll_affixes_keeps_item(generator, data_manager):
+    base_id = data_manager.get_items_base_by_tier("t1")[0]["id"]
+    item = generator.generate_items(base_id, 1, rarity_id="rare")[0]
+    affixes = item.affixes
+
+    generator.reroll_affixes(item)
+
+    assert item.affixes is affixes  # Modifiés en place
+    assert item.rarity_id == "rare"
+    assert all(affix["name"] for affix in item.affixes)
+
+
+def test_batch_ids_are_unique_uuids(generator, data_manager):
+    base_id = data_manager.get_items_base_by_tier("t1")[0]["id"]
+    items = generator.generate_items(base_id, 500)
+
+    ids = [item.id for item in items]
+    assert len(set(ids)) == len(ids)
+    assert all(str(uuid.UUID(item_id)) == item_id for item_id in ids)
+
+
+def test_columnar_matches_item_rules(generator, data_manager):
+    np = pytest.importorskip("numpy")
+    base_ids = [base["id"] for base in data_manager.get_items_base_by_tier("t1")]
+
+    columns = generator.generate_items(base_ids, 20000, rarity_id="rare", quality_id="q2", columnar=True)
+    items = generator.generate_items(base_ids, 20000, rarity_id="rare", quality_id="q2")
+
+    # Power score: même somme pondérée que pour un Item
+    expected = np.zeros(columns["count"])
+    for stats in (columns["base_stats"], columns["affix_stats"]):
+        for stat, values in stats.items():
+            expected += POWER_SCORE_WEIGHTS.get(stat, 0.0) * values
+    for base_id in set(base_ids):
+        plan = generator._get_base_plan(base_id)
+        expected[columns["base_id"] == base_id] += plan["default_score"] + plan["base_power"]
+    assert columns["power_score"] == pytest.approx(expected)
+
+    # Mêmes distributions que le chemin Item
+    assert columns["power_score"].mean() == pytest.approx(np.mean([i.power_score for i in items]), rel=0.02)
+    assert columns["affix_count"].mean() == pytest.approx(np.mean([len({a["affix_id"] for a in i.affixes}) for i in items]), rel=0.02)
+    assert set(columns["gold_value"]) == {item.gold_value for item in items}
@@ -0,0 +1,77 @@
+"""
+Recoupement du simulateur Monte Carlo avec CombatSystem
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.core.simulation import Simulation
+from src.systems.monte_carlo import MonteCarloCombat
+from src.systems.stats_system import StatsContainer
+
+# Stats sans aléa (ni esquive, ni critique, ni blocage, ni procs): un combat
+# a une seule issue possible, que les deux simulateurs doivent trouver
+NO_RANDOM = {"crit_chance": 0.0, "esquive": 0.0, "blocage": 0.0, "precision": 0.0}
+
+
+def make_stats(**values) -> StatsContainer:
+    stats = StatsContainer()
+    for name, value in {**NO_RANDOM, **values}.items():
+        setattr(stats, name, value)
+    return stats
+
+
+def run_combat_system(player_values, enemy_values, seed: int = 11):
+    """Issue d'un combat CombatSystem: ("win" | "loss", durée)"""
+    sim = Simulation(seed=seed, timestep=0.05)
+    combat = sim.combat_system
+    combat.auto_respawn = False
+
+    player = sim.player
+    for slot in player.equipment:
+        player.equipment[slot] = None
+    player.base_stats = make_stats(**player_values)
+    player.invalidate_stats()
+
+    combat.current_enemy.stats = make_stats(**enemy_values)
+    combat.current_fight_time = 0.0
+    combat._schedule_first_attacks(player)
+
+    for _ in range(2000):
+        result = combat.update(0.05, player)
+        if result["player_dead"]:
+            return "loss", combat.current_fight_time
+        if result["enemy_dead"]:
+            return "win", combat.current_fight_time
+    return "timeout", combat.current_fight_time
+
+
+FIGHTS = [
+    # Coups mortels simultanés: le joueur frappe d'abord, l'ennemi ne riposte pas
+    ({"hp_max": 10, "hp_current": 10, "atk": 10},
+     {"hp_max": 10, "hp_current": 10, "atk": 10}),
+    # Ennemi plus rapide
+    ({"hp_max": 25, "hp_current": 25, "atk": 5},
+     {"hp_max": 10, "hp_current": 10, "atk": 10, "vitesse_attaque": 2.0}),
+    # Victoire par les épines
+    ({"hp_max": 100, "hp_current": 100, "atk": 1, "vitesse_attaque": 0.5, "epines": 10},
+     {"hp_max": 20, "hp_current": 20, "atk": 1}),
+    # Régénération entre les coups
+    ({"hp_max": 20, "hp_current": 20, "atk": 4, "hp_regen": 2.0},
+     {"hp_max": 30, "hp_current": 30, "atk": 6}),
+]
+
+
+@pytest.mark.parametrize("player_values, enemy_values", FIGHTS)
+def test_fights_match_combat_system(player_values, enemy_values):
+    expected, duration = run_combat_system(player_values, enemy_values)
+
+    report = MonteCarloCombat(seed=3).simulate_fights(
+        make_stats(**player_values), make_stats(**enemy_values), 50)
+
+    if expected == "win":
+        assert report["win_rate"] == 1.0
+        assert report["ttk_mean"] == pytest.approx(duration)
+    else:
+        assert report["loss_rate"] == 1.0
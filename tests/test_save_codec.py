@@ -0,0 +1,41 @@
+"""
+Tests du codec de sauvegarde binaire
+"""
+
+import pytest
+
+from src.systems.stats_system import StatsContainer, STAT_NAMES
+from src.utils import save_codec
+
+
+def make_save() -> dict:
+    stats = StatsContainer()
+    stats.atk = 42.0
+    stats.crit_chance = 7.5
+    stats.hp_current = 12.25
+    return {
+        "version": "1.0",
+        "player": {"level": 3, "base_stats": stats.to_dict(), "buffs": []},
+        "items": [{"id": "0b4c6e0e-64a8-4f3e-9a52-8f1c2b3d4e5f", "affixes": [], "power": 1.5}],
+    }
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_roundtrip(compression):
+    save = make_save()
+    assert save_codec.decode(save_codec.encode(save, compression)) == save
+
+
+def test_stats_survive_stat_reorder(monkeypatch):
+    """Les stats sont repérées par nom: un autre ordre de STAT_NAMES ne les mélange pas"""
+    save = make_save()
+    raw = save_codec.encode(save, "none")
+
+    reordered = tuple(reversed(STAT_NAMES))
+    defaults = save_codec._STAT_DEFAULTS
+    monkeypatch.setattr(save_codec, "STAT_NAMES", reordered)
+    monkeypatch.setattr(save_codec, "_STAT_DEFAULTS", {name: defaults[name] for name in reordered})
+
+    decoded = save_codec.decode(raw)["player"]["base_stats"]
+    assert decoded == save["player"]["base_stats"]
+
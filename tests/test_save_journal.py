@@ -0,0 +1,62 @@
+"""
+Tests de récupération après crash par le journal de sauvegarde
+"""
+
+import pytest
+
+from src.core.data_manager import DataManager
+from src.entities.player import Player
+from src.utils.save_system import SaveSystem
+
+
+@pytest.fixture
+def data_manager():
+    data = DataManager()
+    data.load_all()
+    return data
+
+
+@pytest.fixture
+def save_system(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # SaveSystem écrit dans ./saves
+    return SaveSystem()
+
+
+def test_journal_recovers_buffs(save_system, data_manager):
+    player = Player(data_manager)
+    assert save_system.save_game(player)
+
+    # Changements après le snapshot, journalisés mais jamais sauvegardés
+    player.gold += 25
+    player.buffs.append({"type": "atk", "value": 5, "duration": 60, "remaining": 42.0})
+    player.invalidate_stats()
+    assert save_system.append_journal(player) > 0
+
+    # "Crash": rechargement depuis le snapshot et le journal
+    restored = SaveSystem().load_game(data_manager)
+
+    assert restored is not None
+    assert restored.gold == player.gold
+    assert restored.buffs == player.buffs
+
+
+def test_journal_recovers_playtime(save_system, data_manager):
+    player = Player(data_manager)
+    player.playtime = 100.0
+    assert save_system.save_game(player)
+
+    player.playtime = 137.5
+    assert save_system.append_journal(player) > 0
+
+    assert SaveSystem().load_game(data_manager).playtime == 137.5
+
+
+def test_journal_records_expired_buffs(save_system, data_manager):
+    player = Player(data_manager)
+    player.buffs.append({"type": "atk", "value": 5, "duration": 60, "remaining": 1.0})
+    assert save_system.save_game(player)
+
+    player.update_buffs(2.0)
+    save_system.append_journal(player)
+
+    assert SaveSystem().load_game(data_manager).buffs == []
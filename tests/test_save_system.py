@@ -0,0 +1,124 @@
+"""
+Tests de l'écriture des sauvegardes (atomique, arrière-plan)
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.core.data_manager import DataManager
+from src.entities.player import Player
+from src.utils.save_system import SaveSystem
+
+
+@pytest.fixture
+def data_manager():
+    data = DataManager()
+    data.load_all()
+    return data
+
+
+@pytest.fixture
+def save_system(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # SaveSystem écrit dans ./saves
+    return SaveSystem()
+
+
+def test_write_is_atomic(data_manager, save_system, monkeypatch):
+    player = Player(data_manager)
+    player.gold = 10
+    assert save_system.save_game(player)
+
+    # Crash pendant l'écriture: l'ancienne sauvegarde reste intacte
+    def failing_fsync(fd):
+        raise OSError("disque plein")
+
+    player.gold = 20
+    with monkeypatch.context() as patch:
+        patch.setattr("src.utils.save_system.os.fsync", failing_fsync)
+        assert not save_system.save_game(player)
+
+    assert SaveSystem().load_game(data_manager).gold == 10
+
+    player.gold = 30
+    assert save_system.save_game(player)
+    assert not list(save_system.save_dir.glob("*.tmp"))
+    assert SaveSystem().load_game(data_manager).gold == 30
+
+
+def test_sync_save_after_async_keeps_newest(data_manager, save_system, monkeypatch):
+    # Écriture auto lente: la sauvegarde manuelle arrive pendant qu'elle est en cours
+    write = save_system._write_save_data
+    started = threading.Event()
+
+    def slow_write(save_data):
+        if threading.current_thread().name == "autosave":
+            started.set()
+            time.sleep(0.2)
+        write(save_data)
+
+    monkeypatch.setattr(save_system, "_write_save_data", slow_write)
+
+    player = Player(data_manager)
+    player.gold = 1
+    save_system.save_game_async(player)
+    assert started.wait(5)
+
+    player.gold = 2
+    assert save_system.save_game(player)
+    assert save_system.flush(5)
+
+    assert SaveSystem().load_game(data_manager).gold == 2
+    assert save_system._written_journal_id == save_system.journal.base_id
+
+
+def test_sync_save_cancels_queued_autosave(data_manager, save_system):
+    player = Player(data_manager)
+    player.gold = 1
+    with save_system._pending_cond:  # Le thread d'écriture ne peut pas encore prendre le snapshot
+        save_system.save_game_async(player)
+    save_system._cancel_pending()
+    assert save_system._pending is None
+
+    player.gold = 2
+    assert save_system.save_game(player)
+    assert save_system.flush(5)
+    assert SaveSystem().load_game(data_manager).gold == 2
+
+
+def test_format_switch_keeps_backup(data_manager, save_system):
+    player = Player(data_manager)
+    player.gold = 10
+    assert save_system.save_game(player)
+
+    binary = SaveSystem(save_format="binary")
+    player.gold = 20
+    assert binary.save_game(player)
+
+    # Le JSON n'est plus rechargé mais reste disponible en secours
+    assert not save_system.json_file.exists()
+    backup = save_system.save_dir / "savegame.json.bak"
+    assert backup.exists()
+    assert SaveSystem().load_game(data_manager).gold == 20
+    assert [entry["slot"] for entry in binary.list_slots()] == ["savegame"]
+
+
+def test_slot_index_rebuilt_after_stale_mtime(data_manager, save_system):
+    player = Player(data_manager)
+    player.level = 3
+    assert save_system.save_game(player)
+    assert save_system.list_slots()[0]["level"] == 3
+
+    # Sauvegarde réécrite sans mise à jour de l'index (crash entre les deux)
+    index = save_system.index_file.read_bytes()
+    player.level = 7
+    player.playtime = 42.0
+    assert save_system.save_game(player)
+    save_system.index_file.write_bytes(index)
+
+    slots = SaveSystem().list_slots()
+    assert len(slots) == 1
+    assert slots[0]["level"] == 7
+    assert slots[0]["playtime"] == 42.0
+    assert slots[0]["mtime_ns"] == save_system.save_file.stat().st_mtime_ns
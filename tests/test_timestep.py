@@ -0,0 +1,43 @@
+"""
+Tests de l'accumulateur à pas fixe
+"""
+
+import random
+
+import pytest
+
+from src.core.timestep import FixedTimestep
+
+
+def test_step_count_independent_of_frame_rate():
+    steady = FixedTimestep(hz=20)
+    jittery = FixedTimestep(hz=20)
+    rng = random.Random(4)
+
+    for _ in range(144 * 60):
+        steady.advance(1.0 / 144)
+    elapsed = 0.0
+    while elapsed < 60.0:
+        frame = min(rng.uniform(0.005, 0.09), 60.0 - elapsed)
+        jittery.advance(frame)
+        elapsed += frame
+
+    assert abs(steady.total_steps - jittery.total_steps) <= 1
+    assert steady.total_steps == pytest.approx(1200, abs=1)
+
+
+def test_long_frame_is_capped_and_counted():
+    clock = FixedTimestep(hz=20, max_steps=5)
+    assert clock.advance(1.0) == 5
+    assert clock.dropped_time == pytest.approx(0.75)
+
+
+def test_catch_up_consumes_without_dropping():
+    clock = FixedTimestep(hz=20, max_steps=5)
+    clock.add_time(1.0)
+    assert clock.consume(12) == 12
+    clock.consume(12)
+    # Rien n'est abandonné: le reste éventuel attend dans l'accumulateur
+    assert clock.total_steps * clock.timestep + clock.backlog == pytest.approx(1.0)
+    assert clock.dropped_time == 0.0
+    assert 0.0 <= clock.alpha < 1.0